@@ -3,7 +3,7 @@
 This module defines CLI commands for creating PDF files and PDF content.
 
 It exposes the `create` command group for blank PDFs, extracted page ranges,
-merged PDFs, form fields, raw drawn elements, annotations, and coordinate grid
+split PDFs, merged PDFs, form fields, raw drawn elements, annotations, and coordinate grid
 views. Commands in this module translate command-line arguments or grouped
 YAML/JSON input into `PdfWrapper`, `BlankPage`, `Fields`, `RawElements`, and
 `Annotations` operations.
@@ -152,6 +152,100 @@ def extract(
     PdfWrapper(str(pdf), **ctx.obj).pages[slice((start or 1) - 1, end)].write(output)
 
 
+@create_cli.command(
+    no_args_is_help=True,
+    help="Split a PDF into multiple PDFs.",
+)
+def split(
+    ctx: typer.Context,
+    pdf: INPUT_PDF,
+    output: Annotated[
+        str,
+        typer.Option(
+            "--output",
+            "-o",
+            help=(
+                "Output path pattern, formatted with {index}, {start}, and {end}, "
+                "e.g. part_{index}.pdf."
+            ),
+        ),
+    ],
+    pages: Annotated[
+        int,
+        typer.Option(
+            "--pages",
+            "-n",
+            min=1,
+            help="Number of pages per part.",
+        ),
+    ] = None,
+    ranges: Annotated[
+        list[str],
+        typer.Option(
+            "--range",
+            "-r",
+            help="Page range of a part, e.g. 1-3 or 5. Repeat for multiple parts.",
+        ),
+    ] = None,
+) -> None:
+    """
+    Split a PDF into parts and write each part to its own file.
+
+    Exactly one of `--pages` and `--range` must be supplied. Ranges use 1-based
+    page numbers, either as a single page or as `START-END`. Each part is
+    written as soon as it is extracted, so memory use does not grow with the
+    number of parts.
+
+    Args:
+        ctx (typer.Context): Typer context containing global `PdfWrapper`
+            options in `ctx.obj`.
+        pdf (Path): Input PDF path.
+        output (str): Output path pattern of the parts.
+        pages (int, optional): Number of pages per part. Defaults to None.
+        ranges (list[str], optional): Page ranges of the parts. Defaults to
+            None.
+
+    Raises:
+        typer.BadParameter: Raised when not exactly one split option is
+            supplied, when a page range is malformed or out of bounds, or when
+            the output pattern gives two parts the same path.
+    """
+    if (pages is None) == (not ranges):
+        cli_bad_parameter(
+            "Supply exactly one of --pages or --range.",
+            param_hint="--pages",
+        )
+
+    by = pages
+    if ranges:
+        by = []
+        for each in ranges:
+            start, _, end = each.partition("-")
+            try:
+                part = range(int(start), int(end or start) + 1)
+            except ValueError as e:
+                cli_bad_parameter(
+                    f"Invalid page range: {each}.", param_hint="--range", cause=e
+                )
+            if not part:
+                cli_bad_parameter(
+                    "End page must be greater than or equal to start page.",
+                    param_hint="--range",
+                )
+            by.append(part)
+
+    try:
+        PdfWrapper(str(pdf), **ctx.obj).split(by, output)
+    except IndexError as e:
+        cli_bad_parameter("Page range out of bounds.", param_hint="--range", cause=e)
+    except ValueError as e:
+        cli_bad_parameter(
+            "Output path pattern must give each part its own path.",
+            param_hint="--output",
+            cause=e,
+        )
+
+
 @create_cli.command(
     no_args_is_help=True,
     help="Merge multiple PDFs into one.",
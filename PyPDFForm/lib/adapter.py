@@ -10,6 +10,9 @@ forms. The module ensures that the input is properly converted into a byte
 stream before further processing.
 """
 
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BufferedReader, BytesIO, RawIOBase
+from mmap import ACCESS_READ, mmap
+from os import PathLike, fstat
 from os.path import isfile
 from typing import Any, BinaryIO
 
@@ -31,8 +34,171 @@ def readable(obj: Any) -> bool:
     return callable(getattr(obj, "read", None))
 
 
+class _BufferIO(RawIOBase):
+    """
+    A read-only file object over a buffer, which reads the buffer in place.
+    """
+
+    def __init__(self, buffer: memoryview) -> None:
+        """
+        Opens a buffer for reading.
+
+        Args:
+            buffer (memoryview): The buffer to read.
+        """
+        super().__init__()
+
+        self.buffer = buffer
+        self.position = 0
+
+    def readable(self) -> bool:
+        """
+        Tells whether the file object can be read.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def seekable(self) -> bool:
+        """
+        Tells whether the current position can be moved.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """
+        Reads bytes from the current position into a writable buffer.
+
+        Args:
+            buffer (Any): The buffer to read into.
+
+        Returns:
+            int: The number of bytes read.
+        """
+        data = self.buffer[self.position : self.position + len(buffer)]
+        buffer[: len(data)] = data
+        self.position += len(data)
+
+        return len(data)
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        """
+        Moves the current position.
+
+        Args:
+            offset (int): The offset to move by.
+            whence (int): What the offset is relative to, like for `io.IOBase.seek`.
+
+        Returns:
+            int: The new position.
+        """
+        base = {SEEK_SET: 0, SEEK_CUR: self.position, SEEK_END: len(self.buffer)}
+        self.position = max(0, base[whence] + offset)
+
+        return self.position
+
+    def tell(self) -> int:
+        """
+        Gets the current position.
+
+        Returns:
+            int: The current position.
+        """
+        return self.position
+
+
+def stream_to_f_obj(stream: bytes | memoryview) -> BinaryIO:
+    """
+    Opens a byte stream as a file object for parsing.
+
+    Bytes are opened with a `BytesIO`, which shares their memory. Other buffers,
+    such as the memory maps of streams spilled to disk, are read in place
+    instead of being copied into a `BytesIO` first.
+
+    Args:
+        stream (bytes | memoryview): The byte stream to open.
+
+    Returns:
+        BinaryIO: A readable and seekable file object of the stream.
+    """
+    if isinstance(stream, bytes):
+        return BytesIO(stream)
+
+    return BufferedReader(_BufferIO(memoryview(stream)))
+
+
+def fp_or_f_obj_or_stream_to_buffer(
+    fp_or_f_obj_or_stream: bytes
+    | bytearray
+    | memoryview
+    | mmap
+    | str
+    | PathLike
+    | BinaryIO,
+) -> bytes | memoryview:
+    """
+    Adapt a file path, file object, or stream to a byte stream or a view of one.
+
+    This function accepts the same inputs as `fp_or_f_obj_or_stream_to_stream`,
+    but does not copy paths and buffers into bytes. Bytes are returned as is,
+    and a memoryview spanning a whole bytes object returns that object. Other
+    buffers, such as an `mmap` of a large template, are returned as a byte view
+    of the whole buffer, regardless of the current position of the map. Files
+    are memory-mapped and returned as a read-only view of the map, so their
+    content is read in place by whoever consumes the view. File objects are
+    read in a single call.
+
+    Args:
+        fp_or_f_obj_or_stream (bytes | bytearray | memoryview | mmap | str | PathLike | BinaryIO):
+            The input to adapt. It can be a byte stream, a bytes-like buffer,
+            a file path, or a file object.
+
+    Returns:
+        bytes | memoryview: The byte stream of the input, or a view of it.
+            Returns an empty byte string if the file path does not exist.
+    """
+    # not cached to handle writing to the same disk file
+    result = b""
+    if isinstance(fp_or_f_obj_or_stream, bytes):
+        result = fp_or_f_obj_or_stream
+
+    elif isinstance(fp_or_f_obj_or_stream, (bytearray, memoryview, mmap)):
+        view = memoryview(fp_or_f_obj_or_stream)
+        if (
+            isinstance(view.obj, bytes)
+            and view.contiguous
+            and view.nbytes == len(view.obj)
+        ):
+            result = view.obj
+        elif view.c_contiguous:
+            result = view.cast("B")
+        else:
+            result = view.tobytes()
+
+    elif readable(fp_or_f_obj_or_stream):
+        result = fp_or_f_obj_or_stream.read()
+
+    elif isinstance(fp_or_f_obj_or_stream, (str, PathLike)) and isfile(
+        fp_or_f_obj_or_stream
+    ):
+        with open(fp_or_f_obj_or_stream, "rb") as _file:
+            if fstat(_file.fileno()).st_size:
+                result = memoryview(mmap(_file.fileno(), 0, access=ACCESS_READ))
+    return result
+
+
 def fp_or_f_obj_or_stream_to_stream(
-    fp_or_f_obj_or_stream: bytes | str | BinaryIO,
+    fp_or_f_obj_or_stream: bytes
+    | bytearray
+    | memoryview
+    | mmap
+    | str
+    | PathLike
+    | BinaryIO,
 ) -> bytes:
     """
     Adapt a file path, file object, or stream to a byte stream.
@@ -40,30 +206,30 @@ def fp_or_f_obj_or_stream_to_stream(
     This function takes a file path, a file object, or a byte stream and adapts it to a consistent byte stream.
     It handles different input types, including:
         - byte streams (bytes)
-        - file paths (str)
+        - bytes-like buffers (bytearray, memoryview, mmap)
+        - file paths (str or os.PathLike)
         - file-like objects with a read() method (BinaryIO)
-    Unsupported inputs and string paths that do not point to files are treated
+    Unsupported inputs and paths that do not point to files are treated
     as empty input and return ``b""``.
 
+    Bytes are returned as is, and a memoryview spanning a whole bytes object
+    returns that object, so neither is copied. Other buffers and files are
+    copied exactly once from the view `fp_or_f_obj_or_stream_to_buffer` gives.
+
     Args:
-        fp_or_f_obj_or_stream (bytes | str | BinaryIO): The input to adapt.
-            It can be a byte stream, a file path (string), or a file object.
+        fp_or_f_obj_or_stream (bytes | bytearray | memoryview | mmap | str | PathLike | BinaryIO):
+            The input to adapt. It can be a byte stream, a bytes-like buffer,
+            a file path, or a file object.
 
     Returns:
         bytes: The byte stream representation of the input.
                Returns an empty byte string if the file path does not exist.
     """
-    # not cached to handle writing to the same disk file
-    result = b""
-    if isinstance(fp_or_f_obj_or_stream, bytes):
-        result = fp_or_f_obj_or_stream
+    result = fp_or_f_obj_or_stream_to_buffer(fp_or_f_obj_or_stream)
+    if isinstance(result, memoryview):
+        with result:
+            return result.tobytes()
 
-    elif readable(fp_or_f_obj_or_stream):
-        result = fp_or_f_obj_or_stream.read()
-
-    elif isinstance(fp_or_f_obj_or_stream, str) and isfile(fp_or_f_obj_or_stream):
-        with open(fp_or_f_obj_or_stream, "rb") as _file:
-            result = _file.read()
     return result
 
 
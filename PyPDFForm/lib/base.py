@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+"""
+A module for the state and stream handling shared by `PdfWrapper` and its mixins.
+
+`WrapperBase` keeps the PDF stream of a wrapper, spilling it to disk when it is
+large, together with the widgets built from it and the widget hooks and
+document-level edits waiting to be applied to it. It also provides batching of
+document-level edits and forking of wrappers that share their document and
+widgets copy-on-write. The mixins in `split` and `fields` build on it, and
+`PdfWrapper` combines them.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from copy import copy, deepcopy
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar
+
+from .constants import Title
+from .font import get_all_available_fonts
+from .hooks import trigger_widget_hooks
+from .incremental import UpdateReader, open_for_update, save_update
+from .middleware.dropdown import Dropdown
+from .middleware.text import Text
+from .spill import SpilledStream, spill_stream
+from .template import build_widgets, get_title, update_metadata
+from .types import SharedWidgets
+from .utils import get_version, set_version
+
+if TYPE_CHECKING:
+    from pypdf import PdfWriter
+
+WrapperT = TypeVar("WrapperT", bound="WrapperBase")
+
+
+class WrapperBase:
+    """
+    A base class holding the PDF stream and widgets of a `PdfWrapper`.
+
+    The user-configurable parameters in `PdfWrapper.USER_PARAMS` are set on the
+    instance by `PdfWrapper` and read here with `getattr`.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty PDF stream and the internal state kept alongside it.
+        """
+
+        super().__init__()
+        self._stored_stream = b""
+        self.widgets = {}
+
+        self._version = None
+        self._document_edits = []  # for batching document-level edits
+        self._pending_version = None  # for batching version changes
+        self._batch_depth = 0
+        self._available_fonts = {}  # for setting /F1
+        self._available_fonts_loaded = None  # for lazy loading fonts
+        self._font_register_events = []  # for reregister
+        self._key_update_tracker = {}  # for update key preserve old key attrs
+        self._keys_to_update = []  # for bulk update keys
+
+    def _init_helper(self) -> None:
+        """
+        Helper method to initialize widgets.
+
+        This method is called during initialization and after certain operations
+        that modify the PDF content (e.g., filling, creating widgets, updating keys).
+        It rebuilds the widget dictionary and invalidates the lazily loaded font cache.
+        """
+
+        self._available_fonts_loaded = False
+        stream = self._read()
+        new_widgets = (
+            build_widgets(
+                stream,
+                getattr(self, "use_full_widget_name"),
+            )
+            if stream
+            else {}
+        )
+        # ensure old widgets don't get overwritten
+        for k, v in self.widgets.items():
+            if k in new_widgets:
+                # the rebuilt widget reflects what the PDF now holds
+                v.pdf_state.clear()
+                v.pdf_state.update(new_widgets[k].pdf_state)
+                new_widgets[k] = v
+
+        # update key preserve old key attrs
+        for k, v in new_widgets.items():
+            if k in self._key_update_tracker:
+                old_widget = self.widgets[self._key_update_tracker[k]]
+                for name in old_widget.attr_set_tracker:
+                    setattr(v, name, getattr(old_widget, name, None))
+        self._key_update_tracker = {}
+
+        self.widgets = new_widgets
+
+    def _ensure_available_fonts_loaded(self) -> dict:
+        """
+        Loads AcroForm fonts from the PDF stream the first time they are needed.
+
+        Custom fonts registered through `register_font` are stored in the same
+        mapping, so loading updates the existing dictionary instead of replacing it.
+
+        Returns:
+            dict: A mapping from font names to internal PDF font identifiers.
+        """
+
+        if not self._available_fonts_loaded:
+            if self._stream:
+                self._available_fonts.update(**get_all_available_fonts(self._stream))
+            self._available_fonts_loaded = True
+
+        return self._available_fonts
+
+    def _widget_view(self) -> dict:
+        """
+        Returns the widgets for reading only.
+
+        Unlike looking widgets up through `widgets`, this does not copy the
+        widgets shared with forks, so the returned widgets must not be changed.
+
+        Returns:
+            dict: A mapping from widget keys to widget objects.
+        """
+
+        return dict(dict.items(self.widgets))
+
+    @property
+    def _stream(self) -> bytes | memoryview:
+        """
+        Gets the PDF stream, reading it back from disk if it was spilled.
+
+        Returns:
+            bytes | memoryview: The PDF stream, or a read-only view of its file
+                if it was spilled.
+        """
+
+        if isinstance(self._stored_stream, SpilledStream):
+            return self._stored_stream.read()
+
+        return self._stored_stream
+
+    @_stream.setter
+    def _stream(self, value: bytes | memoryview) -> None:
+        """
+        Stores the PDF stream, spilling it to `spill_dir` when it is larger than
+        `max_memory`.
+
+        Args:
+            value (bytes | memoryview): The new PDF stream, or a view of it,
+                such as a memory map of the template file, which is copied
+                into memory or straight into the spilled file.
+        """
+
+        self._stored_stream = spill_stream(
+            value, getattr(self, "spill_dir", None), getattr(self, "max_memory", None)
+        )
+
+    def _read(self) -> bytes | memoryview:
+        """
+        Reads the PDF stream, triggering widget hooks and updating fonts if necessary.
+
+        This internal method executes queued widget hooks. When a pending font hook
+        exists, user-facing registered font names are mapped to their internal PDF
+        resource names before hooks are applied. Applying hooks updates the wrapper's
+        stored stream and clears each widget's hook queue.
+
+        Document-level edits queued within `batch` are applied first.
+
+        Returns:
+            bytes | memoryview: The raw PDF stream, or a read-only view of its
+                file if it was spilled.
+        """
+
+        self._apply_document_edits()
+        widgets_with_hooks = [
+            widget for widget in self._widget_view().values() if widget.hooks_to_trigger
+        ]
+
+        if widgets_with_hooks:
+            has_font_hook = any(
+                hook[0] == "update_text_field_font"
+                for widget in widgets_with_hooks
+                for hook in widget.hooks_to_trigger
+            )
+
+            if has_font_hook:
+                available_fonts = self._ensure_available_fonts_loaded()
+                for key, widget in self._widget_view().items():
+                    if (
+                        isinstance(widget, (Text, Dropdown))
+                        and widget.font not in available_fonts.values()
+                        and widget.font in available_fonts
+                    ):
+                        # from `new_font` to `/F1`
+                        self.widgets[key].font = available_fonts.get(widget.font)
+
+            self._stream = trigger_widget_hooks(
+                self._stream,
+                {
+                    key: widget
+                    for key, widget in self._widget_view().items()
+                    if widget.hooks_to_trigger
+                },
+                getattr(self, "use_full_widget_name"),
+            )
+
+        return self._stream
+
+    @property
+    def title(self) -> str | None:
+        """
+        Gets the title stored in the PDF's document metadata.
+
+        The title is read lazily from the current PDF stream. Metadata extraction
+        is cached for each distinct stream.
+
+        Returns:
+            str | None: The current document title, or None when no title exists.
+        """
+
+        result = get_title(self._read())
+        return str(result) if result is not None else None
+
+    @title.setter
+    def title(self, value: str | None) -> None:
+        """
+        Updates the title stored in the PDF's document metadata.
+
+        A non-None value is written to the underlying PDF stream immediately,
+        or queued until the edits are applied within `batch`. None is ignored so
+        the current title is preserved.
+
+        Args:
+            value (str | None): The new document title, or None to preserve the
+                current title.
+        """
+
+        if value is not None:
+            self._queue_document_edit(partial(update_metadata, metadata={Title: value}))
+
+    @contextmanager
+    def batch(self: WrapperT) -> Iterator[WrapperT]:
+        """
+        Defers document-level edits so they are saved in a single write.
+
+        Within the context, setting `title` or `on_open_javascript`, calling
+        `change_version`, and registering fonts only queue their edits. The queued
+        edits are applied together when the outermost context exits, or earlier
+        when the PDF stream is read, for example by accessing a property that
+        reads it or by calling `read`.
+
+        Yields:
+            PdfWrapper: The `PdfWrapper` object.
+        """
+
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._apply_document_edits()
+
+    def _queue_document_edit(
+        self, edit: Callable[[UpdateReader | PdfWriter], Any]
+    ) -> None:
+        """
+        Queues a document-level edit, applying it immediately outside of `batch`.
+
+        Args:
+            edit (Callable[[UpdateReader | PdfWriter], Any]): The edit, called
+                with the PDF opened by `open_for_update`.
+        """
+
+        self._document_edits.append(edit)
+        if not self._batch_depth:
+            self._apply_document_edits()
+
+    def _apply_document_edits(self) -> None:
+        """
+        Applies the queued document-level edits and version change.
+
+        The queued edits are made through a single `open_for_update` and saved
+        with a single `save_update`, after which the pending version, if any,
+        is set on the resulting stream.
+        """
+
+        edits, self._document_edits = self._document_edits, []
+        version, self._pending_version = self._pending_version, None
+
+        if edits:
+            stream = self._stream
+            out = open_for_update(stream)
+            for edit in edits:
+                edit(out)
+            self._stream = save_update(stream, out)
+
+        if version is not None:
+            self._set_version(version)
+
+    def change_version(self: WrapperT, version: str) -> WrapperT:
+        """
+        Changes the PDF version of the underlying document.
+
+        The method replaces the first PDF header version marker in the current stream
+        and updates the cached version used by later egress processing. It does not
+        otherwise validate or rewrite the document for version-specific compatibility.
+        Within `batch`, the change is deferred until the edits are applied.
+
+        Args:
+            version (str): The new PDF version string (e.g., "1.7").
+
+        Returns:
+            PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
+        """
+
+        if self._batch_depth:
+            self._pending_version = version
+        else:
+            self._read()
+            self._set_version(version)
+
+        return self
+
+    def _set_version(self, version: str) -> None:
+        """
+        Replaces the PDF header version of the stored stream.
+
+        Args:
+            version (str): The new PDF version string.
+        """
+
+        current_stream = self._stream
+        updated_stream = set_version(
+            current_stream, self._version or get_version(current_stream), version
+        )
+        if updated_stream != current_stream:
+            self._stream = updated_stream
+            self._version = version
+
+    def fork(self: WrapperT) -> WrapperT:
+        """
+        Creates an independent copy of the wrapper that shares its document and
+        widgets copy-on-write.
+
+        Pending widget hooks and document-level edits are applied first. The fork
+        then shares the current PDF stream, which is never modified in place, so
+        later fills of either wrapper are saved as their own incremental updates
+        on top of it. The widgets become prototypes shared by both wrappers, and
+        each wrapper copies a widget the first time it looks it up through
+        `widgets`. Filling the fork therefore only copies the widgets it fills,
+        without parsing the document or building widgets again.
+
+        Widget objects obtained from `widgets` before forking are no longer used
+        by either wrapper; look them up again after forking.
+
+        Returns:
+            PdfWrapper: The fork, with the same user parameters and registered
+                fonts.
+        """
+
+        self._read()
+        prototypes = (
+            self.widgets.prototypes()
+            if isinstance(self.widgets, SharedWidgets)
+            else deepcopy(self.widgets)
+        )
+        self.widgets = SharedWidgets(prototypes)
+
+        result = copy(self)
+        vars(result).update(
+            widgets=SharedWidgets(prototypes),
+            _available_fonts=dict(self._available_fonts),
+            _font_register_events=list(self._font_register_events),
+            _key_update_tracker=dict(self._key_update_tracker),
+            _keys_to_update=list(self._keys_to_update),
+            _document_edits=[],
+            _pending_version=None,
+            _batch_depth=0,
+        )
+
+        return result
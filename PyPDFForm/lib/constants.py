@@ -71,6 +71,17 @@ Opt = "/Opt"
 AS = "/AS"
 Yes = "/Yes"
 Off = "/Off"
+P = "/P"
+MK = "/MK"
+BC = "/BC"
+BG = "/BG"
+BS = "/BS"
+W = "/W"
+XObject = "/XObject"
+Form = "/Form"
+BBox = "/BBox"
+ProcSet = "/ProcSet"
+Fx = "/Fx"
 
 # javascript
 A = "/A"
@@ -120,6 +131,20 @@ DEFAULT_ASSUMED_GLYPH_WIDTH = 300
 Resources = "/Resources"
 FONT_NAME_PREFIX = "/F"
 
+# document structure
+Root = "/Root"
+Pages = "/Pages"
+Kids = "/Kids"
+Count = "/Count"
+Size = "/Size"
+Prev = "/Prev"
+Info = "/Info"
+ID = "/ID"
+MediaBox = "/MediaBox"
+CropBox = "/CropBox"
+Rotate = "/Rotate"
+INHERITABLE_PAGE_ATTRIBUTES = [Resources, MediaBox, CropBox, Rotate]
+
 # For Adobe Acrobat
 AcroForm = "/AcroForm"
 Fields = "/Fields"
@@ -133,6 +158,7 @@ COMB = 1 << 24
 
 # annotation flag bits
 HIDDEN = 1 << 1
+PRINT = 1 << 2
 
 # reportlab acroform func
 fieldFlags = "fieldFlags"
@@ -144,9 +170,23 @@ DEFAULT_FONT = "Helvetica"
 DEFAULT_FONT_SIZE = 12
 DEFAULT_FONT_COLOR = (0, 0, 0)
 
+# reportlab acroform defaults, mirrored by direct widget creation
+Helv = "/Helv"
+Type1 = "/Type1"
+DEFAULT_TEXT_FIELD_WIDTH = 120
+DEFAULT_TEXT_FIELD_HEIGHT = 36
+DEFAULT_WIDGET_TEXT_COLOR = (0.1, 0.1, 0.1)
+DEFAULT_WIDGET_BORDER_COLOR = (0.1, 0.1, 0.1)
+DEFAULT_WIDGET_BG_COLOR = (0.8, 0.843, 1)
+DEFAULT_WIDGET_BORDER_WIDTH = 1
+
 IMAGE_FIELD_IDENTIFIER = "event.target.buttonImportIcon();"
 
 COORDINATE_GRID_FONT_SIZE_MARGIN_RATIO = DEFAULT_FONT_SIZE / 100
+
+DEFAULT_TABLE_ROW_HEIGHT = 20
+DEFAULT_TABLE_BOTTOM = 36
+DEFAULT_TABLE_PADDING = 2
 UNIQUE_SUFFIX_LENGTH = 20
 
 SLASH = "/"
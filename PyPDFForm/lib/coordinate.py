@@ -7,15 +7,15 @@ It allows developers to visualize the coordinate system of each page in a PDF, w
 for debugging and precisely positioning elements when filling or drawing on PDF forms.
 """
 
-from io import BytesIO
+from functools import lru_cache
 from typing import Tuple
 
 from pypdf import PdfReader
 from reportlab.pdfbase.pdfmetrics import stringWidth
 
+from .adapter import stream_to_f_obj
 from .constants import COORDINATE_GRID_FONT_SIZE_MARGIN_RATIO, DEFAULT_FONT
-from .middleware.text import Text
-from .watermark import create_watermarks_and_draw, merge_watermarks_with_pdf
+from .watermark import draw_watermark, merge_watermarks_with_pdf
 
 
 def generate_coordinate_grid(
@@ -29,6 +29,11 @@ def generate_coordinate_grid(
     the X and Y coordinates. This can be useful for visualizing the layout and positioning
     elements on the PDF.
 
+    Grids are rendered once per page size, color, and margin by
+    `get_coordinate_grid_watermark` and shared as a single Form XObject by all
+    pages of the same size, so regenerating grids for many documents whose
+    pages share a few sizes does not render them again.
+
     Args:
         pdf (bytes): The PDF file as bytes.
         color (Tuple[float, float, float]): The color of the grid lines and text as a tuple of RGB values (0.0-1.0).
@@ -39,71 +44,83 @@ def generate_coordinate_grid(
     Returns:
         bytes: The PDF file with the coordinate grid overlay as bytes.
     """
-    pdf_file = PdfReader(BytesIO(pdf))
-    lines_by_page = {}
-    texts_by_page = {}
-
-    for i, page in enumerate(pdf_file.pages):
-        lines_by_page[i + 1] = []
-        texts_by_page[i + 1] = []
-        width = float(page.mediabox[2])
-        height = float(page.mediabox[3])
-
-        current = margin
-        while current < width:
-            lines_by_page[i + 1].append(
-                {
-                    "src_x": current,
-                    "src_y": 0,
-                    "dest_x": current,
-                    "dest_y": height,
-                    "color": color,
-                }
-            )
-            current += margin
+    watermarks = [
+        get_coordinate_grid_watermark(
+            float(page.mediabox[2]), float(page.mediabox[3]), tuple(color), margin
+        )
+        for page in PdfReader(stream_to_f_obj(pdf)).pages
+    ]
+
+    return merge_watermarks_with_pdf(pdf, watermarks, as_xobject=True)
 
-        current = margin
-        while current < height:
-            lines_by_page[i + 1].append(
-                {
-                    "src_x": 0,
-                    "src_y": current,
-                    "dest_x": width,
-                    "dest_y": current,
-                    "color": color,
-                }
-            )
-            current += margin
-
-        x = margin
-        while x < width:
-            y = margin
-            while y < height:
-                value = f"({x}, {y})"
-                font_size = margin * COORDINATE_GRID_FONT_SIZE_MARGIN_RATIO
-                text = Text("new_coordinate", value)
-                text.font = DEFAULT_FONT
-                text.font_size = font_size
-                text.font_color = color
-                texts_by_page[i + 1].append(
-                    {
-                        "widget": text,
-                        "x": x - stringWidth(value, DEFAULT_FONT, font_size),
-                        "y": y - font_size,
-                    }
-                )
-                y += margin
-            x += margin
 
+@lru_cache(maxsize=128)
+def get_coordinate_grid_watermark(
+    width: float, height: float, color: Tuple[float, float, float], margin: float
+) -> bytes:
+    """
+    Renders the coordinate grid of a page size into a single-page watermark PDF.
+
+    The result is cached, so each distinct combination of page size, color,
+    and margin is only rendered once per process.
+
+    Args:
+        width (float): The width of the page.
+        height (float): The height of the page.
+        color (Tuple[float, float, float]): The color of the grid lines and text as a tuple of RGB values (0.0-1.0).
+        margin (float): The spacing of the grid, in points.
+
+    Returns:
+        bytes: The watermark PDF of the grid.
+    """
     to_draw = []
 
-    for page, lines in lines_by_page.items():
-        to_draw.extend(
-            [{"page_number": page, "type": "line", **line} for line in lines]
+    current = margin
+    while current < width:
+        to_draw.append(
+            {
+                "type": "line",
+                "src_x": current,
+                "src_y": 0,
+                "dest_x": current,
+                "dest_y": height,
+                "color": color,
+            }
         )
-    for page, texts in texts_by_page.items():
-        to_draw.extend(
-            [{"page_number": page, "type": "text", **text} for text in texts]
+        current += margin
+
+    current = margin
+    while current < height:
+        to_draw.append(
+            {
+                "type": "line",
+                "src_x": 0,
+                "src_y": current,
+                "dest_x": width,
+                "dest_y": current,
+                "color": color,
+            }
         )
+        current += margin
+
+    font_size = margin * COORDINATE_GRID_FONT_SIZE_MARGIN_RATIO
+    x = margin
+    while x < width:
+        y = margin
+        while y < height:
+            value = f"({x}, {y})"
+            to_draw.append(
+                {
+                    "type": "text",
+                    "text": value,
+                    "font": DEFAULT_FONT,
+                    "font_size": font_size,
+                    "font_color": color,
+                    "x": x - stringWidth(value, DEFAULT_FONT, font_size),
+                    "y": y - font_size,
+                }
+            )
+            y += margin
+        x += margin
 
-    return merge_watermarks_with_pdf(pdf, create_watermarks_and_draw(pdf, to_draw))
+    return draw_watermark((width, height), to_draw)
@@ -10,14 +10,15 @@ the widget annotations present on each page. These functions are typically calle
 right before the final PDF byte stream is returned by the wrapper module.
 """
 
-from functools import lru_cache
 from io import BytesIO
+from typing import BinaryIO, Iterable
 from warnings import catch_warnings, filterwarnings
 
 from pikepdf import Pdf
 from pypdf import PdfWriter
 from pypdf.generic import ArrayObject, DictionaryObject, NameObject
 
+from .adapter import stream_to_f_obj
 from .constants import (
     XFA,
     AcroForm,
@@ -25,10 +26,12 @@ from .constants import (
     Fields,
     Parent,
 )
-from .template import get_widget_key
+from .index import get_widget_locations, iter_widget_annotations
+from .patterns import get_widget_key
+from .utils import stream_cache
 
 
-@lru_cache(maxsize=128)
+@stream_cache
 def appearance_streams_handler(pdf: bytes, generate_appearance_streams: bool) -> bytes:
     """
     Handles appearance streams and the /NeedAppearances flag for a PDF form.
@@ -50,46 +53,70 @@ def appearance_streams_handler(pdf: bytes, generate_appearance_streams: bool) ->
     Returns:
         bytes: The modified PDF content as a bytes stream.
     """
-    writer = PdfWriter(BytesIO(pdf))
+    writer = PdfWriter(stream_to_f_obj(pdf))
+    set_need_appearances(writer)
 
+    with BytesIO() as f:
+        writer.write(f)
+        f.seek(0)
+        result = f.read()
+
+    if generate_appearance_streams:
+        result = render_appearance_streams(result)
+
+    return result
+
+
+def set_need_appearances(writer: PdfWriter) -> None:
+    """
+    Removes the XFA dictionary of a writer and sets its /NeedAppearances flag.
+
+    Args:
+        writer (PdfWriter): The writer of the PDF form.
+    """
     root_object = writer._root_object  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
     if AcroForm in root_object and XFA in root_object[AcroForm]:
         del root_object[AcroForm][XFA]
 
     writer.set_need_appearances_writer()
 
-    with BytesIO() as f:
-        writer.write(f)
-        f.seek(0)
-        result = f.read()
 
-    if generate_appearance_streams:
-        with Pdf.open(BytesIO(result)) as f, catch_warnings():
-            filterwarnings(
-                "ignore", message=".*/AcroForm.*"
-            )  # handled by rebuild_acroform_fields
+def render_appearance_streams(pdf: bytes) -> bytes:
+    """
+    Generates appearance streams for all form fields of a PDF using pikepdf.
 
-            f.generate_appearance_streams()
-            with BytesIO() as r:
-                f.save(r, deterministic_id=True)
-                r.seek(0)
-                result = r.read()
+    Args:
+        pdf (bytes): The PDF file content as a bytes stream.
 
-    return result
+    Returns:
+        bytes: The PDF content with generated appearance streams.
+    """
+    with Pdf.open(BytesIO(pdf)) as f, catch_warnings():
+        filterwarnings(
+            "ignore", message=".*/AcroForm.*"
+        )  # handled by get_acroform_fields_writer
 
+        f.generate_appearance_streams()
+        with BytesIO() as r:
+            f.save(r, deterministic_id=True)
+            r.seek(0)
+            return r.read()
 
-def rebuild_acroform_fields(
+
+def get_acroform_fields_writer(
     pdf: bytes, widget_keys: set, use_full_widget_name: bool
-) -> bytes:
+) -> PdfWriter | None:
     """
-    Rebuilds the AcroForm `/Fields` array from matching page annotations.
+    Prepares a writer whose AcroForm `/Fields` array is rebuilt from matching
+    page annotations, without serializing it.
 
     The existing `/Fields` array is replaced, creating an AcroForm dictionary
-    when necessary. Each page annotation is resolved to a widget key, and only
-    annotations whose keys are present in `widget_keys` contribute their
-    top-level field object to the new array. Page annotation arrays are left
-    unchanged. When no matching page annotations are found, the original PDF
-    stream is returned unchanged to avoid an unnecessary rewrite.
+    when necessary. The annotations of the keys in `widget_keys` are looked up
+    in the PDF's widget index and contribute their top-level field object to
+    the new array in document order. Page annotation arrays are left
+    unchanged. Callers either serialize the writer into bytes or stream it
+    straight into a destination with `write_pdf`, and use the original PDF
+    stream as is when no writer is returned to avoid an unnecessary rewrite.
 
     Args:
         pdf (bytes): The PDF stream whose AcroForm fields should be rebuilt.
@@ -98,26 +125,78 @@ def rebuild_acroform_fields(
             full widget names, including parent names.
 
     Returns:
-        bytes: The PDF stream with a rebuilt AcroForm `/Fields` array, or the
-            original stream when there are no matching widgets to rebuild.
+        PdfWriter | None: The prepared writer, or None when there are no
+            widget keys to rebuild.
     """
     if not widget_keys:
-        return pdf
+        return None
+
+    writer = PdfWriter(stream_to_f_obj(pdf))
+    _set_acroform_fields(
+        writer,
+        (
+            annot
+            for _, annot, _ in iter_widget_annotations(
+                writer, get_widget_locations(pdf, widget_keys, use_full_widget_name)
+            )
+        ),
+    )
+
+    return writer
+
 
-    writer = PdfWriter(BytesIO(pdf))
+def set_acroform_fields(
+    writer: PdfWriter, widget_keys: set, use_full_widget_name: bool
+) -> None:
+    """
+    Rebuilds the AcroForm `/Fields` array of a writer from matching page
+    annotations, like `get_acroform_fields_writer` does for a PDF stream.
+
+    Every annotation of every page of the writer is resolved, so this is meant
+    for writers of a few pages that are not serialized yet. The writer is left
+    unchanged when there are no widget keys to rebuild.
+
+    Args:
+        writer (PdfWriter): The writer whose AcroForm fields should be rebuilt.
+        widget_keys (set): Widget keys to include in the rebuilt `/Fields` array.
+        use_full_widget_name (bool): Whether to resolve annotations using their
+            full widget names, including parent names.
+    """
+    if not widget_keys:
+        return
+
+    name_cache = {}
+    _set_acroform_fields(
+        writer,
+        (
+            annot
+            for page in writer.pages
+            for annot in page.get(Annots, [])
+            if get_widget_key(annot.get_object(), use_full_widget_name, name_cache)
+            in widget_keys
+        ),
+    )
+
+
+def _set_acroform_fields(writer: PdfWriter, annots: Iterable) -> None:
+    """
+    Replaces the AcroForm `/Fields` array of a writer with the top-level fields
+    of the given annotations, creating an AcroForm dictionary when necessary.
+
+    Args:
+        writer (PdfWriter): The writer whose AcroForm fields should be replaced.
+        annots (Iterable): The widget annotations, in document order.
+    """
     root = writer._root_object  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
 
     fields = ArrayObject([])
     seen_fields = set()
-    for page in writer.pages:
-        for annot in page.get(Annots, []):
-            key = get_widget_key(annot.get_object(), use_full_widget_name)
-            if key in widget_keys:
-                field_ref = _get_root_field_reference(writer, annot)
-                field_key = _field_reference_key(field_ref)
-                if field_key not in seen_fields:
-                    fields.append(field_ref)
-                    seen_fields.add(field_key)
+    for annot in annots:
+        field_ref = _get_root_field_reference(writer, annot)
+        field_key = _field_reference_key(field_ref)
+        if field_key not in seen_fields:
+            fields.append(field_ref)
+            seen_fields.add(field_key)
 
     # if not seen_fields:
     #     return pdf
@@ -126,10 +205,74 @@ def rebuild_acroform_fields(
         root[NameObject(AcroForm)] = DictionaryObject({})
     root[AcroForm][NameObject(Fields)] = fields
 
-    with BytesIO() as f:
-        writer.write(f)
-        f.seek(0)
-        return f.read()
+
+class _OutputStream:
+    """
+    Wraps a writable binary destination for `PdfWriter.write`.
+
+    pypdf records object offsets with `tell`, which sockets and other
+    write-only objects do not provide, and which would be wrong for files that
+    are not written from their start. The wrapper counts the bytes written
+    instead, so offsets are always relative to the start of the PDF.
+    """
+
+    def __init__(self, dest: BinaryIO) -> None:
+        """
+        Initializes the wrapper around a destination.
+
+        Args:
+            dest (BinaryIO): The writable binary destination.
+        """
+        super().__init__()
+
+        self.dest = dest
+        self.position = 0
+
+    def write(self, data: bytes) -> int:
+        """
+        Writes data to the destination and advances the position.
+
+        Args:
+            data (bytes): The data to write.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        self.dest.write(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        """
+        Returns the number of bytes written so far.
+
+        Returns:
+            int: The current position relative to the start of the PDF.
+        """
+        return self.position
+
+    def flush(self) -> None:
+        """
+        Flushes the destination when it supports flushing.
+        """
+        flush = getattr(self.dest, "flush", None)
+        if callable(flush):
+            flush()
+
+
+def write_pdf(writer: PdfWriter, dest: BinaryIO) -> None:
+    """
+    Serializes a writer straight into a writable binary destination.
+
+    Objects are written to the destination as they are serialized, so the
+    complete PDF never has to be held in memory as a single bytes object.
+
+    Args:
+        writer (PdfWriter): The writer to serialize.
+        dest (BinaryIO): Any object with a binary `write` method, such as an
+            open file or a socket file.
+    """
+    writer.write(_OutputStream(dest))  # type: ignore
 
 
 def _get_root_field_reference(writer: PdfWriter, annot):
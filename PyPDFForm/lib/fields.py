@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+"""
+A module for creating, updating, removing, and renaming the form fields of a
+`PdfWrapper`.
+
+`FieldsMixin` groups new fields by creation strategy and copies the widgets of
+every group into the PDF in a single pass, applies attribute updates to all
+fields matched by a selector in a single pass over their annotations, and
+removes or renames fields, rebuilding the wrapper's widgets afterwards.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Callable, List, Sequence, TypeVar
+
+from .base import WrapperBase
+from .hooks import bulk_update_widgets, is_hook_applied
+from .middleware.checkbox import Checkbox
+from .template import create_widgets, remove_widgets_by_keys, update_widget_keys
+from .watermark import copy_watermark_widgets
+from .widgets import (
+    CheckBoxField,
+    DropdownField,
+    FieldGrid,
+    ImageField,
+    RadioGroup,
+    SignatureField,
+)
+
+if TYPE_CHECKING:
+    from .widgets import FieldTypes
+
+FieldsT = TypeVar("FieldsT", bound="FieldsMixin")
+
+
+class FieldsMixin(WrapperBase):
+    """
+    A mixin that provides the form field operations of `PdfWrapper`.
+    """
+
+    def bulk_create_fields(
+        self: FieldsT,
+        fields: Sequence[FieldTypes | FieldGrid],
+        direct: bool = False,
+        workers: int | None = None,
+    ) -> FieldsT:
+        """
+        Creates multiple new form fields (widgets) on the PDF in a single operation.
+
+        This method takes a list of field definition objects (`FieldTypes`),
+        groups them by creation strategy, and then passes all groups to the
+        internal `_bulk_create_fields` method, which renders each group separately
+        but copies the widgets of every group into the PDF in a single pass.
+        Signatures and images are grouped together because both copy bedrock
+        annotations; checkboxes and radio groups are grouped together because they
+        share ReportLab button handling; multiple dropdown fields are routed through
+        the general creation path.
+
+        With `direct` enabled, fields that support it are built straight into the
+        PDF's object graph instead of being rendered onto ReportLab watermarks and
+        copied back, which is much faster for large numbers of fields. Currently
+        text, signature, and image fields support direct creation; all other
+        fields fall back to ReportLab.
+
+        A `FieldGrid` is grouped by the type of its fields and expanded straight
+        into widgets, so large regular layouts skip building a field definition
+        object for each cell.
+
+        With `workers` greater than one, the page watermarks of each group are
+        rendered in a pool of up to that many processes, which speeds up
+        creating fields across many pages. On platforms that spawn worker
+        processes, call it from under an `if __name__ == "__main__":` guard.
+
+        Args:
+            fields (Sequence[FieldTypes | FieldGrid]): A list of field definition
+                objects (e.g., `TextField`, `CheckBoxField`, etc.) or grids of
+                fields to be created.
+            direct (bool): Whether to build supported fields directly instead of
+                rendering them with ReportLab. Defaults to False.
+            workers (int | None): The maximum number of worker processes used
+                to render page watermarks. Defaults to None, rendering in the
+                current process.
+
+        Returns:
+            PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
+        """
+
+        needs_separate_creation = [
+            CheckBoxField,
+            RadioGroup,
+            DropdownField,
+            SignatureField,
+            ImageField,
+        ]
+        needs_separate_creation_dict = defaultdict(list)
+        general_creation = []
+
+        for each in fields:
+            field_type = each.field_type if isinstance(each, FieldGrid) else type(each)
+            if field_type in needs_separate_creation:
+                needs_separate_creation_dict[field_type].append(each)
+            else:
+                general_creation.append(each)
+
+        needs_separate_creation_dict[SignatureField] = needs_separate_creation_dict.pop(
+            SignatureField, []
+        ) + needs_separate_creation_dict.pop(ImageField, [])
+        needs_separate_creation_dict[CheckBoxField] = needs_separate_creation_dict.pop(
+            CheckBoxField, []
+        ) + needs_separate_creation_dict.pop(RadioGroup, [])
+
+        if (
+            DropdownField in needs_separate_creation_dict
+            and sum(
+                len(each) if isinstance(each, FieldGrid) else 1
+                for each in needs_separate_creation_dict[DropdownField]
+            )
+            > 1
+        ):
+            general_creation += needs_separate_creation_dict.pop(DropdownField, [])
+
+        self._bulk_create_fields(
+            [
+                each
+                for each in list(needs_separate_creation_dict.values())
+                + [general_creation]
+                if each
+            ],
+            direct,
+            workers,
+        )
+
+        return self
+
+    def _bulk_create_fields(
+        self: FieldsT,
+        field_groups: Sequence[Sequence[FieldTypes | FieldGrid]],
+        direct: bool = False,
+        workers: int | None = None,
+    ) -> FieldsT:
+        """
+        Internal method to create groups of new form fields (widgets) on the PDF in a single operation.
+
+        This method converts each group of field definition objects (`FieldTypes`)
+        into widget objects, expanding grids with `FieldGrid.build_widgets`, and creates page-aligned watermark PDFs for each group
+        with the group's widget class. When `direct` is enabled, widgets that
+        support direct creation are left out of the watermarks and built into the
+        current PDF with `create_widgets` first. The widget annotations of all
+        groups are then copied into the current PDF in one pass, in group order,
+        before the widget cache is refreshed once and any hook parameters captured
+        during field construction are applied.
+
+        Args:
+            field_groups (Sequence[Sequence[FieldTypes | FieldGrid]]): Groups of
+                field definition objects (e.g., `TextField`, `CheckBoxField`, etc.)
+                or grids of fields to be created. Each group is rendered with the
+                widget class of its fields.
+            direct (bool): Whether to build widgets that support it directly.
+            workers (int | None): The maximum number of worker processes used
+                to render page watermarks.
+
+        Returns:
+            PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
+        """
+
+        stream = self._read()
+        widgets = []
+        direct_widgets = []
+        watermarks = []
+        for fields in field_groups:
+            group = []
+            for field in fields:
+                group += self._field_to_widgets(field)
+
+            widgets += group
+            if direct:
+                direct_widgets += [
+                    each for each in group if getattr(each, "DIRECT_CREATION", False)
+                ]
+                group = [
+                    each
+                    for each in group
+                    if not getattr(each, "DIRECT_CREATION", False)
+                ]
+            if not group:
+                continue
+
+            group_watermarks = getattr(type(group[-1]), "bulk_watermarks")(
+                group, stream, workers
+            )
+            if not watermarks:
+                watermarks = [[] for _ in group_watermarks]
+            for i, watermark in enumerate(group_watermarks):
+                if watermark:
+                    watermarks[i].append(watermark)
+
+        if not widgets:
+            return self
+
+        if direct_widgets:
+            stream = create_widgets(stream, direct_widgets)
+
+        if watermarks:
+            # Case: List of lists of watermark PDFs, each corresponding to an output page.
+            stream = copy_watermark_widgets(
+                stream,
+                watermarks,
+                [widget.name for widget in widgets],
+                None,
+            )
+
+        self._stream = stream
+
+        self._init_helper()
+
+        for widget in widgets:
+            for k, v in widget.hook_params:
+                self.widgets[widget.name].__setattr__(k, v)
+
+        return self
+
+    @staticmethod
+    def _field_to_widgets(field: FieldTypes | FieldGrid) -> list:
+        """
+        Converts a field definition object or a grid of fields into widget objects.
+
+        Args:
+            field (FieldTypes | FieldGrid): The field definition object or grid of
+                fields to convert.
+
+        Returns:
+            list: The widget objects, in creation order.
+        """
+
+        if isinstance(field, FieldGrid):
+            return field.build_widgets()
+
+        field_dict = asdict(field)
+        widget_class = getattr(field, "_widget_class")
+        name = field_dict.pop("name")
+        page_number = field_dict.pop("page_number")
+        x = field_dict.pop("x")
+        y = field_dict.pop("y")
+        return [
+            widget_class(
+                name=name,
+                page_number=page_number,
+                x=x,
+                y=y,
+                **{k: v for k, v in field_dict.items() if v is not None},
+            )
+        ]
+
+    def update_fields(
+        self: FieldsT, selector: type | Callable[[str], bool] | int, **attrs: Any
+    ) -> FieldsT:
+        """
+        Updates the same attributes on every form field matched by a selector.
+
+        This is the bulk counterpart of setting attributes on each widget in
+        `widgets`. Instead of queuing hooks widget by widget, the attributes are
+        applied to all matched fields in a single pass over their annotations,
+        and the widgets are updated to reflect the values that were applied,
+        so a font that is not registered is not reported. Queued hooks are
+        applied first so earlier attribute changes are not lost. Attributes that
+        a matched field does not support are skipped for that field.
+
+        Args:
+            selector (type | Callable[[str], bool] | int): Selects the fields to update.
+                A widget type (e.g. `Widgets.Text`) matches fields of that type,
+                a callable matches fields whose key it returns True for, and an
+                integer matches fields on that 1-indexed page number.
+            **attrs (Any): The widget attributes to update and their new values,
+                e.g. `font_size=12` or `readonly=True`.
+
+        Returns:
+            PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
+        """
+
+        stream = self._read()
+
+        view = self._widget_view()
+        if isinstance(selector, type):
+            keys = [k for k, v in view.items() if isinstance(v, selector)]
+        elif callable(selector):
+            keys = [k for k in view if selector(k)]
+        else:
+            keys = [k for k, v in view.items() if v.page_number == selector]
+        widgets = {k: self.widgets[k] for k in keys}
+
+        font = attrs.get("font")
+        if font is not None:
+            available_fonts = self._ensure_available_fonts_loaded()
+            if font not in available_fonts.values() and font in available_fonts:
+                # from `new_font` to `/F1`
+                attrs["font"] = available_fonts.get(font)
+
+        self._stream = bulk_update_widgets(
+            stream, widgets, attrs, getattr(self, "use_full_widget_name")
+        )
+
+        for widget in widgets.values():
+            for name, value in attrs.items():
+                if (
+                    name in widget.SET_ATTR_TRIGGER_HOOK_MAP
+                    and value is not None
+                    and is_hook_applied(widget.SET_ATTR_TRIGGER_HOOK_MAP[name], value)
+                ):
+                    widget.__dict__[name] = value
+                    widget.attr_set_tracker[name] = value
+                    widget.pdf_state[name] = value
+                    if name == "size" and isinstance(widget, Checkbox):
+                        widget.__dict__["width"] = value
+                        widget.__dict__["height"] = value
+                        widget.pdf_state["width"] = value
+                        widget.pdf_state["height"] = value
+
+        return self
+
+    def remove_fields(self: FieldsT, keys: List[str]) -> FieldsT:
+        """
+        Removes form fields from the PDF by their keys.
+
+        This method removes any fields whose keys are included in `keys` and
+        refreshes the wrapper's widget metadata after the PDF stream is updated.
+
+        Args:
+            keys (List[str]): A list of form field keys to remove.
+
+        Returns:
+            PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
+        """
+
+        self._stream = remove_widgets_by_keys(
+            self._read(), keys, getattr(self, "use_full_widget_name")
+        )
+        self._init_helper()
+
+        return self
+
+    def update_widget_key(
+        self: FieldsT, old_key: str, new_key: str, index: int = 0
+    ) -> FieldsT:
+        """
+        Updates the key (name) of a widget, allowing you to rename form fields.
+
+        This method queues a change to the name of a form field in the PDF. This can be useful for
+        standardizing field names or resolving naming conflicts. The queued update is applied when
+        `commit_widget_key_updates` is called. Renaming is not supported while full widget names are
+        being used for lookup.
+
+        Args:
+            old_key (str): The old key of the widget that you want to rename.
+            new_key (str): The new key to assign to the widget.
+            index (int): The index of the widget if there are multiple widgets with the same name (default: 0).
+
+        Returns:
+            PdfWrapper: The PdfWrapper object.
+        """
+
+        if getattr(self, "use_full_widget_name"):
+            raise NotImplementedError
+
+        self._keys_to_update.append((old_key, new_key, index))
+        return self
+
+    def commit_widget_key_updates(self: FieldsT) -> FieldsT:
+        """
+        Commits deferred widget key updates, applying all queued key renames to the PDF.
+
+        This method applies all widget key updates queued by the `update_widget_key` method. It updates
+        the underlying PDF stream with the new key names, rebuilds the widget cache, preserves attributes
+        that were set on the old widget objects, and clears the queue.
+
+        Returns:
+            PdfWrapper: The PdfWrapper object.
+        """
+
+        if getattr(self, "use_full_widget_name"):
+            raise NotImplementedError
+
+        old_keys = [each[0] for each in self._keys_to_update]
+        new_keys = [each[1] for each in self._keys_to_update]
+        indices = [each[2] for each in self._keys_to_update]
+
+        self._stream = update_widget_keys(
+            self._read(), self.widgets, old_keys, new_keys, indices
+        )
+
+        for each in self._keys_to_update:
+            self._key_update_tracker[each[1]] = each[0]
+        self._init_helper()
+        self._keys_to_update = []
+
+        return self
@@ -8,15 +8,18 @@ checkboxes, radio buttons, dropdowns, images, and signatures. The module also
 supports flattening the filled form to prevent further modifications.
 """
 
-from io import BytesIO
-from typing import Dict, cast
+from collections import defaultdict
+from typing import Dict, List, cast
 
 from pypdf import PdfWriter
-from pypdf.generic import DictionaryObject
+from pypdf.generic import ArrayObject, DictionaryObject, NameObject
 
+from .adapter import stream_to_f_obj
 from .constants import Annots
 from .hooks import flatten_field
 from .image import get_draw_image_resolutions, get_image_dimensions
+from .incremental import open_for_update, save_update
+from .index import get_widget_locations, iter_widget_annotations
 from .middleware import WIDGET_TYPES
 from .middleware.checkbox import Checkbox
 from .middleware.dropdown import Dropdown
@@ -25,13 +28,12 @@ from .middleware.radio import Radio
 from .middleware.signature import Signature
 from .middleware.text import Text
 from .patterns import (
-    get_widget_key,
     update_checkbox_value,
     update_dropdown_value,
     update_radio_value,
     update_text_value,
 )
-from .watermark import create_watermarks_and_draw, merge_watermarks_with_pdf
+from .watermark import create_watermarks_and_draw, merge_watermarks_with_writer
 
 
 def signature_image_handler(
@@ -89,7 +91,9 @@ def update_widget(
     """Updates a single widget's value and handles its properties.
 
     This function updates the value of a single PDF form widget based on its type. It sets
-    the read-only flag first when flattening is requested, skips value updates when the
+    the read-only flag first when flattening is requested, mirroring it on the middleware
+    and its recorded PDF state so a later `readonly` assignment is compared against the
+    flattened state, skips value updates when the
     middleware value is ``None``, tracks radio option indices within each group, and
     prepares images or signatures for later drawing instead of writing image data directly
     into the annotation.
@@ -108,6 +112,9 @@ def update_widget(
     """
     if flatten:
         flatten_field(annot, True)
+        # keeps extracted state in sync without queuing a hook
+        widget.__dict__["readonly"] = True
+        widget.pdf_state["readonly"] = True
     if widget.value is None:
         return False
 
@@ -131,21 +138,26 @@ def update_widget(
 
 
 def handle_image_drawing(
-    result: bytes,
+    writer: PdfWriter,
+    template: bytes,
     images_to_draw: Dict[int, list],
-) -> bytes:
-    """Merges prepared images and signatures with the filled PDF.
+    image_keys: List[str],
+    use_full_widget_name: bool,
+) -> None:
+    """Draws prepared images and signatures onto the PDF being filled.
 
-    This function takes the filled PDF and a dictionary of images to draw (from signatures
-    or image fields), flattens that page-indexed structure into watermark drawing
-    instructions, and merges those image watermarks into the PDF.
+    This function flattens the page-indexed images into watermark drawing
+    instructions, merges the resulting watermarks into the writer's pages, and
+    removes the annotations of every signature and image widget, whose values are
+    now part of the page content. All other annotations are left in place, so the
+    whole fill is serialized only once.
 
     Args:
-        result (bytes): The filled PDF as bytes.
+        writer (PdfWriter): The writer opened on `template` that is being filled.
+        template (bytes): The PDF template the writer was opened on.
         images_to_draw (Dict[int, list]): A dictionary mapping page numbers to lists of image data.
-
-    Returns:
-        bytes: The PDF with images and signatures merged.
+        image_keys (List[str]): Keys of the signature and image widgets to remove.
+        use_full_widget_name (bool): Whether the keys are full widget names.
     """
     images = []
     for page, elements in images_to_draw.items():
@@ -153,7 +165,20 @@ def handle_image_drawing(
             [{"page_number": page, "type": "image", **element} for element in elements]
         )
 
-    return merge_watermarks_with_pdf(result, create_watermarks_and_draw(result, images))
+    merge_watermarks_with_writer(writer, create_watermarks_and_draw(template, images))
+
+    for page_index, locations in get_widget_locations(
+        template, image_keys, use_full_widget_name
+    ).items():
+        page = writer.pages[page_index]
+        to_remove = {annot_index for annot_index, _ in locations}
+        page[NameObject(Annots)] = ArrayObject(
+            [
+                annot
+                for annot_index, annot in enumerate(page[Annots])
+                if annot_index not in to_remove
+            ]
+        )
 
 
 def fill(
@@ -162,15 +187,22 @@ def fill(
     need_appearances: bool,
     use_full_widget_name: bool,
     flatten: bool = False,
-) -> tuple:
+) -> bytes:
     """Fills a PDF template with the given widgets.
 
-    This function fills a PDF template with the provided widget values. It iterates through the
-    widgets on each page of the PDF and updates their values based on the provided `widgets`
-    dictionary. The function supports text fields, checkboxes, radio buttons, dropdowns,
-    images, and signatures. It can set fields read-only during filling, and when images or
-    signatures are present it returns both the filled form stream and a second stream with
-    the image watermarks applied so callers can preserve non-image widgets separately.
+    This function fills a PDF template with the provided widget values. It looks up the
+    annotations of the provided `widgets` that have a value, or of all of them when
+    flattening, in the template's widget index and updates only those, in document
+    order, instead of walking every annotation on every page. The
+    function supports text fields, checkboxes, radio buttons, dropdowns, images, and
+    signatures. It can set fields read-only during filling. When images or signatures
+    are filled, they are drawn onto the pages and every signature and image widget is
+    removed, in the same pass.
+
+    Unless there are images or signatures to draw, the annotations are edited
+    through a reader that only loads the pages they are on, and the changes are
+    appended to the template as an incremental update, so the cost of a fill does
+    not grow with the length of the document.
 
     Args:
         template (bytes): The PDF template as bytes.
@@ -184,42 +216,50 @@ def fill(
         flatten (bool): Whether to flatten the filled PDF. Defaults to False.
 
     Returns:
-        tuple: A tuple containing the filled PDF as bytes and the image-drawn
-               stream as bytes when an image or signature was drawn. The second
-               tuple item is None when no image drawing is needed.
+        bytes: The filled PDF as bytes.
     """
-    out = PdfWriter(BytesIO(template))
+    out = (
+        PdfWriter(stream_to_f_obj(template))
+        if any(
+            isinstance(widget, (Signature, Image)) and widget.value is not None
+            for widget in widgets.values()
+        )
+        else open_for_update(template)
+    )
 
     radio_button_tracker = {}
-    images_to_draw = {}
+    images_to_draw = defaultdict(list)
     any_image_to_draw = False
 
-    for page_num, page in enumerate(out.pages):
-        images_to_draw[page_num + 1] = []
-        for annot in page.get(Annots, []):
-            annot = cast(DictionaryObject, annot.get_object())
-            key = get_widget_key(annot.get_object(), use_full_widget_name)
-
-            widget = widgets.get(key)
-            if widget is None:
-                continue
-
-            any_image_to_draw |= update_widget(
-                annot,
-                widget,
-                key,
-                radio_button_tracker,
-                images_to_draw[page_num + 1],
-                need_appearances,
-                flatten,
-            )
-
-    with BytesIO() as f:
-        out.write(f)
-        f.seek(0)
-        result = f.read()
-
-    if not any_image_to_draw:
-        return result, None
-
-    return result, handle_image_drawing(result, images_to_draw)
+    for page_index, annot, key in iter_widget_annotations(
+        out,
+        get_widget_locations(
+            template,
+            [
+                key
+                for key, widget in widgets.items()
+                if flatten or widget.value is not None
+            ],
+            use_full_widget_name,
+        ),
+    ):
+        any_image_to_draw |= update_widget(
+            cast(DictionaryObject, annot.get_object()),
+            widgets[key],
+            key,
+            radio_button_tracker,
+            images_to_draw[page_index + 1],
+            need_appearances,
+            flatten,
+        )
+
+    if any_image_to_draw:
+        handle_image_drawing(
+            cast(PdfWriter, out),
+            template,
+            images_to_draw,
+            [k for k, v in widgets.items() if isinstance(v, Signature)],
+            use_full_widget_name,
+        )
+
+    return save_update(template, out, use_full_widget_name)
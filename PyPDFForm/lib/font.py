@@ -27,6 +27,7 @@ from pypdf.generic import (
 from reportlab.pdfbase.pdfmetrics import _fonts
 from reportlab.pdfbase.ttfonts import TTFError, TTFont
 
+from .adapter import stream_to_f_obj
 from .assets.blank import BlankPage
 from .constants import (
     DEFAULT_ASSUMED_GLYPH_WIDTH,
@@ -62,7 +63,9 @@ from .constants import (
     Widths,
     WinAnsiEncoding,
 )
+from .incremental import UpdateReader, add_object
 from .raw.text import RawText
+from .utils import stream_cache
 from .watermark import create_watermarks_and_draw
 
 
@@ -119,7 +122,7 @@ def _get_additional_font_params(pdf: bytes, base_font_name: str) -> tuple:
     """
     font_descriptor_params = {}
     font_dict_params = {}
-    reader = PdfReader(BytesIO(pdf))
+    reader = PdfReader(stream_to_f_obj(pdf))
     first_page = reader.get_page(0)
 
     for font in first_page[Resources][Font].values():
@@ -218,7 +221,7 @@ def _get_watermark_with_font(ttf_stream: bytes) -> bytes:
     Creates a watermark PDF with a single space character using the specified font.
 
     This function is primarily used to generate a dummy PDF page that includes
-    a specific font. `register_font_acroform` can then inspect that page's font
+    a specific font. `add_font_acroform` can then inspect that page's font
     resources for descriptor values needed when `/NeedAppearances` support is
     requested. The result is cached for performance.
 
@@ -249,11 +252,11 @@ def _compress_ttf(ttf_stream: bytes) -> bytes:
     return compress(ttf_stream)
 
 
-def register_font_acroform(
-    pdf: bytes, ttf_stream: bytes, need_appearances: bool
-) -> tuple:
+def add_font_acroform(
+    out: UpdateReader | PdfWriter, ttf_stream: bytes, need_appearances: bool
+) -> str:
     """
-    Registers a TrueType font within the PDF's AcroForm dictionary.
+    Adds a TrueType font to the AcroForm dictionary of an opened PDF.
 
     This allows the font to be used when filling form fields within the PDF.
     The function embeds a compressed TTF stream, creates the font descriptor and
@@ -263,8 +266,7 @@ def register_font_acroform(
     generated with the same TTF.
 
     Args:
-        pdf (bytes): The PDF file data as bytes. This is the PDF document that
-            will be modified to include the new font.
+        out (UpdateReader | PdfWriter): The PDF opened with `open_for_update`.
         ttf_stream (bytes): The font file data in TTF format as bytes. This is the
             raw data of the TrueType font file.
         need_appearances (bool): If True, attempts to retrieve existing font parameters
@@ -272,11 +274,9 @@ def register_font_acroform(
             required.
 
     Returns:
-        tuple: A tuple containing the modified PDF data as bytes and the new font name
-            (str) that was assigned to the registered font within the PDF.
+        str: The new font name that was assigned to the font within the PDF.
     """
     base_font_name = _get_base_font_name(ttf_stream)
-    writer = PdfWriter(BytesIO(pdf))
 
     font_descriptor_params = {}
     font_dict_params = {}
@@ -295,7 +295,7 @@ def register_font_acroform(
             NameObject(Filter): NameObject(FlateDecode),
         }
     )
-    font_file_ref = writer._add_object(font_file_stream)  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+    font_file_ref = add_object(out, font_file_stream)
 
     font_descriptor = DictionaryObject()
     font_descriptor.update(
@@ -308,7 +308,7 @@ def register_font_acroform(
     font_descriptor.update(
         {k: v for k, v in font_descriptor_params.items() if k not in font_descriptor}
     )
-    font_descriptor_ref = writer._add_object(font_descriptor)  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+    font_descriptor_ref = add_object(out, font_descriptor)
 
     font_dict = DictionaryObject()
     font_dict.update(
@@ -336,13 +336,14 @@ def register_font_acroform(
             }
         )
 
-    font_dict_ref = writer._add_object(font_dict)  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+    font_dict_ref = add_object(out, font_dict)
 
-    if AcroForm not in writer._root_object:  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
-        writer._root_object[NameObject(AcroForm)] = DictionaryObject(  # type: ignore # noqa: SLF001 # pylint: disable=W0212
+    root = out.root_object
+    if AcroForm not in root:
+        root[NameObject(AcroForm)] = DictionaryObject(
             {NameObject(Fields): ArrayObject([])}
         )
-    acroform = writer._root_object[AcroForm]  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+    acroform = root[AcroForm]
 
     if DR not in acroform:
         acroform[NameObject(DR)] = DictionaryObject()
@@ -355,10 +356,7 @@ def register_font_acroform(
     new_font_name = _get_new_font_name(fonts)
     fonts[NameObject(new_font_name)] = font_dict_ref
 
-    with BytesIO() as f:
-        writer.write(f)
-        f.seek(0)
-        return f.read(), new_font_name
+    return new_font_name
 
 
 @lru_cache(maxsize=128)
@@ -402,7 +400,7 @@ def _get_new_font_name(fonts: dict) -> str:
     return f"{FONT_NAME_PREFIX}{n}"
 
 
-@lru_cache(maxsize=128)
+@stream_cache
 def get_all_available_fonts(pdf: bytes) -> dict:
     """
     Retrieves all available fonts from a PDF document's AcroForm.
@@ -419,7 +417,7 @@ def get_all_available_fonts(pdf: bytes) -> dict:
             (without the leading slash) and the values are the corresponding font
             identifiers in the PDF. Returns an empty dictionary if no fonts are found.
     """
-    reader = PdfReader(BytesIO(pdf))
+    reader = PdfReader(stream_to_f_obj(pdf))
     try:
         fonts = reader.root_object[AcroForm][DR][Font]
     except KeyError:
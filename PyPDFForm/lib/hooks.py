@@ -10,10 +10,9 @@ filling process, allowing for customization of the form's appearance and behavio
 """
 
 import sys
-from io import BytesIO
-from typing import TextIO, cast
+from functools import partial
+from typing import Any, Callable, List, TextIO, Tuple, cast
 
-from pypdf import PdfWriter
 from pypdf.generic import (
     ArrayObject,
     DictionaryObject,
@@ -37,7 +36,6 @@ from .constants import (
     REQUIRED,
     TU,
     Action,
-    Annots,
     Bl,
     D,
     E,
@@ -55,7 +53,23 @@ from .constants import (
     U,
     X,
 )
-from .patterns import get_widget_key
+from .incremental import open_for_update, save_update
+from .index import get_widget_locations, iter_widget_annotations
+
+# hook name -> function rewriting the DA string
+TEXT_APPEARANCE_HOOKS = {
+    "update_text_field_font": "_replace_text_appearance_font",
+    "update_text_field_font_size": "_replace_text_appearance_font_size",
+    "update_text_field_font_color": "_replace_text_appearance_font_color",
+}
+
+# hook name -> (field flag, whether a false value unsets the flag)
+FIELD_FLAG_HOOKS = {
+    "flatten_field": (READ_ONLY, True),
+    "update_field_required": (REQUIRED, True),
+    "update_text_field_multiline": (MULTILINE, False),
+    "update_text_field_comb": (COMB, False),
+}
 
 
 def trigger_widget_hooks(
@@ -66,12 +80,17 @@ def trigger_widget_hooks(
     """
     Triggers widget hooks to apply dynamic changes to PDF form fields.
 
-    This function iterates through the annotations on each page of the PDF and,
-    if a widget is associated with an annotation and has hooks to trigger,
-    it executes those hooks. Hooks are functions defined in this module that
+    This function looks up the annotations of widgets that have hooks to trigger
+    in the PDF's widget index and executes those hooks on each of them, leaving
+    all other annotations untouched. Hooks are functions defined in this module that
     modify the annotation dictionary, allowing for dynamic changes to the form field's
-    appearance or behavior. After writing the modified PDF, all widget hook queues are
-    cleared so the same changes are not applied repeatedly.
+    appearance or behavior. Only the pages of the located annotations are loaded,
+    and the changes are appended to the PDF as an incremental update. After
+    writing the modified PDF, all widget hook queues are
+    cleared so the same changes are not applied repeatedly, and the applied values
+    are recorded in each widget's `pdf_state`. When none of the queued
+    hooks target an annotation in the PDF, the queues are cleared and the original
+    stream is returned without a rewrite.
 
     Args:
         pdf (bytes): The PDF file data as bytes.
@@ -82,64 +101,342 @@ def trigger_widget_hooks(
             looking up widgets in the widgets dictionary.
 
     Returns:
-        bytes: The modified PDF data as bytes, with the widget hooks applied.
+        bytes: The modified PDF data as bytes, with the widget hooks applied, or
+            the original PDF data when there is nothing to apply.
     """
-    output = PdfWriter(BytesIO(pdf))
+    locations = get_widget_locations(
+        pdf,
+        [key for key, widget in widgets.items() if widget.hooks_to_trigger],
+        use_full_widget_name,
+    )
+    if not locations:
+        for widget in widgets.values():
+            widget.hooks_to_trigger = []
+        return pdf
+
+    output = open_for_update(pdf)
+
+    updated = set()
+    for _, annot, key in iter_widget_annotations(output, locations):
+        annot = cast(DictionaryObject, annot.get_object())
+        for hook in widgets[key].hooks_to_trigger:
+            getattr(sys.modules[__name__], hook[0])(annot, hook[1])
+        updated.add(key)
+
+    for key in updated:
+        widget = widgets[key]
+        attrs = {hook: name for name, hook in widget.SET_ATTR_TRIGGER_HOOK_MAP.items()}
+        for hook_name, value in widget.hooks_to_trigger:
+            if is_hook_applied(hook_name, value):
+                widget.pdf_state[attrs[hook_name]] = value
 
-    for page in output.pages:
-        for annot in page.get(Annots, []):
-            annot = cast(DictionaryObject, annot.get_object())
-            key = get_widget_key(annot.get_object(), use_full_widget_name)
+    for widget in widgets.values():
+        widget.hooks_to_trigger = []
 
-            widget = widgets.get(key)
-            if widget is None or not widget.hooks_to_trigger:
-                continue
+    return save_update(pdf, output, use_full_widget_name)
 
-            for hook in widget.hooks_to_trigger:
-                getattr(sys.modules[__name__], hook[0])(annot, hook[1])
 
-    for widget in widgets.values():
-        widget.hooks_to_trigger = []
+def bulk_update_widgets(
+    pdf: bytes,
+    widgets: dict,
+    attrs: dict,
+    use_full_widget_name: bool,
+) -> bytes:
+    """
+    Applies the same attribute updates to many widgets in a single pass.
 
-    with BytesIO() as f:
-        output.write(f)
-        f.seek(0)
-        return f.read()
+    The hooks that the attributes map to are compiled once per distinct widget
+    type instead of being dispatched per annotation. Default appearance (DA)
+    updates are combined into one string transformation whose results are
+    memoized by the original DA string, so fields sharing a style are only
+    rewritten once. Field flag updates are combined into set and clear masks
+    applied with a single write per annotation. Like `trigger_widget_hooks`,
+    the changes are appended to the PDF as an incremental update. Attributes that a widget does
+    not support, and attributes set to None, are skipped for that widget.
 
+    Args:
+        pdf (bytes): The PDF file data as bytes.
+        widgets (dict): A dictionary of the widgets to update, where keys are
+            widget identifiers and values are widget objects.
+        attrs (dict): A dictionary mapping widget attribute names to the values
+            to apply to every widget.
+        use_full_widget_name (bool): Whether the widget keys are full widget names.
 
-def _update_field_flag(annot: DictionaryObject, flag: int, should_set: bool) -> None:
+    Returns:
+        bytes: The modified PDF data as bytes, or the original PDF data when
+            there is nothing to apply.
+    """
+    compiled = {}
+    updates_by_key = {}
+    for key, widget in widgets.items():
+        hooks = tuple(
+            (widget.SET_ATTR_TRIGGER_HOOK_MAP[name], value)
+            for name, value in attrs.items()
+            if name in widget.SET_ATTR_TRIGGER_HOOK_MAP and value is not None
+        )
+        if hooks:
+            if hooks not in compiled:
+                compiled[hooks] = _compile_hooks(hooks)
+            updates_by_key[key] = compiled[hooks]
+
+    locations = get_widget_locations(pdf, updates_by_key.keys(), use_full_widget_name)
+    if not locations:
+        return pdf
+
+    output = open_for_update(pdf)
+
+    for _, annot, key in iter_widget_annotations(output, locations):
+        annot = cast(DictionaryObject, annot.get_object())
+        for update in updates_by_key[key]:
+            update(annot)
+
+    return save_update(pdf, output, use_full_widget_name)
+
+
+def is_hook_applied(hook_name: str, value: Any) -> bool:
     """
-    Sets or unsets a bit flag for a form field annotation.
+    Checks whether a hook changes annotations when triggered with a value.
+
+    A font name that is not a PDF font resource name, and a false value for a
+    field flag that a false value does not unset, leave annotations unchanged.
+
+    Args:
+        hook_name (str): The name of the hook function.
+        value (Any): The value the hook is triggered with.
+
+    Returns:
+        bool: True if triggering the hook changes the annotations it is applied to.
+    """
+    if hook_name == "update_text_field_font":
+        return value.startswith("/")
+    if hook_name in FIELD_FLAG_HOOKS:
+        return bool(value) or FIELD_FLAG_HOOKS[hook_name][1]
+
+    return True
+
+
+def _compile_hooks(
+    hooks: Tuple[Tuple[str, Any], ...],
+) -> List[Callable[[DictionaryObject], None]]:
+    """
+    Compiles a sequence of hooks into annotation update functions.
+
+    Font, font size, and font color hooks are folded into one DA update that
+    caches the rewritten string for each original DA string. Editability,
+    required, multiline, and comb hooks are folded into one field flag update.
+    Every other hook is resolved to its function once. Each folded update takes
+    the position of its first hook, so entries are written in the same order
+    as triggering the hooks one by one.
+
+    Args:
+        hooks (Tuple[Tuple[str, Any], ...]): Pairs of hook function name and value.
+
+    Returns:
+        List[Callable[[DictionaryObject], None]]: Functions that apply the hooks
+            to an annotation dictionary.
+    """
+    text_appearance_updates = []
+    set_mask = 0
+    clear_mask = 0
+    result = []
+    text_appearance_index = None
+    flag_index = None
+
+    for hook_name, value in hooks:
+        if not is_hook_applied(hook_name, value):
+            continue
+
+        if hook_name in TEXT_APPEARANCE_HOOKS:
+            text_appearance_updates.append(
+                partial(
+                    getattr(sys.modules[__name__], TEXT_APPEARANCE_HOOKS[hook_name]),
+                    val=value,
+                )
+            )
+            if text_appearance_index is None:
+                text_appearance_index = len(result)
+                result.append(None)
+        elif hook_name in FIELD_FLAG_HOOKS:
+            flag = FIELD_FLAG_HOOKS[hook_name][0]
+            if value:
+                set_mask |= flag
+            else:
+                clear_mask |= flag
+            if flag_index is None:
+                flag_index = len(result)
+                result.append(None)
+        else:
+            result.append(partial(getattr(sys.modules[__name__], hook_name), val=value))
+
+    if text_appearance_index is not None:
+        text_appearances = {}
+
+        def update_text_appearance(annot: DictionaryObject) -> None:
+            text_appearance = _get_text_appearance(annot)
+            if text_appearance not in text_appearances:
+                new_text_appearance = text_appearance
+                for each in text_appearance_updates:
+                    new_text_appearance = each(new_text_appearance)
+                text_appearances[text_appearance] = new_text_appearance
+            _set_text_appearance(annot, text_appearances[text_appearance])
+
+        result[text_appearance_index] = update_text_appearance
+
+    if flag_index is not None:
+        result[flag_index] = partial(
+            _update_field_flags, set_mask=set_mask, clear_mask=clear_mask
+        )
+
+    return result
+
+
+def _update_field_flags(
+    annot: DictionaryObject, set_mask: int, clear_mask: int = 0
+) -> None:
+    """
+    Sets and unsets bit flags for a form field annotation in a single write.
 
     This internal helper function modifies the 'Ff' (field flags) entry in the
     annotation dictionary or, for child annotations whose field flags live on the
-    parent, the parent dictionary. It preserves all other bits while setting or
-    unsetting the requested flag.
+    parent, the parent dictionary. It preserves all bits outside of the two masks.
 
     Args:
         annot (DictionaryObject): The annotation dictionary for the form field.
-        flag (int): The bit flag to set or unset.
-        should_set (bool): True to set the flag, False to unset it.
+        set_mask (int): The bit flags to set.
+        clear_mask (int): The bit flags to unset.
     """
     # Ff in annot[Parent] only in hooks.py, or when editing instead of retrieving
     if Parent in annot and (Ff in annot[Parent] or Ff not in annot):
         annot[NameObject(Parent)][NameObject(Ff)] = NumberObject(
-            (
-                int(annot[NameObject(Parent)].get(NameObject(Ff), 0)) | flag
-                if should_set
-                else int(annot[NameObject(Parent)].get(NameObject(Ff), 0)) & ~flag
-            )
+            (int(annot[NameObject(Parent)].get(NameObject(Ff), 0)) | set_mask)
+            & ~clear_mask
         )
     else:
         annot[NameObject(Ff)] = NumberObject(
-            (
-                int(annot.get(NameObject(Ff), 0)) | flag
-                if should_set
-                else int(annot.get(NameObject(Ff), 0)) & ~flag
-            )
+            (int(annot.get(NameObject(Ff), 0)) | set_mask) & ~clear_mask
         )
 
 
+def _update_field_flag(annot: DictionaryObject, flag: int, should_set: bool) -> None:
+    """
+    Sets or unsets a bit flag for a form field annotation.
+
+    Args:
+        annot (DictionaryObject): The annotation dictionary for the form field.
+        flag (int): The bit flag to set or unset.
+        should_set (bool): True to set the flag, False to unset it.
+    """
+    if should_set:
+        _update_field_flags(annot, flag)
+    else:
+        _update_field_flags(annot, 0, flag)
+
+
+def _get_text_appearance(annot: DictionaryObject) -> str:
+    """
+    Gets the default appearance (DA) string that applies to an annotation.
+
+    Child annotations without their own DA inherit the one of their parent.
+
+    Args:
+        annot (DictionaryObject): The annotation dictionary for the form field.
+
+    Returns:
+        str: The default appearance string of the field.
+    """
+    if Parent in annot and DA not in annot:
+        return cast(str, annot[Parent][DA])
+    return cast(str, annot[DA])
+
+
+def _set_text_appearance(annot: DictionaryObject, text_appearance: str) -> None:
+    """
+    Sets the default appearance (DA) string where `_get_text_appearance` found it.
+
+    Args:
+        annot (DictionaryObject): The annotation dictionary for the form field.
+        text_appearance (str): The new default appearance string.
+    """
+    if Parent in annot and DA not in annot:
+        annot[NameObject(Parent)][NameObject(DA)] = TextStringObject(text_appearance)
+    else:
+        annot[NameObject(DA)] = TextStringObject(text_appearance)
+
+
+def _replace_text_appearance_font(text_appearance: str, val: str) -> str:
+    """
+    Replaces the font resource name in a default appearance string.
+
+    Args:
+        text_appearance (str): The default appearance string.
+        val (str): The new font resource name, starting with "/".
+
+    Returns:
+        str: The updated default appearance string.
+    """
+    tokens = text_appearance.split(" ")
+
+    index_to_update = 0
+    for i, each in enumerate(tokens):
+        if each.startswith("/"):
+            index_to_update = i
+            break
+
+    tokens[index_to_update] = val
+    return " ".join(tokens)
+
+
+def _replace_text_appearance_font_size(text_appearance: str, val: float) -> str:
+    """
+    Replaces the font size in a default appearance string.
+
+    Args:
+        text_appearance (str): The default appearance string.
+        val (float): The new font size.
+
+    Returns:
+        str: The updated default appearance string.
+    """
+    tokens = text_appearance.split(" ")
+    font_size_index = 0
+    for i, value in enumerate(tokens):
+        if value.startswith(FONT_SIZE_IDENTIFIER):
+            font_size_index = i - 1
+            break
+
+    tokens[font_size_index] = str(val)
+    return " ".join(tokens)
+
+
+def _replace_text_appearance_font_color(text_appearance: str, val: tuple) -> str:
+    """
+    Replaces the font color in a default appearance string.
+
+    Everything after the font size operator is dropped and replaced with the
+    new RGB color operator.
+
+    Args:
+        text_appearance (str): The default appearance string.
+        val (tuple): The new font color as an RGB tuple.
+
+    Returns:
+        str: The updated default appearance string.
+    """
+    tokens = text_appearance.split(" ")
+    font_size_identifier_index = 0
+    for i, value in enumerate(tokens):
+        if value == FONT_SIZE_IDENTIFIER:
+            font_size_identifier_index = i
+            break
+
+    new_text_appearance = (
+        tokens[:font_size_identifier_index]
+        + [FONT_SIZE_IDENTIFIER]
+        + [str(each) for each in val]
+    )
+    return " ".join(new_text_appearance) + FONT_COLOR_IDENTIFIER
+
+
 def update_text_field_font(annot: DictionaryObject, val: str) -> None:
     """
     Updates the font of a text field annotation.
@@ -156,28 +453,10 @@ def update_text_field_font(annot: DictionaryObject, val: str) -> None:
     """
     if not val.startswith("/"):
         return
-    if Parent in annot and DA not in annot:
-        text_appearance = annot[Parent][DA]
-    else:
-        text_appearance = annot[DA]
 
-    text_appearance = text_appearance.split(" ")
-
-    index_to_update = 0
-    for i, each in enumerate(text_appearance):
-        if each.startswith("/"):
-            index_to_update = i
-            break
-
-    text_appearance[index_to_update] = val
-    new_text_appearance = " ".join(text_appearance)
-
-    if Parent in annot and DA not in annot:
-        annot[NameObject(Parent)][NameObject(DA)] = TextStringObject(
-            new_text_appearance
-        )
-    else:
-        annot[NameObject(DA)] = TextStringObject(new_text_appearance)
+    _set_text_appearance(
+        annot, _replace_text_appearance_font(_get_text_appearance(annot), val)
+    )
 
 
 def update_text_field_font_size(annot: DictionaryObject, val: float) -> None:
@@ -191,27 +470,9 @@ def update_text_field_font_size(annot: DictionaryObject, val: float) -> None:
         annot (DictionaryObject): The annotation dictionary for the text field.
         val (float): The new font size to use for the text field.
     """
-    if Parent in annot and DA not in annot:
-        text_appearance = annot[Parent][DA]
-    else:
-        text_appearance = annot[DA]
-
-    text_appearance = text_appearance.split(" ")
-    font_size_index = 0
-    for i, value in enumerate(text_appearance):
-        if value.startswith(FONT_SIZE_IDENTIFIER):
-            font_size_index = i - 1
-            break
-
-    text_appearance[font_size_index] = str(val)
-    new_text_appearance = " ".join(text_appearance)
-
-    if Parent in annot and DA not in annot:
-        annot[NameObject(Parent)][NameObject(DA)] = TextStringObject(
-            new_text_appearance
-        )
-    else:
-        annot[NameObject(DA)] = TextStringObject(new_text_appearance)
+    _set_text_appearance(
+        annot, _replace_text_appearance_font_size(_get_text_appearance(annot), val)
+    )
 
 
 def update_text_field_font_color(annot: DictionaryObject, val: tuple) -> None:
@@ -225,31 +486,9 @@ def update_text_field_font_color(annot: DictionaryObject, val: tuple) -> None:
         annot (DictionaryObject): The annotation dictionary for the text field.
         val (tuple): The new font color as an RGB tuple (e.g., (1, 0, 0) for red).
     """
-    if Parent in annot and DA not in annot:
-        text_appearance = annot[Parent][DA]
-    else:
-        text_appearance = annot[DA]
-
-    text_appearance = text_appearance.split(" ")
-    font_size_identifier_index = 0
-    for i, value in enumerate(text_appearance):
-        if value == FONT_SIZE_IDENTIFIER:
-            font_size_identifier_index = i
-            break
-
-    new_text_appearance = (
-        text_appearance[:font_size_identifier_index]
-        + [FONT_SIZE_IDENTIFIER]
-        + [str(each) for each in val]
+    _set_text_appearance(
+        annot, _replace_text_appearance_font_color(_get_text_appearance(annot), val)
     )
-    new_text_appearance = " ".join(new_text_appearance) + FONT_COLOR_IDENTIFIER
-
-    if Parent in annot and DA not in annot:
-        annot[NameObject(Parent)][NameObject(DA)] = TextStringObject(
-            new_text_appearance
-        )
-    else:
-        annot[NameObject(DA)] = TextStringObject(new_text_appearance)
 
 
 def update_text_field_alignment(annot: DictionaryObject, val: int) -> None:
@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+"""
+Module for saving changes to a PDF as an incremental update.
+
+Filling a form or triggering widget hooks usually changes a handful of
+annotations, yet rewriting the document with a `PdfWriter` clones every page,
+content stream, and font of it. Instead, these operations edit the annotations
+through an `UpdateReader`, which only loads the objects that are accessed, and
+append the objects that changed to the original stream together with a new
+cross-reference section. The cost of an update therefore depends on the
+number of changed widgets rather than on the length of the document.
+
+The snapshots an `UpdateReader` takes of the objects it loads are shared by
+every reader opened on the same stream. Later readers, such as the ones that
+fill each fork of a `PdfWrapper`, parse the objects they need from these
+snapshots instead of decoding the object streams of the document again.
+
+The appended section follows the PDF incremental update layout: changed
+objects keep their object numbers, and the new trailer points back to the
+previous cross-reference section through `/Prev`. The update is kept in the
+output unless the document is rewritten anyway, as it is when the AcroForm
+fields of its widgets are rebuilt. Encrypted documents are still rewritten by a `PdfWriter`,
+since the appended objects would have to be encrypted as well.
+"""
+
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple, cast
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.errors import PdfReadError
+from pypdf.generic import (
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    PdfObject,
+    create_string_object,
+    read_object,
+)
+
+from .adapter import stream_to_f_obj
+from .constants import ID, Info, Prev, Root, Size
+from .index import carry_widget_annotation_index
+from .utils import stream_cache
+
+STARTXREF = b"startxref"
+STARTXREF_SEARCH_SIZE = 1024
+
+
+def _serialize(obj: PdfObject) -> bytes:
+    """
+    Serializes a PDF object the way it is written into a PDF file.
+
+    Args:
+        obj (PdfObject): The PDF object to serialize.
+
+    Returns:
+        bytes: The serialized object.
+    """
+    with BytesIO() as f:
+        obj.write_to_stream(f)
+        return f.getvalue()
+
+
+@stream_cache
+def _get_loaded_objects(
+    pdf: bytes,  # pylint: disable=W0613
+) -> Dict[Tuple[int, int], bytes]:
+    """
+    Gets the object snapshots shared by the readers of a PDF stream.
+
+    Args:
+        pdf (bytes): The PDF stream.
+
+    Returns:
+        Dict[Tuple[int, int], bytes]: The serialized content of each loaded
+            object by its generation and object number. The dictionary is
+            shared by every call for the same stream.
+    """
+    return {}
+
+
+class UpdateReader(PdfReader):
+    """
+    A `PdfReader` that remembers every object it loads as it was in the file.
+
+    Objects are loaded lazily, so the snapshots only cover the objects an
+    operation actually accesses, and comparing them with the current objects
+    finds the changes without parsing the document again. The snapshots are
+    shared with the other readers of the same stream, which load objects from
+    them when they can.
+    """
+
+    def __init__(self, pdf: bytes, strict: bool = False) -> None:
+        """
+        Opens a reader on a PDF stream.
+
+        Args:
+            pdf (bytes): The PDF stream to read.
+            strict (bool): Whether to open the stream in pypdf's strict mode.
+                Defaults to False.
+        """
+        self.loaded = _get_loaded_objects(pdf)
+        super().__init__(stream_to_f_obj(pdf), strict=strict)
+
+    def cache_get_indirect_object(
+        self, generation: int, idnum: int
+    ) -> Optional[PdfObject]:
+        """
+        Gets a loaded object, loading it from its snapshot if there is one.
+
+        Snapshots of encrypted documents hold decrypted objects, so they are
+        only used to find changes.
+
+        Args:
+            generation (int): The generation number of the object.
+            idnum (int): The object number of the object.
+
+        Returns:
+            Optional[PdfObject]: The object, or None if it is not loaded yet.
+        """
+        result = super().cache_get_indirect_object(generation, idnum)
+        content = self.loaded.get((generation, idnum))
+        if result is None and content is not None and not self.is_encrypted:
+            result = super().cache_indirect_object(
+                generation, idnum, read_object(BytesIO(content), self)
+            )
+
+        return result
+
+    def cache_indirect_object(
+        self, generation: int, idnum: int, obj: Optional[PdfObject]
+    ) -> Optional[PdfObject]:
+        """
+        Caches a loaded object, remembering its serialized content.
+
+        Args:
+            generation (int): The generation number of the object.
+            idnum (int): The object number of the object.
+            obj (Optional[PdfObject]): The loaded object.
+
+        Returns:
+            Optional[PdfObject]: The cached object.
+        """
+        if obj is not None and (generation, idnum) not in self.loaded:
+            self.loaded[(generation, idnum)] = _serialize(obj)
+
+        return super().cache_indirect_object(generation, idnum, obj)
+
+    def add_object(self, obj: PdfObject) -> IndirectObject:
+        """
+        Adds a new object, numbered after every existing object.
+
+        Args:
+            obj (PdfObject): The object to add.
+
+        Returns:
+            IndirectObject: The reference to the added object.
+        """
+        idnum = max(
+            [int(self.trailer.get(Size, 0))]
+            + [idnum + 1 for _, idnum in self.resolved_objects]
+        )
+        self.resolved_objects[(0, idnum)] = obj
+        obj.indirect_reference = IndirectObject(idnum, 0, self)
+
+        return obj.indirect_reference
+
+    def add_metadata(self, infos: dict) -> None:
+        """
+        Sets document information entries, like `PdfWriter.add_metadata`.
+
+        The `/Info` dictionary is created when the document does not have one.
+
+        Args:
+            infos (dict): The entries to set, whose values are stored as strings.
+        """
+        if Info in self.trailer:
+            info = cast(DictionaryObject, self.trailer[Info])
+        else:
+            info = DictionaryObject()
+            self.trailer[NameObject(Info)] = self.add_object(info)
+
+        for key, value in infos.items():
+            if isinstance(value, PdfObject):
+                value = value.get_object()
+            info[NameObject(key)] = create_string_object(str(value))
+
+    def get_changed_objects(self) -> List[Tuple[int, int, bytes]]:
+        """
+        Finds the loaded objects that were changed since they were loaded.
+
+        Returns:
+            List[Tuple[int, int, bytes]]: The object number, generation, and
+                serialized content of each changed object, ordered by object
+                number.
+        """
+        result = []
+        for (generation, idnum), obj in self.resolved_objects.items():
+            if obj is None:
+                continue
+            content = _serialize(obj)
+            if content != self.loaded.get((generation, idnum)):
+                result.append((idnum, generation, content))
+
+        return sorted(result)
+
+
+def add_object(out: UpdateReader | PdfWriter, obj: PdfObject) -> IndirectObject:
+    """
+    Adds a new object to a PDF opened with `open_for_update`.
+
+    Args:
+        out (UpdateReader | PdfWriter): The reader or writer to add the object to.
+        obj (PdfObject): The object to add.
+
+    Returns:
+        IndirectObject: The reference to the added object.
+    """
+    if isinstance(out, UpdateReader):
+        return out.add_object(obj)
+
+    return out._add_object(obj)  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+
+
+def open_reader(pdf: bytes) -> UpdateReader:
+    """
+    Opens a reader that parses only the trailers and cross-reference sections
+    of a PDF, leaving every object to be loaded on access.
+
+    The stream is first opened in strict mode, which skips the scan pypdf
+    otherwise makes over every cross-reference entry to repair broken tables.
+    Streams that need repairs are opened again in non-strict mode. Either way,
+    objects are then read leniently.
+
+    Args:
+        pdf (bytes): The PDF stream to read.
+
+    Returns:
+        UpdateReader: The reader.
+    """
+    try:
+        reader = UpdateReader(pdf, strict=True)
+    except PdfReadError:
+        reader = None
+
+    if reader is None or reader.xref_index:
+        reader = UpdateReader(pdf)
+    reader.strict = False
+
+    return reader
+
+
+def open_for_update(pdf: bytes) -> UpdateReader | PdfWriter:
+    """
+    Opens a PDF for changes that are saved with `save_update`.
+
+    Args:
+        pdf (bytes): The PDF stream to change.
+
+    Returns:
+        UpdateReader | PdfWriter: A reader opened with `open_reader`, or a
+            writer cloning the whole document when it is empty or encrypted.
+    """
+    if not pdf:
+        return PdfWriter(stream_to_f_obj(pdf))
+
+    reader = open_reader(pdf)
+    if reader.is_encrypted:
+        return PdfWriter(stream_to_f_obj(pdf))
+
+    return reader
+
+
+def save_update(
+    pdf: bytes,
+    out: UpdateReader | PdfWriter,
+    use_full_widget_name: Optional[bool] = None,
+) -> bytes:
+    """
+    Saves the changes made to a PDF opened with `open_for_update`.
+
+    Args:
+        pdf (bytes): The PDF stream that was opened.
+        out (UpdateReader | PdfWriter): The reader or writer the changes were
+            made through.
+        use_full_widget_name (Optional[bool]): Whether the widget index used
+            to locate the changes uses full widget names, or None when the
+            changes were not located through the widget index.
+
+    Returns:
+        bytes: The updated PDF stream.
+    """
+    if isinstance(out, UpdateReader):
+        return write_incremental_update(pdf, out, use_full_widget_name)
+
+    with BytesIO() as f:
+        out.write(f)
+        f.seek(0)
+        return f.read()
+
+
+def _get_startxref(pdf: bytes) -> int:
+    """
+    Reads the offset of the last cross-reference section of a PDF.
+
+    The last `startxref` keyword is searched for in a growing tail of the
+    stream, so a stream spilled to disk is not read in full.
+
+    Args:
+        pdf (bytes): The PDF stream.
+
+    Returns:
+        int: The offset after the last `startxref` keyword.
+    """
+    size = STARTXREF_SEARCH_SIZE
+    while True:
+        tail = bytes(pdf[-size:])
+        if STARTXREF in tail or size >= len(pdf):
+            return int(tail[tail.rindex(STARTXREF) + len(STARTXREF) :].split()[0])
+        size *= 2
+
+
+def write_incremental_update(
+    pdf: bytes, reader: UpdateReader, use_full_widget_name: Optional[bool] = None
+) -> bytes:
+    """
+    Appends the objects changed through a reader to a PDF as an incremental update.
+
+    The update must not add, remove, or reorder annotations, which lets the
+    widget index of the original stream be carried forward to the result.
+    New objects are written like changed ones, and so are the `/Root` and
+    `/Info` entries of the reader's trailer.
+
+    Args:
+        pdf (bytes): The PDF stream the reader was opened on.
+        reader (UpdateReader): The reader the changes were made through.
+        use_full_widget_name (Optional[bool]): Whether the widget index used
+            to locate the changes uses full widget names, or None to not carry
+            the index forward.
+
+    Returns:
+        bytes: The updated PDF stream, or the original one when nothing changed.
+    """
+    changed = reader.get_changed_objects()
+    if not changed:
+        return pdf
+
+    prev = _get_startxref(pdf)
+
+    with BytesIO() as f:
+        f.write(pdf)
+        if pdf[-1:] != b"\n":
+            f.write(b"\n")
+
+        offsets = []
+        for idnum, generation, content in changed:
+            offsets.append((idnum, generation, f.tell()))
+            f.write(b"%d %d obj\n" % (idnum, generation))
+            f.write(content)
+            f.write(b"\nendobj\n")
+
+        xref = f.tell()
+        # starts with the head of the free list, as readers expect a table
+        # whose first subsection is not object 0 to be misnumbered
+        f.write(b"xref\n0 1\n0000000000 65535 f\r\n")
+        for idnum, generation, offset in offsets:
+            f.write(b"%d 1\n%010d %05d n\r\n" % (idnum, offset, generation))
+
+        trailer = DictionaryObject(
+            {
+                NameObject(Size): NumberObject(
+                    max(int(reader.trailer[Size]), changed[-1][0] + 1)
+                ),
+                NameObject(Root): reader.trailer.raw_get(Root),
+                NameObject(Prev): NumberObject(prev),
+            }
+        )
+        for key in (Info, ID):
+            if key in reader.trailer:
+                trailer[NameObject(key)] = reader.trailer.raw_get(key)
+
+        f.write(b"trailer\n")
+        trailer.write_to_stream(f)
+        f.write(b"\n%s\n%d\n%%%%EOF\n" % (STARTXREF, xref))
+
+        result = f.getvalue()
+
+    if use_full_widget_name is not None:
+        carry_widget_annotation_index(pdf, result, use_full_widget_name)
+    return result
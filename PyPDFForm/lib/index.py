@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Module for indexing widget annotations by their keys.
+
+Most operations in PyPDFForm only touch a handful of widgets, yet locating
+them used to require resolving the key of every annotation on every page. This
+module builds a reusable index from widget key to annotation location, cached
+per PDF stream, so that filling, hook triggering, widget removal, key updates,
+AcroForm rebuilding, and widget copying can jump directly to the annotations
+they affect.
+
+Locations are expressed as zero-based `(page index, annotation index)` pairs
+into each page's `/Annots` array. Because a `PdfWriter` created from the same
+stream preserves page and annotation order, the locations are valid for any
+reader or writer opened on the indexed stream.
+
+An incremental update that only changes annotation values keeps every
+annotation at its location, so the index of the original stream is carried
+forward to the updated one instead of being rebuilt.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from pypdf import PdfReader, PdfWriter
+
+from .adapter import stream_to_f_obj
+from .constants import Annots, Count, Kids, Pages, Root
+from .patterns import get_widget_key
+from .utils import stream_cache
+
+
+@stream_cache
+def _get_carried_indexes(
+    pdf: bytes,  # pylint: disable=W0613
+) -> Dict[bool, Dict[str, Tuple[Tuple[int, int], ...]]]:
+    """
+    Gets the widget indexes carried to a PDF stream from the stream it updates.
+
+    Args:
+        pdf (bytes): The PDF stream.
+
+    Returns:
+        Dict[bool, Dict[str, Tuple[Tuple[int, int], ...]]]: The carried indexes
+            by whether they use full widget names. The dictionary is shared by
+            every call for the same stream.
+    """
+    return {}
+
+
+@stream_cache
+def get_widget_annotation_index(
+    pdf: bytes, use_full_widget_name: bool
+) -> Dict[str, Tuple[Tuple[int, int], ...]]:
+    """
+    Builds an index from widget key to the locations of its annotations.
+
+    Every annotation on every page is resolved exactly once per distinct PDF
+    stream. When full widget names are used, parent names are memoized for
+    the whole pass so shared `/Parent` chains are only walked once.
+    Annotations without a key, such as links, are not indexed. Each key maps
+    to all of its annotation locations in document order, which keeps radio
+    groups and duplicated field names intact.
+
+    Args:
+        pdf (bytes): The PDF stream to index.
+        use_full_widget_name (bool): Whether to index widgets by their full
+            names, including parent names.
+
+    Returns:
+        Dict[str, Tuple[Tuple[int, int], ...]]: A mapping from widget key to
+            zero-based `(page index, annotation index)` pairs.
+    """
+    carried = _get_carried_indexes(pdf).pop(use_full_widget_name, None)
+    if carried is not None:
+        return carried
+
+    result = defaultdict(list)
+    if pdf:
+        reader = PdfReader(stream_to_f_obj(pdf))
+        name_cache = {}
+        for page_index, page in enumerate(reader.pages):
+            for annot_index, annot in enumerate(page.get(Annots, [])):
+                key = get_widget_key(
+                    annot.get_object(), use_full_widget_name, name_cache
+                )
+                if key is not None:
+                    result[key].append((page_index, annot_index))
+
+    return {key: tuple(locations) for key, locations in result.items()}
+
+
+def carry_widget_annotation_index(
+    pdf: bytes, updated: bytes, use_full_widget_name: bool
+) -> None:
+    """
+    Reuses the widget index of a PDF stream for an incremental update of it.
+
+    The carried index is handed to `get_widget_annotation_index` the first time
+    the updated stream is indexed. It is kept in a stream cache like the index
+    itself, so updates that are never indexed do not accumulate.
+
+    Args:
+        pdf (bytes): The indexed PDF stream.
+        updated (bytes): The updated PDF stream, whose annotations are at the
+            same locations as those of `pdf`.
+        use_full_widget_name (bool): Whether the index uses full widget names.
+    """
+    if updated == pdf:
+        return
+
+    _get_carried_indexes(updated)[use_full_widget_name] = get_widget_annotation_index(
+        pdf, use_full_widget_name
+    )
+
+
+def get_page(pdf: PdfReader | PdfWriter, page_index: int) -> Any:
+    """
+    Gets a page of a PDF by its index.
+
+    A reader descends its page tree using the `/Count` of each intermediate
+    node, so only the nodes on the path to the page are resolved instead of
+    every page of the document. A malformed page tree falls back to the
+    reader's flattened page list.
+
+    Args:
+        pdf (PdfReader | PdfWriter): The reader or writer to get the page from.
+        page_index (int): The zero-based index of the page.
+
+    Returns:
+        Any: The page dictionary.
+    """
+    if isinstance(pdf, PdfWriter):
+        return pdf.pages[page_index]
+
+    node = pdf.trailer[Root][Pages]
+    remaining = page_index
+    while Kids in node:
+        for kid in node[Kids]:
+            kid = kid.get_object()
+            count = int(kid.get(Count, 1)) if Kids in kid else 1
+            if remaining < count:
+                node = kid
+                break
+            remaining -= count
+        else:
+            return pdf.pages[page_index]
+
+    return node
+
+
+def get_widget_locations(
+    pdf: bytes, keys: Iterable[str], use_full_widget_name: bool
+) -> Dict[int, List[Tuple[int, str]]]:
+    """
+    Looks up the annotations of the given widget keys, grouped by page.
+
+    Pages and annotations are returned in document order so callers that
+    depend on annotation order, such as radio option tracking or drawing order,
+    behave exactly as if they had walked every page themselves.
+
+    Args:
+        pdf (bytes): The PDF stream the locations refer to.
+        keys (Iterable[str]): The widget keys to look up. Unknown keys are ignored.
+        use_full_widget_name (bool): Whether the keys are full widget names,
+            including parent names.
+
+    Returns:
+        Dict[int, List[Tuple[int, str]]]: A mapping from zero-based page index
+            to sorted `(annotation index, widget key)` pairs on that page.
+    """
+    index = get_widget_annotation_index(pdf, use_full_widget_name)
+
+    result = defaultdict(list)
+    for key in set(keys):
+        for page_index, annot_index in index.get(key, ()):
+            result[page_index].append((annot_index, key))
+
+    return {page_index: sorted(result[page_index]) for page_index in sorted(result)}
+
+
+def iter_widget_annotations(
+    writer: PdfReader | PdfWriter, locations: Dict[int, List[Tuple[int, str]]]
+) -> Iterator[Tuple[int, Any, str]]:
+    """
+    Iterates over the annotations at the given locations.
+
+    Only pages that contain located annotations are visited, and a reader
+    does not load any other page. The yielded
+    annotation is the raw entry of the page's `/Annots` array, which callers
+    resolve with `get_object` when they need the dictionary.
+
+    Args:
+        writer (PdfReader | PdfWriter): The reader or writer opened on the
+            stream the locations were computed from.
+        locations (Dict[int, List[Tuple[int, str]]]): Locations returned by
+            `get_widget_locations`.
+
+    Yields:
+        Tuple[int, Any, str]: The zero-based page index, the annotation entry,
+            and its widget key.
+    """
+    for page_index, page_locations in locations.items():
+        annots = get_page(writer, page_index).get(Annots, [])
+        for annot_index, key in page_locations:
+            yield page_index, annots[annot_index], key
@@ -54,6 +54,8 @@ class Widget:
             "on_blurred_javascript": "update_field_on_blurred_javascript",
         }
         self.attr_set_tracker = {}
+        # attribute values known to match every annotation of the field
+        self.pdf_state = {}
 
         self._name = name
         self._value = value
@@ -88,6 +90,13 @@ class Widget:
         tracks existing attributes that were explicitly set so those values can be
         preserved across widget-cache rebuilds.
 
+        Queued hooks are coalesced so each attribute keeps at most one pending
+        hook, updated in place with its latest value so hooks keep the order in
+        which their attributes were first set. Setting an attribute to the value
+        recorded in `pdf_state`, which only holds values known to match every
+        annotation of the field, drops the pending hook instead of queuing a
+        no-op.
+
         Args:
             name (str): The name of the attribute.
             value (Any): The value of the attribute.
@@ -97,7 +106,18 @@ class Widget:
             and name in self.SET_ATTR_TRIGGER_HOOK_MAP
             and value is not None
         ):
-            self.hooks_to_trigger.append((self.SET_ATTR_TRIGGER_HOOK_MAP[name], value))
+            hook_name = self.SET_ATTR_TRIGGER_HOOK_MAP[name]
+            no_op = name in self.pdf_state and self.pdf_state[name] == value
+            for i, hook in enumerate(self.hooks_to_trigger):
+                if hook[0] == hook_name:
+                    if no_op:
+                        del self.hooks_to_trigger[i]
+                    else:
+                        self.hooks_to_trigger[i] = (hook_name, value)
+                    break
+            else:
+                if not no_op:
+                    self.hooks_to_trigger.append((hook_name, value))
 
         if (
             hasattr(self, "attr_set_tracker")
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+Module for counting and extracting the pages of a PDF.
+
+Counting the pages of a PDF or extracting a few of them does not need the
+rest of the document. The PDF is opened with `open_reader`, which only parses
+its trailers and cross-reference sections, the page count is read from the
+root of the page tree, and each extracted page is found by descending the page
+tree, so the cost does not grow with the number of pages in the PDF.
+"""
+
+from io import BytesIO
+from typing import Any, List, Sequence, Set, Tuple, cast
+
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject
+
+from .constants import (
+    DA,
+    DR,
+    FT,
+    INHERITABLE_PAGE_ATTRIBUTES,
+    SLASH,
+    AcroForm,
+    Annots,
+    Count,
+    Fields,
+    Font,
+    Kids,
+    Pages,
+    Parent,
+    Root,
+    Subtype,
+    Widget,
+)
+from .incremental import open_reader
+from .index import get_page
+from .utils import stream_cache
+
+
+def get_page_count(pdf: bytes) -> int:
+    """
+    Counts the pages of a PDF.
+
+    Args:
+        pdf (bytes): The PDF as a bytes stream.
+
+    Returns:
+        int: The number of pages in the PDF.
+    """
+    return count_pages(open_reader(pdf))
+
+
+def count_pages(reader: PdfReader) -> int:
+    """
+    Counts the pages of an opened PDF.
+
+    The count is read from the root of the page tree. A page tree without a
+    valid count falls back to counting the pages of the flattened tree.
+
+    Args:
+        reader (PdfReader): The reader of the PDF.
+
+    Returns:
+        int: The number of pages in the PDF.
+    """
+    count = reader.trailer[Root][Pages].get(Count)
+    if isinstance(count, int) and count >= 0:
+        return int(count)
+
+    return len(reader.pages)
+
+
+def _get_page_object(reader: PdfReader, page_index: int) -> PageObject:
+    """
+    Gets a page of a PDF with the attributes it inherits from the page tree.
+
+    Args:
+        reader (PdfReader): The reader of the PDF.
+        page_index (int): The zero-based index of the page.
+
+    Returns:
+        PageObject: The page, with its inherited attributes set on it like in
+            `PdfReader.pages`.
+    """
+    page = get_page(reader, page_index)
+    result = PageObject(reader, page.indirect_reference)
+    result.update(page)
+
+    node = page
+    while Parent in node:
+        node = node[Parent]
+        for key in INHERITABLE_PAGE_ATTRIBUTES:
+            if key in node and key not in result:
+                result[NameObject(key)] = node.raw_get(key)
+
+    return result
+
+
+def _prune_kids(annots: List[Any]) -> List[Tuple[DictionaryObject, Any]]:
+    """
+    Removes the kids that are not extracted from the fields of extracted widgets.
+
+    Cloning a widget also clones its parent field, and with it every kid of the
+    field. When a field has widgets on other pages, those widgets and, through
+    their `/P` entries, their pages would be copied too.
+
+    Args:
+        annots (List[Any]): The annotations on the extracted pages.
+
+    Returns:
+        List[Tuple[DictionaryObject, Any]]: The changed fields with their
+            original kids, to be restored once the widgets are cloned.
+    """
+    keep = set()
+    parents = {}
+    for annot in annots:
+        if isinstance(annot, IndirectObject):
+            keep.add(annot.idnum)
+        obj = cast(DictionaryObject, annot.get_object())
+        while Parent in obj and isinstance(obj.raw_get(Parent), IndirectObject):
+            parent = obj.raw_get(Parent)
+            keep.add(parent.idnum)
+            obj = parents[parent.idnum] = cast(DictionaryObject, parent.get_object())
+
+    result = []
+    for parent in parents.values():
+        if Kids in parent:
+            result.append((parent, parent.raw_get(Kids)))
+            parent[NameObject(Kids)] = ArrayObject(
+                kid
+                for kid in parent[Kids]
+                if isinstance(kid, IndirectObject) and kid.idnum in keep
+            )
+
+    return result
+
+
+def _get_default_appearance_fonts(obj: DictionaryObject) -> List[str]:
+    """
+    Gets the names of the fonts selected by the default appearance string of a
+    form object.
+
+    Args:
+        obj (DictionaryObject): A field, widget, or AcroForm dictionary.
+
+    Returns:
+        List[str]: The font resource names, e.g. `["/Helv"]`.
+    """
+    return [each for each in str(obj.get(DA, "")).split() if each.startswith(SLASH)]
+
+
+def _extract_acro_form(
+    writer: PdfWriter,
+    acro_form: DictionaryObject,
+    fields: List[IndirectObject],
+    font_names: Set[str],
+) -> DictionaryObject:
+    """
+    Builds the AcroForm of a PDF of extracted pages.
+
+    The default appearance of the source form is kept, and its default resources
+    are kept with only the fonts named in `font_names`, so unused embedded fonts
+    are not copied along.
+
+    Args:
+        writer (PdfWriter): The writer of the extracted pages.
+        acro_form (DictionaryObject): The AcroForm of the source PDF.
+        fields (List[IndirectObject]): The top-level fields of the extracted
+            widgets.
+        font_names (Set[str]): The font resource names used by the extracted
+            widgets.
+
+    Returns:
+        DictionaryObject: The new AcroForm dictionary.
+    """
+    result = DictionaryObject({NameObject(Fields): ArrayObject(fields)})
+    if DA in acro_form:
+        result[NameObject(DA)] = acro_form.raw_get(DA).clone(writer)
+
+    if DR in acro_form:
+        fonts = acro_form[DR].get(Font, DictionaryObject())
+        resources = DictionaryObject(
+            {NameObject(k): v for k, v in acro_form[DR].items() if k != Font}
+        )
+        resources[NameObject(Font)] = DictionaryObject(
+            {NameObject(k): v for k, v in fonts.items() if k in font_names}
+        )
+        result[NameObject(DR)] = resources.clone(writer)
+
+    return result
+
+
+def write_pages(reader: PdfReader, page_nums: Sequence[int]) -> PdfWriter:
+    """
+    Copies a selection of pages of an opened PDF into a new writer.
+
+    The pages are copied in the given order. Their widgets are cloned along
+    with them and registered as the fields of a new AcroForm, which also keeps
+    the source form's default appearance and the font resources the widgets
+    use. Only the selected pages are loaded and copied, so the cost does not
+    grow with the number of pages in the source PDF. Fields with widgets on
+    other pages keep only their extracted widgets as kids. The reader is left
+    unchanged, so it can be used for more selections.
+
+    Args:
+        reader (PdfReader): The reader of the source PDF.
+        page_nums (Sequence[int]): The zero-based indices of the pages to copy.
+
+    Returns:
+        PdfWriter: The writer of a PDF containing only the selected pages and
+            their widgets.
+    """
+    writer = PdfWriter()
+    acro_form = reader.root_object.get(AcroForm)
+    fields = {}
+    font_names = set(_get_default_appearance_fonts(acro_form or DictionaryObject()))
+
+    pages = [_get_page_object(reader, each) for each in page_nums]
+    pruned = _prune_kids([annot for page in pages for annot in page.get(Annots, [])])
+
+    # adds every page before cloning any widget, so the `/P` of a widget
+    # refers to its added page instead of cloning the page once more
+    output_pages = [writer.add_page(page, excluded_keys=(Annots,)) for page in pages]
+
+    try:
+        for page, output_page in zip(pages, output_pages, strict=True):
+            annots = ArrayObject(annot.clone(writer) for annot in page.get(Annots, []))
+            if not annots:
+                continue
+
+            output_page[NameObject(Annots)] = annots
+            for annot in annots:
+                field = annot
+                field_obj = annot.get_object()
+                font_names.update(_get_default_appearance_fonts(field_obj))
+                while Parent in field_obj:
+                    field = field_obj.raw_get(Parent)
+                    field_obj = field.get_object()
+                    font_names.update(_get_default_appearance_fonts(field_obj))
+                if isinstance(field, IndirectObject) and (
+                    field_obj.get(Subtype) == Widget or FT in field_obj
+                ):
+                    fields[field.idnum] = field
+    finally:
+        for parent, kids in pruned:
+            parent[NameObject(Kids)] = kids
+
+    if fields or acro_form is not None:
+        writer._root_object[NameObject(AcroForm)] = writer._add_object(  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+            _extract_acro_form(
+                writer,
+                acro_form or DictionaryObject(),
+                list(fields.values()),
+                font_names,
+            )
+        )
+
+    return writer
+
+
+@stream_cache
+def extract_pages(pdf: bytes, page_nums: Tuple[int, ...]) -> bytes:
+    """
+    Extracts a selection of pages from a PDF into a new PDF byte stream.
+
+    The pages are copied by `write_pages`.
+
+    Args:
+        pdf (bytes): The PDF as a bytes stream.
+        page_nums (Tuple[int, ...]): The zero-based indices of the pages to extract.
+
+    Returns:
+        bytes: A PDF containing only the selected pages and their widgets.
+    """
+    with BytesIO() as f:
+        write_pages(open_reader(pdf), page_nums).write(f)
+        f.seek(0)
+        return f.read()
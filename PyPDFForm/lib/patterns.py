@@ -184,7 +184,9 @@ def check_field_flag(annot: DictionaryObject, flag: int) -> bool:
     return bool(int(annot[NameObject(Ff)] if Ff in annot else 0) & flag)
 
 
-def get_widget_key(widget: dict, use_full_widget_name: bool) -> str:
+def get_widget_key(
+    widget: dict, use_full_widget_name: bool, name_cache: dict | None = None
+) -> str:
     """
     Extracts the widget key from a widget dictionary.
 
@@ -193,10 +195,18 @@ def get_widget_key(widget: dict, use_full_widget_name: bool) -> str:
     constructs the full widget name by concatenating parent and child names with
     dots, while handling child annotations that inherit the parent name.
 
+    Hierarchical forms share parent fields between many kids, so callers that
+    resolve every annotation of one document can pass the same `name_cache` to
+    each call. Resolved parent names are then memoized per indirect object and
+    each `/Parent` chain is walked at most once per pass.
+
     Args:
         widget (dict): The widget dictionary to extract the key from.
         use_full_widget_name (bool): Whether to use the full widget name
             (including parent names) as the widget key.
+        name_cache (dict | None): A cache of resolved parent names shared
+            within a single document pass. Defaults to None, which disables
+            memoization.
 
     Returns:
         str: The extracted widget key.
@@ -210,16 +220,46 @@ def get_widget_key(widget: dict, use_full_widget_name: bool) -> str:
         and T in widget[Parent].get_object()
         and widget[Parent].get_object()[T] != key  # sejda case
     ):
+        parent_key = _get_parent_widget_key(widget[Parent].get_object(), name_cache)
         if key is None:
-            return get_widget_key(widget[Parent].get_object(), use_full_widget_name)
+            return parent_key
 
-        return (
-            f"{get_widget_key(widget[Parent].get_object(), use_full_widget_name)}.{key}"
-        )
+        return f"{parent_key}.{key}"
 
     return key or ""
 
 
+def _get_parent_widget_key(parent: DictionaryObject, name_cache: dict | None) -> str:
+    """
+    Resolves the full widget name of a parent field, memoizing the result.
+
+    Parent fields loaded from a PDF carry their indirect reference, which is
+    used as the cache key. Direct parent dictionaries fall back to their object
+    identity, which is stable for the duration of a document pass.
+
+    Args:
+        parent (DictionaryObject): The resolved parent field dictionary.
+        name_cache (dict | None): The cache of resolved parent names, or None
+            to resolve without memoization.
+
+    Returns:
+        str: The full widget name of the parent field.
+    """
+    if name_cache is None:
+        return get_widget_key(parent, True)
+
+    indirect_reference = getattr(parent, "indirect_reference", None)
+    cache_key = (
+        (indirect_reference.idnum, indirect_reference.generation)
+        if indirect_reference is not None
+        else id(parent)
+    )
+    if cache_key not in name_cache:
+        name_cache[cache_key] = get_widget_key(parent, True, name_cache)
+
+    return name_cache[cache_key]
+
+
 def update_checkbox_value(annot: DictionaryObject, check: bool = False) -> None:
     """
     Updates the value of a checkbox annotation, setting it to checked or unchecked.
@@ -13,10 +13,14 @@ from .circle import RawCircle
 from .ellipse import RawEllipse
 from .image import RawImage
 from .line import RawLine
+from .overlay import RawOverlay
 from .rect import RawRectangle
+from .table import RawTable, RawTableColumn
 from .text import RawText
 
-RawTypes = RawText | RawImage | RawLine | RawRectangle | RawCircle | RawEllipse
+RawTypes = (
+    RawText | RawImage | RawLine | RawRectangle | RawCircle | RawEllipse | RawTable
+)
 
 
 @dataclass
@@ -34,3 +38,6 @@ class RawElements:
     RawRectangle = RawRectangle
     RawCircle = RawCircle
     RawEllipse = RawEllipse
+    RawOverlay = RawOverlay
+    RawTable = RawTable
+    RawTableColumn = RawTableColumn
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Contains the RawOverlay class, which pre-renders a list of raw elements so the
+same static content, such as headers, footers, logos, or stamps, can be drawn
+onto many PDFs without rendering it again for each one.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from pypdf import PdfReader
+
+from ..adapter import stream_to_f_obj
+from ..font import temporary_font_registration
+from ..watermark import create_watermarks_and_draw, flatten_to_draw
+
+if TYPE_CHECKING:
+    from . import RawTypes
+
+
+class RawOverlay:
+    """
+    Represents a reusable set of raw elements that is rendered once per page
+    size and then drawn onto any number of PDFs.
+
+    The elements are converted into drawing instructions when the overlay is
+    created, so later changes to them are not reflected. Rendered page
+    watermarks are cached by page number, page size, and the fonts registered
+    on the drawing `PdfWrapper`, so drawing the overlay onto documents with the
+    same page layout does not render anything again.
+    """
+
+    def __init__(self, elements: Sequence[RawTypes]) -> None:
+        """
+        Initializes a reusable overlay of raw elements.
+
+        Args:
+            elements: The raw elements to draw (e.g., [RawText(...), RawImage(...)]).
+        """
+        super().__init__()
+
+        self.elements = list(elements)
+        self._to_draw = flatten_to_draw([each.to_draw for each in self.elements])
+        self._page_numbers = {each["page_number"] for each in self._to_draw}
+        self._watermarks: Dict[tuple, bytes] = {}
+
+    def watermarks(
+        self,
+        pdf: bytes,
+        fonts: List[Tuple[str, bytes]],
+        workers: Optional[int] = None,
+    ) -> List[bytes]:
+        """
+        Gets the page-aligned watermarks of the overlay for a PDF.
+
+        Pages whose number, size, and fonts have been seen before reuse the
+        cached watermark. All other pages are rendered together in a single
+        pass and cached.
+
+        Args:
+            pdf: The PDF the overlay is drawn onto.
+            fonts: The fonts registered on the drawing `PdfWrapper`, as
+                (font name, TTF stream) pairs.
+            workers (Optional[int]): The maximum number of worker processes used
+                to render missing pages. Defaults to None.
+
+        Returns:
+            A list of watermark PDF streams, one per page, with `b""` for pages
+                the overlay has no elements on.
+        """
+        fonts_key = tuple(fonts)
+        keys = [
+            (
+                (i + 1, float(page.mediabox[2]), float(page.mediabox[3]), fonts_key)
+                if i + 1 in self._page_numbers
+                else None
+            )
+            for i, page in enumerate(PdfReader(stream_to_f_obj(pdf)).pages)
+        ]
+
+        missing = {key[0]: key for key in keys if key and key not in self._watermarks}
+        if missing:
+            with temporary_font_registration(fonts) as font_mapping:
+                rendered = create_watermarks_and_draw(
+                    pdf,
+                    [each for each in self._to_draw if each["page_number"] in missing],
+                    font_mapping,
+                    workers,
+                    fonts,
+                )
+            for page_number, key in missing.items():
+                self._watermarks[key] = rendered[page_number - 1]
+
+        return [self._watermarks[key] if key else b"" for key in keys]
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Contains the RawTable and RawTableColumn classes, which represent a table of
+text that can be drawn directly onto one or more PDF pages.
+
+A table is turned into one compact drawing instruction per page instead of one
+raw element per cell, so drawing long tabular reports does not require
+creating a Python object for every piece of text and every grid line.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Sequence
+
+from ..constants import (
+    DEFAULT_FONT,
+    DEFAULT_FONT_COLOR,
+    DEFAULT_FONT_SIZE,
+    DEFAULT_TABLE_BOTTOM,
+    DEFAULT_TABLE_PADDING,
+    DEFAULT_TABLE_ROW_HEIGHT,
+)
+
+
+@dataclass
+class RawTableColumn:
+    """
+    Represents a column of a `RawTable`.
+
+    Attributes:
+        width (float): The width of the column.
+        header (Optional[str]): The header text of the column. The header row is
+            drawn at the top of the table on every page when any column has a
+            header. Defaults to None.
+        alignment (int): The horizontal alignment of the column's text, 0 for
+            left, 1 for center, and 2 for right. Defaults to 0.
+    """
+
+    width: float
+    header: Optional[str] = None
+    alignment: int = 0
+
+
+class RawTable:
+    """
+    Represents a table of text intended for direct drawing onto the pages of a
+    PDF document, starting at a specified page and position.
+
+    Rows are laid out from the top of the table downward. When the next row
+    would fall below `bottom`, the table continues at the top of the next page.
+    Text that does not fit in its cell is truncated to the width of the cell.
+    Rows that would be placed beyond the last page of the PDF are not drawn.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[RawTableColumn],
+        rows: Iterable[Sequence[Any]],
+        page_number: int,
+        x: float,
+        y: float,
+        row_height: float = DEFAULT_TABLE_ROW_HEIGHT,
+        bottom: float = DEFAULT_TABLE_BOTTOM,
+        top: Optional[float] = None,
+        font: str = DEFAULT_FONT,
+        font_size: float = DEFAULT_FONT_SIZE,
+        font_color: tuple = DEFAULT_FONT_COLOR,
+        line_color: Optional[tuple] = DEFAULT_FONT_COLOR,
+        padding: float = DEFAULT_TABLE_PADDING,
+    ) -> None:
+        """
+        Initializes a raw table object for drawing.
+
+        Args:
+            columns: The columns of the table, from left to right.
+            rows: The rows of the table. Each row is a sequence of cell values,
+                one per column, which are converted to strings; None becomes an
+                empty cell.
+            page_number: The 1-based index of the page where the table starts.
+            x: The x-coordinate of the left edge of the table.
+            y: The y-coordinate of the top edge of the table on its first page.
+            row_height: The height of each row.
+            bottom: The y-coordinate below which no row is placed.
+            top: The y-coordinate of the top edge of the table on continuation
+                pages. Defaults to `y`.
+            font: The name of the font to use for the text (defaults to DEFAULT_FONT).
+            font_size: The size of the font (defaults to DEFAULT_FONT_SIZE).
+            font_color: The color of the text as an RGB tuple (0-1 for each channel).
+            line_color: The color of the grid lines as an RGB tuple (0-1 for each
+                channel), or None to draw no grid lines.
+            padding: The horizontal space between the text and the cell borders.
+        """
+        super().__init__()
+
+        self.columns = list(columns)
+        self.rows = [
+            tuple("" if value is None else str(value) for value in row) for row in rows
+        ]
+        self.page_number = page_number
+        self.x = x
+        self.y = y
+        self.row_height = row_height
+        self.bottom = bottom
+        self.top = y if top is None else top
+        self.font = font
+        self.font_size = font_size
+        self.font_color = font_color
+        self.line_color = line_color
+        self.padding = padding
+
+    def _rows_per_page(self, top: float, header_rows: int) -> int:
+        """
+        Computes the number of body rows that fit on a page.
+
+        Args:
+            top: The y-coordinate of the top edge of the table on the page.
+            header_rows: The number of header rows repeated on the page.
+
+        Returns:
+            The number of body rows, at least one so the table always advances.
+        """
+        return max(int((top - self.bottom) // self.row_height) - header_rows, 1)
+
+    @property
+    def to_draw(self) -> List[dict]:
+        """
+        Converts the raw table object into drawing instructions, one per page.
+
+        Returns:
+            A list of dictionaries, each containing the page number, object type
+            ("table"), the position of the table on that page, its columns as
+            (width, alignment) pairs, the rows drawn on that page including the
+            header row, and the styling parameters.
+        """
+        header = (
+            [tuple(each.header or "" for each in self.columns)]
+            if any(each.header for each in self.columns)
+            else []
+        )
+        columns = [(each.width, each.alignment) for each in self.columns]
+
+        result = []
+        start = 0
+        page_number = self.page_number
+        top = self.y
+        while start < len(self.rows) or not result:
+            end = start + self._rows_per_page(top, len(header))
+            result.append(
+                {
+                    "page_number": page_number,
+                    "type": "table",
+                    "x": self.x,
+                    "y": top,
+                    "row_height": self.row_height,
+                    "columns": columns,
+                    "rows": header + self.rows[start:end],
+                    "font": self.font,
+                    "font_size": self.font_size,
+                    "font_color": self.font_color,
+                    "line_color": self.line_color,
+                    "padding": self.padding,
+                }
+            )
+            start = end
+            page_number += 1
+            top = self.top
+
+        return result
@@ -5,7 +5,6 @@ that can be drawn directly onto a PDF page without relying on existing form fiel
 """
 
 from ..constants import DEFAULT_FONT, DEFAULT_FONT_COLOR, DEFAULT_FONT_SIZE
-from ..middleware.text import Text
 
 
 class RawText:
@@ -56,18 +55,17 @@ class RawText:
         Converts the raw text object to a dict ready for drawing.
 
         Returns:
-            A dictionary containing the page number, object type, an initialized Text widget,
-            and the coordinates expected by the watermark drawing helpers.
+            A dictionary containing the page number, object type, the text and
+            its font properties, and the coordinates expected by the watermark
+            drawing helpers.
         """
-        widget = Text("new", self.text)
-        widget.font = self.font
-        widget.font_size = self.font_size
-        widget.font_color = self.font_color
-
         return {
             "page_number": self.page_number,
             "type": "text",
-            "widget": widget,
+            "text": self.text,
+            "font": self.font,
+            "font_size": self.font_size,
+            "font_color": self.font_color,
             "x": self.x,
             "y": self.y,
         }
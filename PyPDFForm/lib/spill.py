@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Module for keeping large PDF streams on disk instead of in memory.
+
+When a `PdfWrapper` is given a `spill_dir`, any stream it stores that is larger
+than its `max_memory` threshold is written to a temporary file in that
+directory. The stream is read back as a memory view of a memory map of the
+file, so the operations that need it read it in place instead of holding a
+copy of it, and merging thousands of pages or drawing onto very long reports
+does not keep every intermediate stream resident.
+
+The caches keyed by PDF streams pass spilled streams through uncached, so
+reading a spilled stream never brings it back into memory.
+"""
+
+from mmap import ACCESS_READ, mmap
+from os import PathLike, close, remove, write
+from tempfile import mkstemp
+from typing import Optional
+from weakref import finalize
+
+
+class SpilledStream:
+    """
+    Represents a PDF stream stored in a temporary file.
+
+    The temporary file is removed once the object is garbage collected.
+    """
+
+    def __init__(self, stream: bytes | memoryview, spill_dir: str | PathLike) -> None:
+        """
+        Writes a stream to a new temporary file in a directory.
+
+        Args:
+            stream (bytes | memoryview): The stream to store, or a byte view of
+                it, which is written without being copied into memory.
+            spill_dir (str | PathLike): The directory to create the file in.
+        """
+        super().__init__()
+
+        fd, self.path = mkstemp(prefix="pypdfform-", suffix=".pdf", dir=spill_dir)
+        try:
+            view = memoryview(stream)
+            while view:
+                view = view[write(fd, view) :]
+        finally:
+            close(fd)
+
+        self.size = len(stream)
+        self._finalizer = finalize(self, remove, self.path)
+
+    def read(self) -> memoryview:
+        """
+        Reads the stream back through a memory map of the temporary file.
+
+        The stream is not copied. The memory map is closed once the returned
+        view and every view of it are garbage collected.
+
+        Returns:
+            memoryview: A read-only view of the stored stream.
+        """
+        with open(self.path, "rb") as f:
+            return memoryview(mmap(f.fileno(), 0, access=ACCESS_READ))
+
+
+def spill_stream(
+    stream: bytes | memoryview,
+    spill_dir: Optional[str | PathLike],
+    max_memory: Optional[int],
+) -> bytes | SpilledStream:
+    """
+    Spills a stream to disk if it is larger than a threshold.
+
+    A spilled stream that is read back and stored again, or a view of a
+    template file, is copied into memory when it is not larger than the
+    threshold, so it does not keep its file open.
+
+    Args:
+        stream (bytes | memoryview): The stream to store.
+        spill_dir (Optional[str | PathLike]): The directory for temporary
+            files, or None to keep every stream in memory.
+        max_memory (Optional[int]): The size in bytes up to which a stream stays
+            in memory, or None to spill every non-empty stream.
+
+    Returns:
+        bytes | SpilledStream: The stream itself, or its spilled counterpart.
+    """
+    if spill_dir is None or not stream or len(stream) <= (max_memory or 0):
+        return bytes(stream)
+
+    return SpilledStream(stream, spill_dir)
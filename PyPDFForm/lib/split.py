@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+A module for splitting the PDF of a `PdfWrapper` into files.
+
+`SplitMixin` opens the PDF once, copies the pages of each part from it with
+`write_pages`, and streams every part straight to its own file, so splitting a
+long document only holds one part in memory at a time.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import TYPE_CHECKING, Callable, List, Sequence
+
+from .base import WrapperBase
+from .constants import Title
+from .egress import (
+    render_appearance_streams,
+    set_acroform_fields,
+    set_need_appearances,
+    write_pdf,
+)
+from .font import add_font_acroform
+from .incremental import open_reader
+from .middleware.signature import Signature
+from .pages import count_pages, write_pages
+from .template import update_metadata
+from .utils import group_page_numbers
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from pypdf import PdfWriter
+
+
+class SplitMixin(WrapperBase):
+    """
+    A mixin that provides `PdfWrapper.split`.
+    """
+
+    def split(
+        self,
+        by: int | Sequence[Sequence[int]] | Callable[[int], bool],
+        dest: str | PathLike,
+    ) -> List[str]:
+        """
+        Splits the PDF into parts and writes each part to its own file.
+
+        The page groups and paths of all parts are checked before anything is
+        written, so an invalid split leaves no files behind. The PDF is opened
+        once for the whole split. Each part is copied from it
+        like `extract` does and streamed straight to disk before the next one is
+        produced, without being cached or wrapped in a new `PdfWrapper`, so
+        bursting a long document only holds one part in memory at a time and
+        the cost grows linearly with the number of parts. Every part keeps only
+        the widgets and font resources of its own pages, inherits the current
+        wrapper's title and appearance settings, and gets its registered fonts.
+
+        Args:
+            by (int | Sequence[Sequence[int]] | Callable[[int], bool]): How to split
+                the pages:
+                - int: The number of pages per part.
+                - Sequence[Sequence[int]]: The 1-based page numbers of each part,
+                  e.g. `[range(1, 4), [5]]`.
+                - Callable[[int], bool]: A function that receives each 1-based page
+                  number and returns True when that page starts a new part.
+            dest (str | PathLike): The path pattern of the parts, formatted with
+                `index` (the 1-based number of the part), `start`, and `end` (its
+                first and last page numbers), e.g. `"part_{index}.pdf"`.
+
+        Returns:
+            List[str]: The paths the parts were written to, in order.
+
+        Raises:
+            ValueError: If the number of pages per part is less than 1, a listed
+                part has no pages, or `dest` gives two parts the same path.
+            IndexError: If a listed page number is out of range.
+        """
+
+        reader = open_reader(self._read())
+        title = self.title
+        widget_keys = {
+            key
+            for key, widget in self._widget_view().items()
+            if not isinstance(widget, Signature)
+        }
+
+        parts = list(group_page_numbers(by, count_pages(reader)))
+        result = [
+            str(dest).format(index=index, start=part[0], end=part[-1])
+            for index, part in enumerate(parts, start=1)
+        ]
+        if len(set(result)) < len(result):
+            msg = "dest must give each part its own path, e.g. with {index}"
+            raise ValueError(msg)
+
+        for part, path in zip(parts, result, strict=True):
+            self._write_part(
+                write_pages(reader, [each - 1 for each in part]),
+                path,
+                title,
+                widget_keys,
+            )
+
+        return result
+
+    def _write_part(
+        self, writer: PdfWriter, path: str, title: str | None, widget_keys: set
+    ) -> None:
+        """
+        Writes the writer of a part made by `split` to a file.
+
+        The part gets the same output as `extract` would give it: the title,
+        registered fonts, and appearance settings of the current wrapper are
+        applied, and its AcroForm fields are rebuilt like in `read`.
+
+        Args:
+            writer (PdfWriter): The writer of the part.
+            path (str): The path to write the part to.
+            title (str | None): The title of the current wrapper.
+            widget_keys (set): The keys of the widgets to keep as AcroForm fields.
+        """
+
+        if title is not None:
+            update_metadata(writer, {Title: title})
+        for event in self._font_register_events:
+            add_font_acroform(writer, event[1], getattr(self, "need_appearances"))
+        if getattr(self, "need_appearances"):
+            set_need_appearances(writer)
+        set_acroform_fields(writer, widget_keys, getattr(self, "use_full_widget_name"))
+
+        with open(path, "wb+") as f:
+            if getattr(self, "need_appearances") and getattr(
+                self, "generate_appearance_streams"
+            ):
+                with BytesIO() as buff:
+                    writer.write(buff)
+                    f.write(render_appearance_streams(buff.getvalue()))
+            else:
+                write_pdf(writer, f)
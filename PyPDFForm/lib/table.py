@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Module for drawing tables onto watermark canvases.
+
+This module renders the per-page drawing instructions produced by `RawTable`.
+Each page of a table is emitted as one path for all grid lines and one text
+object for all cell text, and the fitted width of repeated cell values is
+cached, which keeps drawing long tables fast and their content streams small.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+from reportlab.pdfbase.pdfmetrics import getAscentDescent, stringWidth
+from reportlab.pdfgen.canvas import Canvas
+
+
+@lru_cache(maxsize=4096)
+def _fit_text(
+    text: str, font: str, font_size: float, width: float
+) -> Tuple[str, float]:
+    """
+    Truncates a text so it fits within a width, caching the result.
+
+    Table cells often repeat the same values, so caching the fitted text and
+    its width avoids measuring them again for every row.
+
+    Args:
+        text (str): The text to fit.
+        font (str): The ReportLab name of the font.
+        font_size (float): The size of the font.
+        width (float): The available width.
+
+    Returns:
+        Tuple[str, float]: The longest prefix of the text that fits and its width.
+    """
+    text_width = stringWidth(text, font, font_size)
+    if text_width <= width:
+        return text, text_width
+
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if stringWidth(text[:middle], font, font_size) <= width:
+            low = middle
+        else:
+            high = middle - 1
+
+    return text[:low], stringWidth(text[:low], font, font_size)
+
+
+def draw_table(canvas: Canvas, **kwargs) -> None:
+    """
+    Draws the rows of a table on the given canvas.
+
+    All grid lines are drawn as a single path and all cell text is emitted into
+    a single text object, which keeps the content stream compact no matter how
+    many cells the table has. Cell text is vertically centered in its row and
+    truncated to fit within the column.
+
+    Args:
+        canvas (Canvas): The ReportLab Canvas object to draw on.
+        **kwargs: Keyword arguments containing the table's properties and coordinates.
+            - x (float): The x-coordinate of the table's left edge.
+            - y (float): The y-coordinate of the table's top edge.
+            - row_height (float): The height of each row.
+            - columns (list): The (width, alignment) pairs of the columns.
+            - rows (list): The rows to draw, each a tuple of cell strings.
+            - font (str): The name of the font.
+            - font_size (float): The size of the font.
+            - font_color (tuple): A tuple representing the RGB color of the text.
+            - line_color (tuple): A tuple representing the RGB color of the grid
+              lines, or None to draw no grid lines.
+            - padding (float): The horizontal space between text and cell borders.
+
+    Returns:
+        None
+    """
+    x = kwargs["x"]
+    y = kwargs["y"]
+    row_height = kwargs["row_height"]
+    columns = kwargs["columns"]
+    rows = kwargs["rows"]
+    font_size = kwargs["font_size"]
+    line_color = kwargs["line_color"]
+    padding = kwargs["padding"]
+    font = kwargs.get("font_mapping", {}).get(kwargs["font"], kwargs["font"])
+
+    column_xs = [x]
+    for width, _ in columns:
+        column_xs.append(column_xs[-1] + width)
+
+    if line_color:
+        canvas.setStrokeColorRGB(*(line_color))
+        path = canvas.beginPath()
+        for i in range(len(rows) + 1):
+            path.moveTo(column_xs[0], y - i * row_height)
+            path.lineTo(column_xs[-1], y - i * row_height)
+        for column_x in column_xs:
+            path.moveTo(column_x, y)
+            path.lineTo(column_x, y - len(rows) * row_height)
+        canvas.drawPath(path, stroke=1, fill=0)
+
+    ascent, descent = getAscentDescent(font, font_size)
+    baseline_offset = (row_height - (ascent - descent)) / 2 - descent
+
+    text_obj = canvas.beginText()
+    text_obj.setFont(font, font_size)
+    text_obj.setFillColorRGB(*(kwargs["font_color"]))
+    for i, row in enumerate(rows):
+        baseline = y - (i + 1) * row_height + baseline_offset
+        for (width, alignment), column_x, value in zip(
+            columns, column_xs, row, strict=False
+        ):
+            if not value:
+                continue
+            text, text_width = _fit_text(value, font, font_size, width - 2 * padding)
+            if alignment == 1:
+                text_x = column_x + (width - text_width) / 2
+            elif alignment == 2:
+                text_x = column_x + width - padding - text_width
+            else:
+                text_x = column_x + padding
+            text_obj.setTextOrigin(text_x, baseline)
+            text_obj.textOut(text)
+    canvas.drawText(text_obj)
@@ -9,13 +9,13 @@ specific patterns for identifying and constructing different types of widgets.
 """
 
 from copy import deepcopy
-from functools import lru_cache
 from io import BytesIO
-from typing import Dict, List, cast
+from typing import Dict, List, Tuple, cast
 
 from pypdf import PdfReader, PdfWriter
 from pypdf.generic import ArrayObject, DictionaryObject, NameObject, TextStringObject
 
+from .adapter import stream_to_f_obj
 from .annotations import AnnotationTypes
 from .constants import (
     COMB,
@@ -29,6 +29,8 @@ from .constants import (
     S,
     Title,
 )
+from .incremental import UpdateReader, open_reader
+from .index import get_widget_locations, iter_widget_annotations
 from .middleware import WIDGET_TYPES
 from .middleware.checkbox import Checkbox
 from .middleware.dropdown import Dropdown
@@ -50,14 +52,18 @@ from .patterns import (
     get_widget_key,
     update_annotation_name,
 )
-from .utils import extract_widget_property, find_pattern_match
+from .utils import extract_widget_property, find_pattern_match, stream_cache
+from .widgets.base import Widget
 
 
-@lru_cache(maxsize=128)
+@stream_cache
 def get_metadata(pdf: bytes) -> dict:
     """
     Retrieves the metadata of a PDF.
 
+    Only the trailers, the cross-reference sections, and the document
+    information dictionary are parsed, however long the document is.
+
     Args:
         pdf (bytes): The PDF stream to extract metadata from.
 
@@ -66,8 +72,7 @@ def get_metadata(pdf: bytes) -> dict:
     """
     result = {}
     if pdf:
-        reader = PdfReader(BytesIO(pdf))
-        result = reader.metadata or {}
+        result = open_reader(pdf).metadata or {}
 
     return result
 
@@ -85,13 +90,14 @@ def get_title(pdf: bytes) -> str | None:
     return get_metadata(pdf).get(Title)
 
 
-@lru_cache(maxsize=128)
+@stream_cache
 def get_on_open_javascript(pdf: bytes) -> str | None:
     """
     Retrieves the JavaScript configured to run when a PDF is opened.
 
     Results are cached by PDF stream. Only a document-catalog `/OpenAction`
-    whose action type is JavaScript is returned.
+    whose action type is JavaScript is returned. Only the trailers, the
+    cross-reference sections, and the catalog are parsed.
 
     Args:
         pdf (bytes): The PDF stream to inspect for a document-open action.
@@ -102,80 +108,46 @@ def get_on_open_javascript(pdf: bytes) -> str | None:
     """
     result = None
     if pdf:
-        reader = PdfReader(BytesIO(pdf))
-        root_object = reader.root_object
+        root_object = open_reader(pdf).root_object
         if OpenAction in root_object and root_object[OpenAction].get(S) == JavaScript:
             result = root_object[OpenAction].get(JS)
 
     return result
 
 
-def set_metadata(pdf: bytes, metadata: dict) -> bytes:
+def update_metadata(out: UpdateReader | PdfWriter, metadata: dict) -> None:
     """
-    Merges metadata into a PDF's existing document metadata.
+    Merges metadata into the document metadata of an opened PDF.
 
     Existing entries are retained unless the supplied mapping contains the
     same key, in which case the supplied value replaces the existing value.
 
     Args:
-        pdf (bytes): The PDF stream whose metadata should be updated.
+        out (UpdateReader | PdfWriter): The PDF opened with `open_for_update`.
         metadata (dict): Metadata entries to add or replace.
-
-    Returns:
-        bytes: The PDF stream containing the merged metadata.
     """
-    writer = PdfWriter(BytesIO(pdf))
-    _metadata = writer.metadata or {}
+    _metadata = out.metadata or {}
     _metadata.update(metadata)
-    writer.add_metadata(_metadata)
-
-    with BytesIO() as f:
-        writer.write(f)
-        f.seek(0)
-        return f.read()
-
-
-def set_title(pdf: bytes, title: str) -> bytes:
-    """
-    Sets a PDF's document title while preserving its other metadata.
-
-    Args:
-        pdf (bytes): The PDF stream whose title should be set.
-        title (str): The document title to store in the PDF metadata.
-
-    Returns:
-        bytes: The PDF stream containing the updated title.
-    """
-    return set_metadata(pdf, {Title: title})
+    out.add_metadata(_metadata)
 
 
-def set_on_open_javascript(pdf: bytes, script: str) -> bytes:
+def update_on_open_javascript(out: UpdateReader | PdfWriter, script: str) -> None:
     """
-    Sets a PDF's document-open action to execute JavaScript.
+    Sets the document-open action of an opened PDF to execute JavaScript.
 
     The script is written to the document catalog as a JavaScript
     `/OpenAction`, replacing any existing document-open action. An action is
     written even when `script` is empty.
 
     Args:
-        pdf (bytes): The PDF stream whose document-open action should be set.
+        out (UpdateReader | PdfWriter): The PDF opened with `open_for_update`.
         script (str): JavaScript to execute when the PDF is opened.
-
-    Returns:
-        bytes: The PDF stream containing the JavaScript `/OpenAction`.
     """
-    writer = PdfWriter(BytesIO(pdf))
-
     open_action = DictionaryObject()
     open_action[NameObject(S)] = NameObject(JavaScript)
     open_action[NameObject(JS)] = TextStringObject(script)
 
-    writer._root_object.update({NameObject(OpenAction): open_action})  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
-
-    with BytesIO() as f:
-        writer.write(f)
-        f.seek(0)
-        return f.read()
+    out.root_object.update({NameObject(OpenAction): open_action})
 
 
 def build_widgets(
@@ -201,7 +173,7 @@ def build_widgets(
     return deepcopy(_build_widget_cache(pdf_stream, use_full_widget_name))
 
 
-@lru_cache(maxsize=128)
+@stream_cache
 def _build_widget_cache(
     pdf_stream: bytes,
     use_full_widget_name: bool,
@@ -221,10 +193,11 @@ def _build_widget_cache(
         Dict[str, WIDGET_TYPES]: Cached widget prototypes keyed by widget name.
     """
     results = {}
+    name_cache = {}
 
     for page_num, widgets in get_widgets_by_page(pdf_stream).items():
         for widget in widgets:
-            _process_widget(widget, page_num, use_full_widget_name, results)
+            _process_widget(widget, page_num, use_full_widget_name, results, name_cache)
 
     return results
 
@@ -234,6 +207,7 @@ def _process_widget(
     page_number: int,
     use_full_widget_name: bool,
     results: Dict[str, WIDGET_TYPES],
+    name_cache: dict | None = None,
 ) -> None:
     """
     Processes a single widget and adds it to the results dictionary.
@@ -243,13 +217,19 @@ def _process_widget(
     annotations that share a key are aggregated into one middleware object with
     per-option geometry and a selected option index.
 
+    The extracted hook attributes are recorded in the widget's `pdf_state`.
+    When several annotations share a key, only the values they all agree on
+    are kept.
+
     Args:
         widget (dict): The widget dictionary from the PDF.
         page_number (int): The 1-indexed page number the widget appears on.
         use_full_widget_name (bool): Whether to use the full widget name.
         results (Dict[str, WIDGET_TYPES]): The dictionary of widgets being built.
+        name_cache (dict | None): Parent names resolved so far in this pass,
+            shared between widgets of the same document.
     """
-    key = get_widget_key(widget, use_full_widget_name)
+    key = get_widget_key(widget, use_full_widget_name, name_cache)
     _widget = construct_widget(widget, key)
     if _widget is not None:
         _populate_common_properties(widget, page_number, _widget)
@@ -263,12 +243,40 @@ def _process_widget(
         if isinstance(_widget, Dropdown):
             _populate_dropdown_properties(widget, _widget)
 
+        _widget.pdf_state.update(
+            {
+                name: _widget.__dict__[name]
+                for name in _widget.SET_ATTR_TRIGGER_HOOK_MAP
+                if _widget.__dict__.get(name) is not None
+            }
+        )
+        if key in results:
+            _merge_pdf_state(results[key], _widget)
+
         if isinstance(_widget, Radio):
             _handle_radio_widget(widget, key, _widget, results)
         else:
             results[key] = _widget
 
 
+def _merge_pdf_state(first: WIDGET_TYPES, second: WIDGET_TYPES) -> None:
+    """
+    Keeps only the recorded PDF state two widgets of the same field agree on.
+
+    Both widgets' `pdf_state` are reduced to the attributes whose values are
+    equal in each, so a hook is only skipped as a no-op when every annotation
+    of the field already has the value.
+
+    Args:
+        first (WIDGET_TYPES): A widget of the field.
+        second (WIDGET_TYPES): Another widget of the same field.
+    """
+    for name in list(first.pdf_state) + list(second.pdf_state):
+        if first.pdf_state.get(name) != second.pdf_state.get(name):
+            first.pdf_state.pop(name, None)
+            second.pdf_state.pop(name, None)
+
+
 def _populate_common_properties(
     widget: dict, page_number: int, _widget: WIDGET_TYPES
 ) -> None:
@@ -379,7 +387,7 @@ def _handle_radio_widget(
         radio.value = radio.number_of_options - 1
 
 
-@lru_cache(maxsize=128)
+@stream_cache
 def get_widgets_by_page(pdf: bytes) -> Dict[int, List[dict]]:
     """
     Retrieves widgets from a PDF stream, organized by page number.
@@ -395,7 +403,7 @@ def get_widgets_by_page(pdf: bytes) -> Dict[int, List[dict]]:
         Dict[int, List[dict]]: A dictionary where keys are page numbers (1-indexed)
             and values are lists of widget dictionaries.
     """
-    pdf_file = PdfReader(BytesIO(pdf))
+    pdf_file = PdfReader(stream_to_f_obj(pdf))
 
     result = {}
 
@@ -520,7 +528,7 @@ def create_annotations(
     Returns:
         bytes: The updated PDF stream with the added annotations.
     """
-    writer = PdfWriter(BytesIO(template))
+    writer = PdfWriter(stream_to_f_obj(template))
     annotations_by_page = _group_annotations_by_page(annotations)
 
     for i, page in enumerate(writer.pages):
@@ -543,6 +551,53 @@ def create_annotations(
         return f.read()
 
 
+def create_widgets(template: bytes, widgets: List[Widget]) -> bytes:
+    """
+    Creates form fields by building their annotations directly into a PDF template.
+
+    Unlike rendering widgets onto ReportLab watermarks and copying them back, each
+    widget builds its own annotation dictionary, including its appearance stream,
+    straight into the template's object graph with its `build_annotation` method. Fonts and
+    appearance streams are shared between widgets through a cache that lives for
+    the whole call. Widgets on pages the template does not have are skipped, and
+    widget page numbers are 1-based.
+
+    Args:
+        template (bytes): The PDF template to create the form fields on.
+        widgets (List[Widget]): Widgets that support direct creation.
+
+    Returns:
+        bytes: The updated PDF stream with the created form fields.
+    """
+    writer = PdfWriter(stream_to_f_obj(template))
+    widgets_by_page = _group_annotations_by_page(widgets)  # type: ignore
+    resources = {}
+
+    for i, page in enumerate(writer.pages):
+        page_num = i + 1
+        if page_num not in widgets_by_page:
+            continue
+
+        page_widgets = ArrayObject(
+            [
+                writer._add_object(  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+                    getattr(widget, "build_annotation")(writer, page, resources)
+                )
+                for widget in widgets_by_page[page_num]
+            ]
+        )
+
+        if Annots in page:
+            page[NameObject(Annots)] += page_widgets
+        else:
+            page[NameObject(Annots)] = page_widgets
+
+    with BytesIO() as f:
+        writer.write(f)
+        f.seek(0)
+        return f.read()
+
+
 def remove_widgets_by_keys(
     pdf: bytes, keys: List[str], use_full_widget_name: bool = False
 ) -> bytes:
@@ -550,8 +605,9 @@ def remove_widgets_by_keys(
     Removes specific widgets from a PDF by their keys.
 
     This function removes any widget annotation whose key matches one of the
-    provided keys. If no keys are provided, the original PDF stream is returned
-    unchanged.
+    provided keys. Matching annotations are looked up in the PDF's widget index,
+    so only the `/Annots` arrays of affected pages are rebuilt. If no keys are
+    provided, the original PDF stream is returned unchanged.
 
     Args:
         pdf (bytes): The PDF stream to remove widgets from.
@@ -565,23 +621,20 @@ def remove_widgets_by_keys(
     if not keys:
         return pdf
 
-    key_set = set(keys)
-    writer = PdfWriter(BytesIO(pdf))
+    writer = PdfWriter(stream_to_f_obj(pdf))
 
-    for page in writer.pages:
-        needs_update = False
+    for page_index, page_locations in get_widget_locations(
+        pdf, keys, use_full_widget_name
+    ).items():
+        page = writer.pages[page_index]
+        indices_to_remove = {annot_index for annot_index, _ in page_locations}
         page_annots = ArrayObject([])
 
-        for annot in page.get(Annots, []):
-            annot = cast(DictionaryObject, annot.get_object())
-            key = get_widget_key(annot.get_object(), use_full_widget_name)
-            if key not in key_set:
-                page_annots.append(annot)
-            else:
-                needs_update = True
+        for annot_index, annot in enumerate(page.get(Annots, [])):
+            if annot_index not in indices_to_remove:
+                page_annots.append(cast(DictionaryObject, annot.get_object()))
 
-        if needs_update:
-            page[NameObject(Annots)] = page_annots
+        page[NameObject(Annots)] = page_annots
 
     with BytesIO() as f:
         writer.write(f)
@@ -614,9 +667,16 @@ def update_widget_keys(
     Returns:
         bytes: The updated PDF template as a byte stream.
     """
-    out = PdfWriter(BytesIO(template))
+    out = PdfWriter(stream_to_f_obj(template))
 
-    _apply_widget_key_updates(out, widgets, old_keys, new_keys, indices)
+    _apply_widget_key_updates(
+        out,
+        get_widget_locations(template, old_keys, False),
+        widgets,
+        old_keys,
+        new_keys,
+        indices,
+    )
 
     with BytesIO() as f:
         out.write(f)
@@ -626,6 +686,7 @@ def update_widget_keys(
 
 def _apply_widget_key_updates(
     writer: PdfWriter,
+    locations: Dict[int, List[Tuple[int, str]]],
     widgets: Dict[str, WIDGET_TYPES],
     old_keys: List[str],
     new_keys: List[str],
@@ -635,12 +696,14 @@ def _apply_widget_key_updates(
     Applies queued widget key updates to matching annotations.
 
     The update queue is converted into a lookup keyed by old widget name, then
-    each annotation is checked against that lookup as pages are traversed.
-    Non-radio widgets honor the requested occurrence index, while radio widgets
-    update every annotation in the radio group.
+    the annotations of those old names are visited in document order through
+    the widget index. Non-radio widgets honor the requested occurrence index,
+    while radio widgets update every annotation in the radio group.
 
     Args:
         writer (PdfWriter): The PDF writer object.
+        locations (Dict[int, List[Tuple[int, str]]]): Widget index locations of
+            the old widget keys within the writer.
         widgets (Dict[str, WIDGET_TYPES]): A dictionary of widgets in the template.
         old_keys (List[str]): The old widget keys to replace.
         new_keys (List[str]): The new widget keys to apply.
@@ -649,19 +712,12 @@ def _apply_widget_key_updates(
     updates = {old_key: (new_keys[i], indices[i]) for i, old_key in enumerate(old_keys)}
     trackers = {}
 
-    for page in writer.pages:
-        for annot in page.get(Annots, []):
-            annot = cast(DictionaryObject, annot.get_object())
-            key = get_widget_key(annot.get_object(), False)
-
-            if key not in updates:
+    for _, annot, key in iter_widget_annotations(writer, locations):
+        widget = widgets.get(key)
+        if widget is not None:
+            trackers[key] = trackers.get(key, -1) + 1
+            new_key, index = updates[key]
+            if not isinstance(widget, Radio) and trackers[key] != index:
                 continue
 
-            widget = widgets.get(key)
-            if widget is not None:
-                trackers[key] = trackers.get(key, -1) + 1
-                new_key, index = updates[key]
-                if not isinstance(widget, Radio) and trackers[key] != index:
-                    continue
-
-                update_annotation_name(annot, new_key)
+            update_annotation_name(cast(DictionaryObject, annot.get_object()), new_key)
@@ -4,10 +4,13 @@ A module for custom type definitions used throughout the PyPDFForm library.
 
 This includes specialized container types like PdfArray, which extends
 the standard list to provide custom behavior for slicing operations, particularly
-for merging PdfWrapper objects.
+for merging PdfWrapper objects, PdfPages, the lazy PdfArray of page wrappers
+returned by `PdfWrapper.pages`, and SharedWidgets, the copy-on-write widget
+dictionary of wrappers created by `PdfWrapper.fork`.
 """
 
-from typing import Any
+from copy import deepcopy
+from typing import Any, Callable, Iterator, List
 
 from .utils import generic_merge
 
@@ -62,3 +65,333 @@ class PdfArray(list):
             Any: A single merged PdfWrapper object.
         """
         return generic_merge(list(self), lambda x, y: x + y)
+
+
+class PdfPages(PdfArray):
+    """
+    A lazy PdfArray of the pages of a PDF as PdfWrapper objects.
+
+    No page is extracted until it is indexed. Indexing extracts a single page,
+    while slicing extracts the selected pages directly into a single PdfWrapper,
+    so a range of pages is never split apart and merged back together. If the
+    slice is empty, it returns None, like slicing a PdfArray.
+
+    Any other list operation, such as iterating, `copy`, `+` or `append`,
+    first extracts every page into the list, after which it behaves like a
+    regular PdfArray.
+    """
+
+    def __init__(self, page_count: int, extract: Callable[[List[int]], Any]) -> None:
+        """
+        Initializes the array.
+
+        Args:
+            page_count (int): The number of pages in the PDF.
+            extract (Callable[[List[int]], Any]): A function that extracts the
+                pages at the given zero-based indices into a single PdfWrapper.
+        """
+        super().__init__()
+
+        self._page_count = page_count
+        self._extract: Callable[[List[int]], Any] | None = extract
+
+    def _load(self) -> None:
+        """
+        Extracts every page into the list, unless it was already done.
+        """
+
+        if self._extract is not None:
+            extract = self._extract
+            self._extract = None
+            list.extend(self, (extract([each]) for each in range(self._page_count)))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of pages.
+
+        Returns:
+            int: The number of pages in the PDF.
+        """
+
+        if self._extract is None:
+            return super().__len__()
+        return self._page_count
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Extracts a page or a slice of pages.
+
+        Args:
+            key (int | slice): The index or slice to retrieve.
+
+        Returns:
+            PdfWrapper | Any: The page at the index, the selected pages as a
+                single PdfWrapper if sliced, or None for an empty slice.
+        """
+
+        if self._extract is None:
+            return super().__getitem__(key)
+
+        page_nums = range(self._page_count)[key]
+        if isinstance(page_nums, int):
+            return self._extract([page_nums])
+
+        return self._extract(list(page_nums)) if page_nums else None
+
+    def __radd__(self, other: Any) -> Any:
+        """
+        Concatenates a list with the pages.
+
+        Args:
+            other (Any): The list to put in front of the pages.
+
+        Returns:
+            Any: The concatenated list.
+        """
+
+        self._load()
+        return other + list(self)
+
+
+def _loading(name: str) -> Callable:
+    """
+    Wraps a list method of PdfPages so that it extracts every page first.
+
+    Args:
+        name (str): The name of the list method.
+
+    Returns:
+        Callable: The wrapped method.
+    """
+
+    def method(self: PdfPages, *args: Any, **kwargs: Any) -> Any:
+        self._load()  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+        return getattr(list, name)(self, *args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = getattr(list, name).__doc__
+    return method
+
+
+for _name in (
+    "__iter__",
+    "__reversed__",
+    "__contains__",
+    "__repr__",
+    "__eq__",
+    "__ne__",
+    "__lt__",
+    "__le__",
+    "__gt__",
+    "__ge__",
+    "__add__",
+    "__iadd__",
+    "__mul__",
+    "__rmul__",
+    "__imul__",
+    "__setitem__",
+    "__delitem__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "index",
+    "count",
+    "copy",
+    "sort",
+    "reverse",
+):
+    setattr(PdfPages, _name, _loading(_name))
+
+
+class SharedWidgets(dict):
+    """
+    A dictionary of widgets that copies them from shared prototypes on first
+    access.
+
+    `PdfWrapper.fork` gives the original wrapper and the fork each a
+    `SharedWidgets` over the same prototypes. A prototype is never handed out;
+    looking a widget up, through indexing, `get`, `values`, `items` and the
+    like, replaces it with a private deep copy first, so changes made through
+    one wrapper are never seen by the other. Widgets that are never looked up
+    are never copied.
+    """
+
+    def __init__(self, prototypes: dict) -> None:
+        """
+        Initializes the dictionary.
+
+        Args:
+            prototypes (dict): The widgets to share, which must not be changed
+                afterwards.
+        """
+        super().__init__(prototypes)
+
+        self._shared = set(prototypes)
+
+    def prototypes(self) -> dict:
+        """
+        Creates prototypes with the current state of the widgets.
+
+        Prototypes that are still shared are reused, so only the widgets that
+        were looked up are copied.
+
+        Returns:
+            dict: The prototypes.
+        """
+        return {
+            key: value if key in self._shared else deepcopy(value)
+            for key, value in super().items()
+        }
+
+    def _own(self, key: Any) -> None:
+        """
+        Replaces a shared prototype with a private copy.
+
+        Args:
+            key (Any): The key of the widget.
+        """
+        if key in self._shared:
+            self._shared.discard(key)
+            super().__setitem__(key, deepcopy(super().__getitem__(key)))
+
+    def _own_all(self) -> None:
+        """
+        Replaces every shared prototype with a private copy.
+        """
+        for key in list(self._shared):
+            self._own(key)
+
+    def __iter__(self) -> Iterator:  # pylint: disable=W0246
+        """
+        Iterates over the keys of the widgets.
+
+        Overriding it keeps `dict(...)` and `{**...}` from reading the widgets
+        directly, so they look every widget up through `__getitem__`.
+
+        Returns:
+            Iterator: An iterator over the keys.
+        """
+        return super().__iter__()
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Looks up a widget, copying it from its prototype if still shared.
+
+        Args:
+            key (Any): The key of the widget.
+
+        Returns:
+            Any: The widget.
+        """
+        self._own(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """
+        Sets a widget, which is no longer shared.
+
+        Args:
+            key (Any): The key of the widget.
+            value (Any): The widget.
+        """
+        self._shared.discard(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        """
+        Removes a widget.
+
+        Args:
+            key (Any): The key of the widget.
+        """
+        self._shared.discard(key)
+        super().__delitem__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Looks up a widget, copying it from its prototype if still shared.
+
+        Args:
+            key (Any): The key of the widget.
+            default (Any): The value returned when the key does not exist.
+
+        Returns:
+            Any: The widget, or `default`.
+        """
+        if key not in self:
+            return default
+
+        return self[key]
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        """
+        Removes a widget and returns it, copying it from its prototype if
+        still shared.
+
+        Args:
+            key (Any): The key of the widget.
+            *args (Any): The value returned when the key does not exist.
+
+        Returns:
+            Any: The widget, or the default value.
+        """
+        self._own(key)
+        return super().pop(key, *args)
+
+    def popitem(self) -> tuple:
+        """
+        Removes the last widget and returns it with its key.
+
+        Returns:
+            tuple: The key and the widget.
+        """
+        if self:
+            self._own(next(reversed(self)))
+        return super().popitem()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        """
+        Looks up a widget, setting it to `default` when the key does not exist.
+
+        Args:
+            key (Any): The key of the widget.
+            default (Any): The widget to set when the key does not exist.
+
+        Returns:
+            Any: The widget.
+        """
+        self._own(key)
+        return super().setdefault(key, default)
+
+    def values(self) -> Any:
+        """
+        Returns the widgets, copying every widget still shared.
+
+        Returns:
+            Any: A view of the widgets.
+        """
+        self._own_all()
+        return super().values()
+
+    def items(self) -> Any:
+        """
+        Returns the keys and widgets, copying every widget still shared.
+
+        Returns:
+            Any: A view of the keys and widgets.
+        """
+        self._own_all()
+        return super().items()
+
+    def copy(self) -> dict:
+        """
+        Returns a shallow copy, copying every widget still shared.
+
+        Returns:
+            dict: The copy.
+        """
+        self._own_all()
+        return dict(super().items())
@@ -12,15 +12,16 @@ It includes functions for:
 """
 
 from collections.abc import Callable
-from functools import lru_cache
+from functools import lru_cache, wraps
 from io import BytesIO
 from secrets import choice
 from string import ascii_letters, digits, punctuation
-from typing import Any, List
+from typing import Any, Iterator, List, Sequence
 
 from pypdf import PdfReader, PdfWriter
 from pypdf.generic import ArrayObject, DictionaryObject, NameObject
 
+from .adapter import stream_to_f_obj
 from .constants import (
     SLASH,
     UNIQUE_SUFFIX_LENGTH,
@@ -30,7 +31,35 @@ from .constants import (
 )
 
 
-@lru_cache(maxsize=128)
+def stream_cache(func: Callable) -> Callable:
+    """
+    Caches a function whose first argument is a PDF stream, like `lru_cache`.
+
+    Only calls on `bytes` streams are cached. Streams spilled to disk are read
+    as memory views of their files, and are passed through uncached, so the
+    cache never holds them in memory or keeps their files open.
+
+    Args:
+        func (Callable): The function to cache.
+
+    Returns:
+        Callable: The cached function, which also has the `cache_info` and
+            `cache_clear` methods of `lru_cache`.
+    """
+    cached = lru_cache(maxsize=128)(func)
+
+    @wraps(func)
+    def wrapper(pdf, *args):
+        if isinstance(pdf, bytes):
+            return cached(pdf, *args)
+
+        return func(pdf, *args)
+
+    vars(wrapper).update(cache_info=cached.cache_info, cache_clear=cached.cache_clear)
+    return wrapper
+
+
+@stream_cache
 def remove_all_widgets(pdf: bytes) -> bytes:
     """
     Removes all widgets (form fields) from a PDF, effectively flattening the form.
@@ -47,7 +76,7 @@ def remove_all_widgets(pdf: bytes) -> bytes:
         bytes: The PDF with all widgets removed, as a bytes stream.
     """
     result_stream = BytesIO()
-    writer = PdfWriter(BytesIO(pdf))
+    writer = PdfWriter(stream_to_f_obj(pdf))
     for page in writer.pages:
         if page.annotations:
             page.annotations.clear()
@@ -57,32 +86,59 @@ def remove_all_widgets(pdf: bytes) -> bytes:
     return result_stream.read()
 
 
-def get_page_streams(pdf: bytes) -> List[bytes]:
+def group_page_numbers(
+    by: int | Sequence[Sequence[int]] | Callable[[int], bool], page_count: int
+) -> Iterator[List[int]]:
     """
-    Extracts the content stream of each page in a PDF as a list of byte streams.
+    Groups the 1-based page numbers of a PDF into the parts of a split.
 
-    This function takes a PDF as a bytes stream and returns a list of single-page
-    PDF byte streams. Each element contains a complete one-page PDF produced by a
-    writer, not just the page's raw `/Contents` stream.
+    The groups are produced one at a time, so splitting a long document never
+    holds the page numbers of every part at once.
 
     Args:
-        pdf (bytes): The PDF as a bytes stream.
+        by (int | Sequence[Sequence[int]] | Callable[[int], bool]): How to split
+            the pages. An int is the number of pages per part. A sequence lists
+            the page numbers of each part, e.g. `[range(1, 4), [5]]`. A callable
+            receives each page number and returns True when that page starts a
+            new part.
+        page_count (int): The number of pages in the PDF.
 
     Returns:
-        List[bytes]: A list of bytes streams, one for each page.
-    """
-    pdf_file = PdfReader(BytesIO(pdf))
-    result = []
+        Iterator[List[int]]: The page numbers of each part.
 
-    for page in pdf_file.pages:
-        writer = PdfWriter()
-        writer.add_page(page)
-        with BytesIO() as f:
-            writer.write(f)
-            f.seek(0)
-            result.append(f.read())
-
-    return result
+    Raises:
+        ValueError: If the number of pages per part is less than 1, or a listed
+            part has no pages.
+        IndexError: If a listed page number is out of range.
+    """
+    if isinstance(by, int):
+        if by < 1:
+            msg = "pages per part must be at least 1"
+            raise ValueError(msg)
+        for start in range(1, page_count + 1, by):
+            yield list(range(start, min(start + by, page_count + 1)))
+        return
+
+    if callable(by):
+        part = []
+        for each in range(1, page_count + 1):
+            if part and by(each):
+                yield part
+                part = []
+            part.append(each)
+        if part:
+            yield part
+        return
+
+    for each in by:
+        part = list(each)
+        if not part:
+            msg = "a part must have at least one page"
+            raise ValueError(msg)
+        if not all(1 <= page <= page_count for page in part):
+            msg = "page number out of range"
+            raise IndexError(msg)
+        yield part
 
 
 def generic_merge(items: list, merger: Callable[[Any, Any], Any]) -> Any:
@@ -152,8 +208,8 @@ def merge_two_pdfs(pdf: bytes, other: bytes) -> bytes:
         bytes: The merged PDF file as a byte stream.
     """
     output = PdfWriter()
-    pdf_file = PdfReader(BytesIO(pdf))
-    other_file = PdfReader(BytesIO(other))
+    pdf_file = PdfReader(stream_to_f_obj(pdf))
+    other_file = PdfReader(stream_to_f_obj(other))
     result = BytesIO()
 
     for page in pdf_file.pages:
@@ -353,7 +409,7 @@ def get_version(pdf: bytes) -> str | None:
     """
 
     version_identifier_length = len(VERSION_IDENTIFIERS[0])
-    version_identifier = pdf[:version_identifier_length]
+    version_identifier = bytes(pdf[:version_identifier_length])
     if version_identifier not in VERSION_IDENTIFIERS:
         return None
 
@@ -386,6 +442,7 @@ def set_version(pdf: bytes, old: str | None, new: str | None) -> bytes:
     new_header = VERSION_IDENTIFIER_PREFIX + new.encode()
 
     if old is None:
+        pdf = bytes(pdf)
         if not pdf.startswith(VERSION_IDENTIFIER_PREFIX):
             return pdf
 
@@ -398,7 +455,7 @@ def set_version(pdf: bytes, old: str | None, new: str | None) -> bytes:
         return new_header + pdf[header_end:]
 
     old_header = VERSION_IDENTIFIER_PREFIX + old.encode()
-    if pdf.startswith(old_header):
+    if pdf[: len(old_header)] == old_header:
         return new_header + pdf[len(old_header) :]
 
-    return pdf.replace(old_header, new_header, 1)
+    return bytes(pdf).replace(old_header, new_header, 1)
@@ -9,17 +9,40 @@ and to copy specific widgets from the watermarks to the original PDF.
 """
 
 from collections import defaultdict
-from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from io import BytesIO
-from typing import Any, Dict, List, Optional
+from itertools import groupby
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 from pypdf import PageObject, PdfReader, PdfWriter
-from pypdf.generic import ArrayObject, NameObject
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+    StreamObject,
+)
 from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfmetrics import _fonts
+from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfgen.canvas import Canvas
 
-from .constants import Annots
+from .adapter import stream_to_f_obj
+from .constants import (
+    Annots,
+    BBox,
+    Contents,
+    Form,
+    Fx,
+    Parent,
+    Resources,
+    Subtype,
+    Type,
+    XObject,
+)
 from .patterns import get_widget_key
+from .table import draw_table
 
 
 @lru_cache(maxsize=128)
@@ -46,27 +69,51 @@ def draw_text(canvas: Canvas, **kwargs) -> None:
     Args:
         canvas (Canvas): The ReportLab Canvas object to draw on.
         **kwargs: Keyword arguments containing the text's properties and coordinates.
-            - widget: The widget object containing font, font_size, font_color, and value.
+            - text (str): The text to draw.
+            - font (str): The name of the font.
+            - font_size (float): The size of the font.
+            - font_color (tuple): A tuple representing the RGB color of the text.
             - x (float): The x-coordinate of the text's starting point.
             - y (float): The y-coordinate of the text's starting point.
 
     Returns:
         None
     """
-    widget = kwargs["widget"]
-    coordinate_x = kwargs["x"]
-    coordinate_y = kwargs["y"]
-    font_mapping = kwargs.get("font_mapping", {})
+    draw_texts(canvas, [kwargs], kwargs.get("font_mapping", {}))
 
-    text_to_draw = widget.value
-    canvas.setFont(font_mapping.get(widget.font, widget.font), widget.font_size)
-    canvas.setFillColorRGB(
-        widget.font_color[0], widget.font_color[1], widget.font_color[2]
-    )
-    text_obj = canvas.beginText(coordinate_x, coordinate_y)
-    for line in text_to_draw.split("\n"):
-        text_obj.textLine(line)
-    canvas.drawText(text_obj)
+
+def draw_texts(canvas: Canvas, texts: List[dict], font_mapping: Dict[str, str]) -> None:
+    """
+    Draws many text strings on the given canvas with as few text objects as possible.
+
+    Consecutive texts with the same font, size, and color are grouped, and each
+    group is emitted as a single ReportLab text object that only moves its
+    origin between texts, so the font and color are set once per group instead
+    of once per text. Texts are painted in the given order, so overlapping texts
+    stack the same way as when drawn one by one.
+
+    Args:
+        canvas (Canvas): The ReportLab Canvas object to draw on.
+        texts (List[dict]): The drawing instructions of the texts, each with the
+            keyword arguments accepted by `draw_text`.
+        font_mapping (Dict[str, str]): A dictionary mapping original font names
+            to temporary unique font names used by ReportLab.
+
+    Returns:
+        None
+    """
+    for (font, font_size, font_color), group in groupby(
+        texts,
+        key=lambda each: (each["font"], each["font_size"], tuple(each["font_color"])),
+    ):
+        text_obj = canvas.beginText()
+        text_obj.setFont(font_mapping.get(font, font), font_size)
+        text_obj.setFillColorRGB(*font_color)
+        for each in group:
+            text_obj.setTextOrigin(each["x"], each["y"])
+            for line in each["text"].split("\n"):
+                text_obj.textLine(line)
+        canvas.drawText(text_obj)
 
 
 def draw_line(canvas: Canvas, **kwargs) -> None:
@@ -239,104 +286,403 @@ def draw_image(canvas: Canvas, **kwargs) -> None:
     )
 
 
-def create_watermarks_and_draw(
-    pdf: bytes, to_draw: List[dict], font_mapping: Optional[Dict[str, str]] = None
+def _register_worker_fonts(fonts: Dict[str, bytes]) -> None:
+    """
+    Registers fonts with ReportLab inside a watermark rendering worker process.
+
+    Worker processes do not necessarily inherit the temporary fonts registered
+    by the parent process, so each worker registers them again under the same
+    ReportLab names before rendering any page.
+
+    Args:
+        fonts (Dict[str, bytes]): A mapping from ReportLab font names to their
+            TTF streams.
+    """
+    for rl_name, ttf_stream in fonts.items():
+        _fonts[rl_name] = TTFont(rl_name, BytesIO(ttf_stream))
+
+
+def render_page_watermarks(
+    pdf: bytes,
+    page_to_items: Dict[int, List[Any]],
+    render: Callable[[Tuple[float, float], List[Any]], bytes],
+    workers: Optional[int] = None,
+    fonts: Optional[Dict[str, bytes]] = None,
 ) -> List[bytes]:
     """
-    Creates a watermark PDF for each page of the input PDF based on the drawing instructions.
+    Renders a watermark for each page of a PDF that has items to draw.
 
-    This function reads the input PDF to determine page sizes, then uses ReportLab
-    to create a separate, single-page PDF (a watermark) for each page that has
-    drawing instructions. The returned list is aligned to the input PDF page
-    count; pages without drawing instructions contain ``b""``.
+    The page sizes are read from the input PDF once and `render` is called with
+    the size and items of every page that has any. When `workers` is greater
+    than one and more than one page needs rendering, the pages are rendered in
+    a process pool of at most that many processes. `render` and the items must
+    then be picklable, and `fonts` are registered in each worker before it
+    renders. The results are assembled in page order either way.
 
     Args:
-        pdf (bytes): The original PDF file as a byte stream.
-        to_draw (List[dict]): A list of drawing instructions, where each dictionary
-            must contain a "page_number" key (1-based) and a "type" key
-            ("image", "text", "line", "rect", "circle", or "ellipse") along
-            with type-specific parameters.
-        font_mapping (Optional[Dict[str, str]]): A dictionary mapping original font names
-            to temporary unique font names used by ReportLab.
+        pdf (bytes): The PDF file as a byte stream.
+        page_to_items (Dict[int, List[Any]]): A mapping from 1-based page number
+            to the items to draw on that page.
+        render (Callable[[Tuple[float, float], List[Any]], bytes]): A function
+            rendering a page of the given size with the given items into a
+            single-page watermark PDF.
+        workers (Optional[int]): The maximum number of worker processes. Pages
+            are rendered in the current process when not greater than one.
+        fonts (Optional[Dict[str, bytes]]): A mapping from ReportLab font names
+            to TTF streams that worker processes need to register.
 
     Returns:
-        List[bytes]: A list of watermark PDF byte streams. An empty byte string (b"")
-            is used for pages without any drawing instructions.
+        List[bytes]: A list of watermark PDF byte streams aligned to the input
+            PDF pages, with b"" for pages without any items.
+    """
+    pages = PdfReader(stream_to_f_obj(pdf)).pages
+    result = [b""] * len(pages)
+    page_indexes = [i for i in range(len(pages)) if page_to_items.get(i + 1)]
+    sizes = [
+        (float(pages[i].mediabox[2]), float(pages[i].mediabox[3])) for i in page_indexes
+    ]
+    items = [page_to_items[i + 1] for i in page_indexes]
+
+    if workers is not None and workers > 1 and len(page_indexes) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(page_indexes)),
+            initializer=_register_worker_fonts,
+            initargs=(fonts or {},),
+        ) as executor:
+            watermarks = list(executor.map(render, sizes, items))
+    else:
+        watermarks = [
+            render(size, each) for size, each in zip(sizes, items, strict=True)
+        ]
+
+    for i, watermark in zip(page_indexes, watermarks, strict=True):
+        result[i] = watermark
+
+    return result
+
+
+def draw_watermark(
+    page_size: Tuple[float, float],
+    elements: List[dict],
+    font_mapping: Optional[Dict[str, str]] = None,
+) -> bytes:
     """
+    Draws the elements of a single page onto a new watermark PDF.
+
+    Elements are drawn in order, except that each run of consecutive text
+    elements is drawn in batches with `draw_texts`.
+
+    Args:
+        page_size (Tuple[float, float]): The width and height of the page.
+        elements (List[dict]): The drawing instructions of the page.
+        font_mapping (Optional[Dict[str, str]]): A dictionary mapping original
+            font names to temporary unique font names used by ReportLab.
+
+    Returns:
+        bytes: The single-page watermark PDF.
+    """
+    font_mapping = font_mapping or {}
     type_to_func = {
         "image": draw_image,
-        "text": draw_text,
+        "table": draw_table,
         "line": draw_line,
         "rect": draw_rect,
         "circle": draw_circle,
         "ellipse": draw_ellipse,
     }
 
-    page_to_to_draw = defaultdict(list)
-    for each in to_draw:
-        page_to_to_draw[each["page_number"]].append(each)
+    buff = BytesIO()
+    canvas = Canvas(buff, pagesize=page_size)
 
-    pdf_file = PdfReader(BytesIO(pdf))
-    page_count = len(pdf_file.pages)
-    result = [b""] * page_count
-    font_mapping = font_mapping or {}
-
-    for page_num in range(1, page_count + 1):
-        elements = page_to_to_draw.get(page_num, [])
-        if not elements:
+    for is_text, run in groupby(elements, key=lambda each: each["type"] == "text"):
+        if is_text:
+            draw_texts(canvas, list(run), font_mapping)
             continue
 
-        page = pdf_file.pages[page_num - 1]
-        buff = BytesIO()
+        for element in run:
+            type_to_func[element["type"]](canvas, **element, font_mapping=font_mapping)
 
-        canvas = Canvas(
-            buff,
-            pagesize=(
-                float(page.mediabox[2]),
-                float(page.mediabox[3]),
-            ),
-        )
+    canvas.save()
+    buff.seek(0)
+    return buff.read()
 
-        for element in elements:
-            type_to_func[element["type"]](canvas, **element, font_mapping=font_mapping)
 
-        canvas.save()
-        buff.seek(0)
-        result[page_num - 1] = buff.read()
+def flatten_to_draw(to_draw: List[dict | List[dict]]) -> List[dict]:
+    """
+    Flattens the drawing instructions of raw elements into a single list.
+
+    Most raw elements produce a single instruction, but elements spanning
+    several pages, such as tables, produce a list of them.
+
+    Args:
+        to_draw (List[dict | List[dict]]): The `to_draw` values of raw elements.
+
+    Returns:
+        List[dict]: The drawing instructions in element order.
+    """
+    result = []
+    for each in to_draw:
+        if isinstance(each, list):
+            result.extend(each)
+        else:
+            result.append(each)
 
     return result
 
 
+def create_watermarks_and_draw(
+    pdf: bytes,
+    to_draw: List[dict | List[dict]],
+    font_mapping: Optional[Dict[str, str]] = None,
+    workers: Optional[int] = None,
+    fonts: Optional[List[Tuple[str, bytes]]] = None,
+) -> List[bytes]:
+    """
+    Creates a watermark PDF for each page of the input PDF based on the drawing instructions.
+
+    This function reads the input PDF to determine page sizes, then uses ReportLab
+    to create a separate, single-page PDF (a watermark) for each page that has
+    drawing instructions. The returned list is aligned to the input PDF page
+    count; pages without drawing instructions contain ``b""``. With `workers`
+    greater than one, pages are rendered in parallel worker processes.
+
+    Args:
+        pdf (bytes): The original PDF file as a byte stream.
+        to_draw (List[dict | List[dict]]): A list of drawing instructions, where each dictionary
+            must contain a "page_number" key (1-based) and a "type" key
+            ("image", "text", "line", "rect", "circle", "ellipse", or "table")
+            along with type-specific parameters. Lists of instructions are
+            flattened with `flatten_to_draw`.
+        font_mapping (Optional[Dict[str, str]]): A dictionary mapping original font names
+            to temporary unique font names used by ReportLab.
+        workers (Optional[int]): The maximum number of worker processes used to
+            render pages. Defaults to None, rendering in the current process.
+        fonts (Optional[List[Tuple[str, bytes]]]): The (font name, TTF stream)
+            pairs behind `font_mapping`, registered in each worker process.
+
+    Returns:
+        List[bytes]: A list of watermark PDF byte streams. An empty byte string (b"")
+            is used for pages without any drawing instructions.
+    """
+    page_to_to_draw = defaultdict(list)
+    for each in flatten_to_draw(to_draw):
+        page_to_to_draw[each["page_number"]].append(each)
+
+    font_mapping = font_mapping or {}
+
+    return render_page_watermarks(
+        pdf,
+        page_to_to_draw,
+        partial(draw_watermark, font_mapping=font_mapping),
+        workers,
+        {
+            font_mapping[font_name]: ttf_stream
+            for font_name, ttf_stream in fonts or []
+            if font_name in font_mapping
+        },
+    )
+
+
 def merge_watermarks_with_pdf(
     pdf: bytes,
     watermarks: List[bytes],
+    as_xobject: bool = False,
 ) -> bytes:
     """
     Merges the generated watermarks with the original PDF content.
 
     This function takes a PDF file and a list of page-aligned watermarks as
     input. Each non-empty watermark stream is read as a single-page PDF and
-    merged into the corresponding output page.
+    merged into the corresponding output page. Only page content and resources
+    are changed; each page's `/Annots` are left untouched, so widgets survive the
+    merge without being removed and copied back.
+
+    By default the watermark page is merged with `merge_page`, which rewrites the
+    page's content stream and merges resource dictionaries. When `as_xobject` is
+    enabled, the watermark is instead added as a Form XObject that is invoked
+    from a small content stream appended to the page, leaving the original
+    content untouched. Identical watermarks share one XObject per document, and
+    parsed watermarks are cached across documents.
 
     Args:
         pdf (bytes): The PDF file as a byte stream.
         watermarks (List[bytes]): A list of byte streams, where each element represents the watermark for a specific page.
+        as_xobject (bool): Whether to overlay watermarks as Form XObjects
+            instead of merging page content. Defaults to False.
 
     Returns:
         bytes: A byte stream representing the merged PDF with watermarks applied.
     """
     result = BytesIO()
-    output = PdfWriter(BytesIO(pdf))
+    output = PdfWriter(stream_to_f_obj(pdf))
+
+    merge_watermarks_with_writer(output, watermarks, as_xobject)
+
+    output.write(result)
+    result.seek(0)
+    return result.read()
 
-    for i, page in enumerate(output.pages):
+
+def merge_watermarks_with_writer(
+    writer: PdfWriter,
+    watermarks: List[bytes],
+    as_xobject: bool = False,
+) -> None:
+    """
+    Merges page-aligned watermarks into the pages of an open PDF writer.
+
+    This is the in-place counterpart of `merge_watermarks_with_pdf`, for callers
+    that make other changes with the same writer and serialize it only once.
+
+    Args:
+        writer (PdfWriter): The writer whose pages the watermarks are merged into.
+        watermarks (List[bytes]): A list of byte streams, where each element represents the watermark for a specific page.
+        as_xobject (bool): Whether to overlay watermarks as Form XObjects
+            instead of merging page content. Defaults to False.
+    """
+    overlays = {}
+
+    for i, page in enumerate(writer.pages):
         if watermarks[i]:
+            if as_xobject:
+                _overlay_watermark(writer, page, watermarks[i], overlays)
+                continue
+
             watermark = PdfReader(BytesIO(watermarks[i]))
             if watermark.pages:
                 page.merge_page(watermark.pages[0])
 
-    output.write(result)
-    result.seek(0)
-    return result.read()
+
+def _get_watermark_xobject(watermark: bytes) -> Optional[StreamObject]:
+    """
+    Converts the first page of a watermark PDF into a Form XObject.
+
+    The XObject takes the page's content as its stream, the page's media box as
+    its bounding box, and references the page's resources. It is not bound to
+    any writer and must be cloned into one before use.
+
+    Args:
+        watermark (bytes): The watermark PDF stream.
+
+    Returns:
+        Optional[StreamObject]: The Form XObject, or None if the watermark has no pages.
+    """
+    reader = PdfReader(BytesIO(watermark))
+    if not reader.pages:
+        return None
+
+    page = reader.pages[0]
+    contents = page.get_contents()  # pylint: disable=E1101
+
+    result = DecodedStreamObject()
+    result.set_data(contents.get_data() if contents is not None else b"")
+    result[NameObject(Type)] = NameObject(XObject)
+    result[NameObject(Subtype)] = NameObject(Form)
+    result[NameObject(BBox)] = ArrayObject(page.mediabox)  # pylint: disable=E1101
+    result[NameObject(Resources)] = page.get(  # pylint: disable=E1101
+        Resources, DictionaryObject()
+    )
+
+    return result.flate_encode()
+
+
+def _get_page_resources(page: PageObject) -> DictionaryObject:
+    """
+    Gets the resources of a page, following inheritance from its parents.
+
+    Args:
+        page (PageObject): The page to get the resources of.
+
+    Returns:
+        DictionaryObject: The page's resources, or an empty dictionary if neither
+            the page nor any of its parents define them.
+    """
+    node = page
+    while node is not None:
+        if Resources in node:
+            return cast(DictionaryObject, node[Resources].get_object())
+        node = node.get(Parent)
+        node = node.get_object() if node is not None else None
+
+    return DictionaryObject()
+
+
+def _overlay_watermark(
+    writer: PdfWriter, page: PageObject, watermark: bytes, overlays: dict
+) -> None:
+    """
+    Overlays a watermark onto a page as a Form XObject.
+
+    The page's original content is wrapped in `q`/`Q` so its graphics state does
+    not leak into the overlay, and a content stream invoking the XObject is
+    appended. The page receives its own copies of its resource and XObject
+    dictionaries, so resources shared with other pages are not modified.
+
+    Args:
+        writer (PdfWriter): The writer the page belongs to.
+        page (PageObject): The page to overlay the watermark onto.
+        watermark (bytes): The watermark PDF stream.
+        overlays (dict): Objects already added to `writer` by this merge, used
+            to share XObjects between pages with identical watermarks.
+    """
+    if watermark not in overlays:
+        xobject = _get_watermark_xobject(watermark)
+        overlays[watermark] = (
+            writer._add_object(xobject.clone(writer))  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+            if xobject is not None
+            else None
+        )
+
+    if overlays[watermark] is None:
+        return
+
+    resources = DictionaryObject(_get_page_resources(page))
+    xobjects = DictionaryObject(resources.get(XObject, DictionaryObject()).get_object())
+    name = Fx
+    suffix = 0
+    while name in xobjects:
+        suffix += 1
+        name = f"{Fx}{suffix}"
+    xobjects[NameObject(name)] = overlays[watermark]
+    resources[NameObject(XObject)] = xobjects
+    page[NameObject(Resources)] = resources
+
+    if "q" not in overlays:
+        overlays["q"] = writer._add_object(_content_stream(b"q\n"))  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+
+    existing = page.get(Contents)
+    if existing is None:
+        existing = []
+    elif isinstance(existing.get_object(), ArrayObject):
+        existing = list(existing.get_object())
+    else:
+        existing = [existing]
+
+    page[NameObject(Contents)] = ArrayObject(
+        [overlays["q"]]
+        + existing
+        + [
+            writer._add_object(  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+                _content_stream(f"\nQ\nq\n{name} Do\nQ\n".encode())
+            )
+        ]
+    )
+
+
+def _content_stream(data: bytes) -> StreamObject:
+    """
+    Creates a content stream holding the given data.
+
+    Args:
+        data (bytes): The content stream data.
+
+    Returns:
+        StreamObject: The content stream.
+    """
+    result = DecodedStreamObject()
+    result.set_data(data)
+
+    return result
 
 
 def _clone_page_widgets(
@@ -349,6 +695,9 @@ def _clone_page_widgets(
 
     When `keys` is None, every widget annotation on the page is cloned. When it
     is a set, only annotations whose short widget key is present are cloned.
+    Watermarks only hold the widgets just created on them, so their annotations
+    are matched directly instead of building a widget index for each of these
+    short-lived streams.
 
     Args:
         writer (PdfWriter): The PdfWriter for cloning.
@@ -358,12 +707,14 @@ def _clone_page_widgets(
     Returns:
         List[Any]: A list of cloned widget objects.
     """
-    cloned_widgets = []
-    for annot in page.get(Annots, []):
-        key = get_widget_key(annot.get_object(), False)
-        if keys is None or key in keys:
-            cloned_widgets.append(annot.clone(writer))
-    return cloned_widgets
+    if keys is None:
+        return [annot.clone(writer) for annot in page.get(Annots, [])]
+
+    return [
+        annot.clone(writer)
+        for annot in page.get(Annots, [])
+        if get_widget_key(annot.get_object(), False) in keys
+    ]
 
 
 def _collect_from_single_watermark_specific_page(
@@ -424,20 +775,22 @@ def _collect_from_single_watermark_1_to_1(
 
 def _collect_from_multiple_watermarks(
     writer: PdfWriter,
-    watermarks: List[bytes],
+    watermarks: List[bytes] | List[List[bytes]],
     keys: Optional[set[str]],
     page_num: Optional[int],
 ) -> Dict[int, List[Any]]:
     """
     Collects widgets from a list of watermark PDFs.
 
-    Each watermark stream corresponds to one output page by list index. If
-    `page_num` is provided, only that zero-based page within each watermark PDF
-    contributes widgets.
+    Each list entry corresponds to one output page by list index and is either
+    a single watermark stream or a list of watermark streams whose widgets are
+    collected in order. If `page_num` is provided, only that zero-based page
+    within each watermark PDF contributes widgets.
 
     Args:
         writer (PdfWriter): The PdfWriter for cloning.
-        watermarks (List[bytes]): A list of watermark PDF byte streams.
+        watermarks (List[bytes] | List[List[bytes]]): A list of watermark PDF
+            byte streams, or of lists of them, one entry per output page.
         keys (Optional[set[str]]): Keys of widgets to clone.
         page_num (Optional[int]): The page index within each watermark PDF.
 
@@ -445,19 +798,22 @@ def _collect_from_multiple_watermarks(
         Dict[int, List[Any]]: A dictionary mapping output page indices to cloned widgets.
     """
     widgets_to_copy = defaultdict(list)
-    for i, watermark_stream in enumerate(watermarks):
-        if not watermark_stream:
-            continue
-        watermark_reader = PdfReader(BytesIO(watermark_stream))
-        for j, page in enumerate(watermark_reader.pages):
-            if page_num is None or j == page_num:
-                widgets_to_copy[i].extend(_clone_page_widgets(writer, page, keys))
+    for i, page_watermarks in enumerate(watermarks):
+        for watermark_stream in (
+            [page_watermarks] if isinstance(page_watermarks, bytes) else page_watermarks
+        ):
+            if not watermark_stream:
+                continue
+            watermark_reader = PdfReader(BytesIO(watermark_stream))
+            for j, page in enumerate(watermark_reader.pages):
+                if page_num is None or j == page_num:
+                    widgets_to_copy[i].extend(_clone_page_widgets(writer, page, keys))
     return widgets_to_copy
 
 
 def _collect_widgets_to_copy(
     writer: PdfWriter,
-    watermarks: List[bytes] | bytes,
+    watermarks: List[bytes] | List[List[bytes]] | bytes,
     keys: Optional[List[str]],
     page_num: Optional[int],
 ) -> Dict[int, List[Any]]:
@@ -466,11 +822,12 @@ def _collect_widgets_to_copy(
 
     A single watermark byte stream can either map all pages 1:1 or copy one
     zero-based page to the first output page. A list of watermark streams maps
-    each list entry to the output page with the same index.
+    each list entry, either a stream or a list of streams, to the output page
+    with the same index.
 
     Args:
         writer (PdfWriter): The PdfWriter for the output PDF.
-        watermarks (List[bytes] | bytes): Watermark(s) to copy from.
+        watermarks (List[bytes] | List[List[bytes]] | bytes): Watermark(s) to copy from.
         keys (Optional[List[str]]): Keys of widgets to copy.
         page_num (Optional[int]): Specific page index to copy from.
 
@@ -520,7 +877,7 @@ def _apply_widgets_to_pages(
 
 def copy_watermark_widgets(
     pdf: bytes,
-    watermarks: List[bytes] | bytes,
+    watermarks: List[bytes] | List[List[bytes]] | bytes,
     keys: Optional[List[str]],
     page_num: Optional[int],
 ) -> bytes:
@@ -530,12 +887,14 @@ def copy_watermark_widgets(
     This function selectively copies widgets (e.g., form fields) from watermark PDFs
     to the original PDF. It handles both a single watermark PDF (which can be mapped
     1:1 or have a specific page extracted) and a list of watermark PDFs (where each
-    element corresponds to a page in the original PDF).
+    element corresponds to a page in the original PDF). An element can also be a
+    list of watermark PDFs, so widgets rendered separately for the same page are
+    copied in a single pass.
 
     Args:
         pdf (bytes): The original PDF file as a byte stream.
-        watermarks (List[bytes] | bytes): Either a single PDF byte stream or
-            a list of PDF byte streams.
+        watermarks (List[bytes] | List[List[bytes]] | bytes): Either a single PDF
+            byte stream, a list of PDF byte streams, or a list of lists of them.
         keys (Optional[List[str]]): A list of widget keys to copy. If None,
             all widgets are copied.
         page_num (Optional[int]): The page number index (0-based) within the
@@ -544,7 +903,7 @@ def copy_watermark_widgets(
     Returns:
         bytes: The modified PDF byte stream with copied widgets.
     """
-    pdf_writer = PdfWriter(BytesIO(pdf))
+    pdf_writer = PdfWriter(stream_to_f_obj(pdf))
 
     widgets_to_copy = _collect_widgets_to_copy(pdf_writer, watermarks, keys, page_num)
     _apply_widgets_to_pages(pdf_writer, widgets_to_copy)
@@ -13,6 +13,7 @@ from dataclasses import dataclass
 
 from .checkbox import CheckBoxField
 from .dropdown import DropdownField
+from .grid import FieldGrid
 from .image import ImageField
 from .radio import RadioGroup
 from .signature import SignatureField
@@ -38,3 +39,4 @@ class Fields:
     DropdownField = DropdownField
     SignatureField = SignatureField
     ImageField = ImageField
+    FieldGrid = FieldGrid
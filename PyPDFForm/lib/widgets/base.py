@@ -14,17 +14,34 @@ Classes:
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from functools import lru_cache
 from inspect import signature
 from io import BytesIO
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from pypdf import PdfReader
+from pypdf.generic import DictionaryObject, IndirectObject, NameObject
 from reportlab.lib.colors import Color
 from reportlab.pdfgen.canvas import Canvas
 
-from ..constants import fieldFlags, required
+from ..constants import (
+    DEFAULT_FONT,
+    BaseFont,
+    Encoding,
+    Font,
+    Helv,
+    Subtype,
+    Type,
+    Type1,
+    WinAnsiEncoding,
+    fieldFlags,
+    required,
+)
+from ..watermark import render_page_watermarks
+
+if TYPE_CHECKING:
+    from pypdf import PdfWriter
 
 
 class Widget:
@@ -43,6 +60,9 @@ class Widget:
         ALLOWED_HOOK_PARAMS (list): List of allowed hook parameters for the widget.
         NONE_DEFAULTS (list): List of parameters that default to None.
         ACRO_FORM_FUNC (str): Name of the AcroForm function to use for rendering the widget.
+        DIRECT_CREATION (bool): Whether the widget implements
+            `build_annotation(writer, page, resources)` to build its annotation
+            directly into a document instead of rendering through ReportLab.
     """
 
     USER_PARAMS = []
@@ -50,6 +70,7 @@ class Widget:
     ALLOWED_HOOK_PARAMS = []
     NONE_DEFAULTS = []
     ACRO_FORM_FUNC = ""
+    DIRECT_CREATION = False
 
     def __init__(
         self,
@@ -173,7 +194,38 @@ class Widget:
         getattr(canvas.acroForm, self.ACRO_FORM_FUNC)(**self.acro_form_params)
 
     @staticmethod
-    def bulk_watermarks(widgets: List[Widget], stream: bytes) -> List[bytes]:
+    def get_form_font(writer: PdfWriter, resources: dict) -> IndirectObject:
+        """
+        Gets the default form font used by directly created widgets.
+
+        The font is the standard Helvetica font ReportLab uses for form fields.
+        It is added to the document once and shared through `resources`.
+
+        Args:
+            writer (PdfWriter): The writer of the document the widgets are created in.
+            resources (dict): The cache shared by the widgets of the document.
+
+        Returns:
+            IndirectObject: A reference to the font dictionary.
+        """
+        if Helv not in resources:
+            resources[Helv] = writer._add_object(  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+                DictionaryObject(
+                    {
+                        NameObject(Type): NameObject(Font),
+                        NameObject(Subtype): NameObject(Type1),
+                        NameObject(BaseFont): NameObject(f"/{DEFAULT_FONT}"),
+                        NameObject(Encoding): NameObject(WinAnsiEncoding),
+                    }
+                )
+            )
+
+        return resources[Helv]
+
+    @staticmethod
+    def bulk_watermarks(
+        widgets: List[Widget], stream: bytes, workers: Optional[int] = None
+    ) -> List[bytes]:
         """
         Generates watermarks for multiple widgets in bulk.
 
@@ -182,11 +234,14 @@ class Widget:
         grouped by their page number, and all widgets for a given page are drawn
         onto a single ReportLab canvas, which is then returned as the watermark
         stream for that page. This is more efficient than generating watermarks
-        for each widget individually.
+        for each widget individually. With `workers` greater than one, pages are
+        rendered in parallel worker processes.
 
         Args:
             widgets (List[Widget]): A list of Widget objects to be watermarked.
             stream (bytes): The PDF stream to be watermarked.
+            workers (Optional[int]): The maximum number of worker processes used
+                to render pages. Defaults to None, rendering in the current process.
 
         Returns:
             List[bytes]: A list of watermark streams (bytes), where the index
@@ -195,43 +250,37 @@ class Widget:
                          watermark for that page. Pages without any widgets will
                          have an empty byte string (b"").
         """
-        pdf = PdfReader(BytesIO(stream))
-        page_count = len(pdf.pages)
-        result = [b""] * page_count
-
-        widgets_by_page = {}
+        widgets_by_page = defaultdict(list)
         for widget in widgets:
-            if widget.page_number not in widgets_by_page:
-                widgets_by_page[widget.page_number] = []
             widgets_by_page[widget.page_number].append(widget)
 
-        for page_num in range(1, page_count + 1):
-            if page_num not in widgets_by_page:
-                continue
-
-            # Use a fresh buffer per page to avoid stale trailing bytes
-            # when the current page watermark is smaller than a previous page.
-            watermark = BytesIO()
-            page = pdf.pages[page_num - 1]
-
-            canvas = Canvas(
-                watermark,
-                pagesize=(
-                    float(page.mediabox[2]),
-                    float(page.mediabox[3]),
-                ),
-            )
+        return render_page_watermarks(stream, widgets_by_page, _draw_widgets, workers)
+
 
-            for widget in widgets_by_page[page_num]:
-                getattr(widget, "_required_handler")(canvas)
-                widget.canvas_operations(canvas)
+def _draw_widgets(page_size: Tuple[float, float], widgets: List[Widget]) -> bytes:
+    """
+    Draws the widgets of a single page onto a new watermark PDF.
 
-            canvas.showPage()
-            canvas.save()
-            watermark.seek(0)
-            result[page_num - 1] = watermark.read()
+    Args:
+        page_size (Tuple[float, float]): The width and height of the page.
+        widgets (List[Widget]): The widgets located on the page.
 
-        return result
+    Returns:
+        bytes: The single-page watermark PDF.
+    """
+    # Use a fresh buffer per page to avoid stale trailing bytes
+    # when the current page watermark is smaller than a previous page.
+    watermark = BytesIO()
+    canvas = Canvas(watermark, pagesize=page_size)
+
+    for widget in widgets:
+        getattr(widget, "_required_handler")(canvas)
+        widget.canvas_operations(canvas)
+
+    canvas.showPage()
+    canvas.save()
+    watermark.seek(0)
+    return watermark.read()
 
 
 @dataclass
@@ -30,10 +30,12 @@ class DropdownWidget(TextWidget):
         NONE_DEFAULTS (list): A list of parameters that default to None.
         ACRO_FORM_FUNC (str): The name of the AcroForm function to use for
             creating the dropdown.
+        DIRECT_CREATION (bool): Dropdowns are always created through ReportLab.
     """
 
     NONE_DEFAULTS = []
     ACRO_FORM_FUNC = "_textfield"
+    DIRECT_CREATION = False
 
     def __init__(
         self,
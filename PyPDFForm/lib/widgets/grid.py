@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+This module defines the `FieldGrid` class, which describes a regular grid of
+form fields of the same type, such as the answer boxes of a survey or an answer
+sheet.
+
+A grid is expanded straight into widget objects for `bulk_create_fields`. The
+shared attributes are validated and converted once per grid, and the cell
+coordinates are computed once per row and once per column, so no field
+definition dataclass has to be built for each individual cell.
+"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Type
+
+from .base import Field
+from .radio import RadioGroup
+
+
+@dataclass
+class FieldGrid:
+    """
+    Represents a grid of form fields of the same type in a PDF document.
+
+    The cell in row `row` and column `column` is placed at
+    `(x + column * column_pitch, y + row * row_pitch)`. Since PDF coordinates
+    grow upward, use a negative `row_pitch` to lay rows out from top to bottom.
+
+    Each cell is named by formatting `name` with `row`, `column`, and `index`
+    (the cell's position in row-major order), all counted from `start`. For
+    example, `"answer_{row}_{column}"` names the first cell `answer_0_0`.
+
+    A grid of `RadioGroup` creates one radio group per row whose buttons are
+    the columns of that row, so `name` is formatted with `row` and `index`
+    only, both being the row number.
+
+    Attributes:
+        field_type (Type[Field]): The field definition class of every cell,
+            e.g. `Fields.CheckBoxField`.
+        name (str): The naming template of the cells.
+        page_number (int): The 1-based page number on which the grid is located.
+        x (float): The x-coordinate of the first cell.
+        y (float): The y-coordinate of the first cell.
+        rows (int): The number of rows in the grid. Defaults to 1.
+        columns (int): The number of columns in the grid. Defaults to 1.
+        column_pitch (float): The horizontal distance between adjacent columns.
+        row_pitch (float): The vertical distance between adjacent rows.
+        start (int): The number the row, column, and index of the cell names
+            start counting from. Defaults to 0.
+        attributes (Dict[str, Any]): Attributes shared by every cell, accepting
+            the same keyword arguments as `field_type`, e.g. `{"size": 12}`.
+    """
+
+    field_type: Type[Field]
+    name: str
+    page_number: int
+    x: float
+    y: float
+    rows: int = 1
+    columns: int = 1
+    column_pitch: float = 0
+    row_pitch: float = 0
+    start: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of fields the grid creates.
+
+        Returns:
+            int: The number of rows for a grid of radio groups, otherwise the
+                number of cells.
+        """
+        if issubclass(self.field_type, RadioGroup):
+            return self.rows
+
+        return self.rows * self.columns
+
+    def build_widgets(self) -> List[Any]:
+        """
+        Builds the widget objects of every field in the grid.
+
+        The shared attributes are validated by constructing a single
+        `field_type` instance, which raises `TypeError` for unsupported
+        attributes exactly like constructing the field directly would. Cells are
+        returned in row-major order.
+
+        Returns:
+            List[Any]: The widget objects of the grid, ready for bulk creation.
+        """
+        xs = [self.x + i * self.column_pitch for i in range(self.columns)]
+        ys = [self.y + i * self.row_pitch for i in range(self.rows)]
+
+        is_radio = issubclass(self.field_type, RadioGroup)
+        prototype = self.field_type(
+            name=self.name,
+            page_number=self.page_number,
+            x=xs if is_radio else self.x,  # type: ignore
+            y=ys if is_radio else self.y,  # type: ignore
+            **self.attributes,
+        )
+        widget_class = getattr(prototype, "_widget_class")
+        params = {
+            k: v
+            for k, v in asdict(prototype).items()
+            if v is not None
+            and k not in ("_widget_class", "name", "page_number", "x", "y")
+        }
+
+        result = []
+        for row, y in enumerate(ys):
+            if is_radio:
+                result.append(
+                    widget_class(
+                        name=self.name.format(
+                            row=row + self.start, index=row + self.start
+                        ),
+                        page_number=self.page_number,
+                        x=xs,
+                        y=[y] * self.columns,
+                        **params,
+                    )
+                )
+                continue
+
+            for column, x in enumerate(xs):
+                result.append(
+                    widget_class(
+                        name=self.name.format(
+                            row=row + self.start,
+                            column=column + self.start,
+                            index=row * self.columns + column + self.start,
+                        ),
+                        page_number=self.page_number,
+                        x=x,
+                        y=y,
+                        **params,
+                    )
+                )
+
+        return result
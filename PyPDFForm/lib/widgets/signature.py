@@ -15,16 +15,24 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from io import BytesIO
-from typing import List, Optional, Type
-
-from pypdf import PdfReader, PdfWriter
-from pypdf.generic import ArrayObject, FloatObject, NameObject, TextStringObject
+from typing import Dict, List, Optional, Tuple, Type
+
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DictionaryObject,
+    FloatObject,
+    NameObject,
+    TextStringObject,
+)
 from reportlab.pdfgen.canvas import Canvas
 
 from ..assets.bedrock import BEDROCK_PDF
-from ..constants import Annots, Rect, T
+from ..constants import Annots, P, Rect, T
 from ..patterns import get_widget_key
+from ..watermark import render_page_watermarks
 from .base import Field
 
 
@@ -44,6 +52,9 @@ class SignatureWidget:
         ALLOWED_HOOK_PARAMS (list): A list of parameter names that can be
             used as hooks to trigger dynamic modifications.
         BEDROCK_WIDGET_TO_COPY (str): The name of the bedrock widget to copy.
+        DIRECT_CREATION (bool): Whether the widget implements
+            `build_annotation(writer, page, resources)` and can be cloned
+            straight into a PDF without an intermediate watermark.
     """
 
     OPTIONAL_PARAMS = [
@@ -52,6 +63,7 @@ class SignatureWidget:
     ]
     ALLOWED_HOOK_PARAMS = ["required", "tooltip"]
     BEDROCK_WIDGET_TO_COPY = "signature"
+    DIRECT_CREATION = True
 
     def __init__(
         self,
@@ -90,7 +102,77 @@ class SignatureWidget:
                 self.hook_params.append((each, kwargs.get(each)))
 
     @staticmethod
-    def bulk_watermarks(widgets: List[SignatureWidget], stream: bytes) -> List[bytes]:
+    @lru_cache(maxsize=1)
+    def get_bedrock_annotations() -> Dict[str, DictionaryObject]:
+        """
+        Parses the bedrock PDF and returns its widget annotations by key.
+
+        The bedrock PDF is parsed only once per process. The returned annotations
+        serve as read-only prototypes: they must be cloned into a target writer
+        rather than modified in place.
+
+        Returns:
+            Dict[str, DictionaryObject]: A mapping from bedrock widget name, such
+                as "signature" or "image", to its annotation dictionary.
+        """
+        bedrock = PdfReader(BytesIO(BEDROCK_PDF))
+        result = {}
+        for annot in bedrock.pages[0].get(Annots, []):  # pylint: disable=E1101
+            key = get_widget_key(annot.get_object(), False)
+            result[key] = annot.get_object()
+
+        return result
+
+    def build_annotation(
+        self, writer: PdfWriter, page: PageObject, resources: dict
+    ) -> DictionaryObject:
+        """
+        Clones the bedrock annotation of this widget directly into a PDF writer.
+
+        Every entry of the cached bedrock prototype is cloned into `writer`, with
+        the name and rectangle replaced and `/P` pointing at the target page.
+        Indirect objects, such as appearance streams, are cloned once per writer
+        and then shared by every widget copied from the same prototype.
+
+        Args:
+            writer (PdfWriter): The writer the annotation is created in.
+            page (PageObject): The page the annotation will be placed on.
+            resources (dict): Objects shared across widgets of the same call.
+                Unused, since sharing is handled by the writer's clone tracking.
+
+        Returns:
+            DictionaryObject: The annotation dictionary, not yet added to `writer`.
+        """
+        del resources
+        result = DictionaryObject()
+        for key, value in self.get_bedrock_annotations()[
+            self.BEDROCK_WIDGET_TO_COPY
+        ].items():
+            if key == T:
+                value = TextStringObject(self.name)
+            elif key == Rect:
+                value = ArrayObject(
+                    [
+                        FloatObject(self.x),
+                        FloatObject(self.y),
+                        FloatObject(self.x + self.optional_parameters.get("width")),
+                        FloatObject(self.y + self.optional_parameters.get("height")),
+                    ]
+                )
+            elif key == P:
+                if page.indirect_reference is None:
+                    continue
+                value = page.indirect_reference
+            else:
+                value = value.clone(writer)
+            result[NameObject(key)] = value
+
+        return result
+
+    @staticmethod
+    def bulk_watermarks(
+        widgets: List[SignatureWidget], stream: bytes, workers: Optional[int] = None
+    ) -> List[bytes]:
         """
         Generates watermarks for multiple signature widgets in bulk.
 
@@ -98,12 +180,16 @@ class SignatureWidget:
         to create a list of watermark PDF streams aligned to the input PDF pages.
         For each page, it copies the configured bedrock annotation, renames it,
         adjusts its rectangle, and writes those cloned annotations into the page's
-        `/Annots` array.
+        `/Annots` array. The bedrock annotations come from the per-process cache
+        of `get_bedrock_annotations`. With `workers` greater than one, pages are
+        rendered in parallel worker processes.
 
         Args:
             widgets (List[SignatureWidget]): A list of SignatureWidget objects to be
                 added as watermarks.
             stream (bytes): The PDF stream of the document to be watermarked.
+            workers (Optional[int]): The maximum number of worker processes used
+                to render pages. Defaults to None, rendering in the current process.
 
         Returns:
             List[bytes]: A list of watermark PDF streams. Each element corresponds to
@@ -113,70 +199,60 @@ class SignatureWidget:
         for widget in widgets:
             page_to_widgets[widget.page_number].append(widget)
 
-        input_pdf = PdfReader(BytesIO(stream))
-        page_count = len(input_pdf.pages)
-        result = [b""] * page_count
+        return render_page_watermarks(
+            stream, page_to_widgets, _draw_signature_widgets, workers
+        )
 
-        bedrock = PdfReader(BytesIO(BEDROCK_PDF))
-        page = bedrock.pages[0]
-        annot_type_to_annot = {}
-        for annot in page.get(Annots, []):  # pylint: disable=E1101
-            key = get_widget_key(annot.get_object(), False)
-            annot_type_to_annot[key] = annot.get_object()
-
-        for page_num in range(1, page_count + 1):
-            page_widgets = page_to_widgets.get(page_num, [])
-            if not page_widgets:
-                continue
-
-            # pylint: disable=R0801
-            watermark = BytesIO()
-            p = input_pdf.pages[page_num - 1]
-            canvas = Canvas(
-                watermark,
-                pagesize=(
-                    float(p.mediabox[2]),
-                    float(p.mediabox[3]),
-                ),
-            )
-            canvas.showPage()
-            canvas.save()
-            watermark.seek(0)
-
-            out = PdfWriter(watermark)
-
-            widgets_to_copy = []
-            for widget in page_widgets:
-                widget_to_copy = annot_type_to_annot[
-                    widget.BEDROCK_WIDGET_TO_COPY
-                ].clone(out, force_duplicate=True)
-
-                widget_to_copy.get_object()[NameObject(T)] = TextStringObject(
-                    widget.name
-                )
-                widget_to_copy.get_object()[NameObject(Rect)] = ArrayObject(
-                    [
-                        FloatObject(widget.x),
-                        FloatObject(widget.y),
-                        FloatObject(widget.x + widget.optional_parameters.get("width")),
-                        FloatObject(
-                            widget.y + widget.optional_parameters.get("height")
-                        ),
-                    ]
-                )
 
-                widgets_to_copy.append(widget_to_copy)
-
-            out.pages[0][NameObject(Annots)] = ArrayObject(  # pylint: disable=E1137
-                widgets_to_copy
-            )
+def _draw_signature_widgets(
+    page_size: Tuple[float, float], widgets: List[SignatureWidget]
+) -> bytes:
+    """
+    Copies the bedrock annotations of a single page's signature widgets onto a
+    new watermark PDF.
 
-            with BytesIO() as f:
-                out.write(f)
-                f.seek(0)
-                result[page_num - 1] = f.read()
+    Args:
+        page_size (Tuple[float, float]): The width and height of the page.
+        widgets (List[SignatureWidget]): The signature widgets located on the page.
 
-        return result
+    Returns:
+        bytes: The single-page watermark PDF.
+    """
+    annot_type_to_annot = SignatureWidget.get_bedrock_annotations()
+
+    watermark = BytesIO()
+    canvas = Canvas(watermark, pagesize=page_size)
+    canvas.showPage()
+    canvas.save()
+    watermark.seek(0)
+
+    out = PdfWriter(watermark)
+
+    widgets_to_copy = []
+    for widget in widgets:
+        widget_to_copy = annot_type_to_annot[widget.BEDROCK_WIDGET_TO_COPY].clone(
+            out, force_duplicate=True
+        )
+
+        widget_to_copy[NameObject(T)] = TextStringObject(widget.name)
+        widget_to_copy[NameObject(Rect)] = ArrayObject(
+            [
+                FloatObject(widget.x),
+                FloatObject(widget.y),
+                FloatObject(widget.x + widget.optional_parameters.get("width")),
+                FloatObject(widget.y + widget.optional_parameters.get("height")),
+            ]
+        )
+        widgets_to_copy.append(widget_to_copy)
+
+    out.pages[0][NameObject(Annots)] = ArrayObject(  # pylint: disable=E1137
+        widgets_to_copy
+    )
+
+    with BytesIO() as f:
+        out.write(f)
+        f.seek(0)
+        return f.read()
 
 
 @dataclass
@@ -13,6 +13,64 @@ functionality for interacting with text form fields in PDFs.
 from dataclasses import dataclass
 from typing import Optional, Tuple, Type
 
+from pypdf import PageObject, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    FloatObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    StreamObject,
+    TextStringObject,
+)
+from reportlab.lib.colors import Color, opaqueColor
+from reportlab.pdfbase.pdfdoc import fp_str
+
+from ..constants import (
+    AP,
+    BC,
+    BG,
+    BS,
+    DA,
+    DEFAULT_FONT_SIZE,
+    DEFAULT_TEXT_FIELD_HEIGHT,
+    DEFAULT_TEXT_FIELD_WIDTH,
+    DEFAULT_WIDGET_BG_COLOR,
+    DEFAULT_WIDGET_BORDER_COLOR,
+    DEFAULT_WIDGET_BORDER_WIDTH,
+    DEFAULT_WIDGET_TEXT_COLOR,
+    DV,
+    FT,
+    MK,
+    PRINT,
+    REQUIRED,
+    TU,
+    Annot,
+    BBox,
+    F,
+    Ff,
+    Font,
+    Form,
+    Helv,
+    MaxLen,
+    N,
+    P,
+    ProcSet,
+    Rect,
+    Resources,
+    S,
+    Subtype,
+    T,
+    Tx,
+    V,
+    W,
+    XObject,
+    required,
+)
+from ..constants import Type as TypeKey
+from ..constants import Widget as WidgetSubtype
 from .base import Field, Widget
 
 
@@ -33,6 +91,7 @@ class TextWidget(Widget):
         NONE_DEFAULTS (list): A list of parameters that default to None.
         ACRO_FORM_FUNC (str): The name of the AcroForm function to use for
             creating the text field.
+        DIRECT_CREATION (bool): Text fields can be built directly into a document.
     """
 
     USER_PARAMS = [
@@ -51,6 +110,178 @@ class TextWidget(Widget):
     ALLOWED_HOOK_PARAMS = ["alignment", "multiline", "comb", "font"]
     NONE_DEFAULTS = ["max_length"]
     ACRO_FORM_FUNC = "textfield"
+    DIRECT_CREATION = True
+
+    def build_annotation(
+        self, writer: PdfWriter, page: PageObject, resources: dict
+    ) -> DictionaryObject:
+        """
+        Builds the text field's annotation dictionary directly into a document.
+
+        The dictionary mirrors the text field ReportLab creates, using the same
+        defaults for size, font size, and colors, the same default appearance
+        (DA) string, and an equivalent empty appearance stream with the
+        background and border drawn. The appearance stream only depends on the
+        field's size and colors, so fields that share them share one stream.
+
+        Args:
+            writer (PdfWriter): The writer of the document the field is created in.
+            page (PageObject): The page of `writer` the field is placed on.
+            resources (dict): A cache shared by all widgets created in the same
+                document, used to reuse fonts and appearance streams.
+
+        Returns:
+            DictionaryObject: The annotation dictionary of the text field.
+        """
+        params = self.acro_form_params
+        x = params["x"]
+        y = params["y"]
+        width = params.get("width", DEFAULT_TEXT_FIELD_WIDTH)
+        height = params.get("height", DEFAULT_TEXT_FIELD_HEIGHT)
+        font_size = params.get("fontSize", DEFAULT_FONT_SIZE)
+        border_width = params.get("borderWidth", DEFAULT_WIDGET_BORDER_WIDTH)
+        # transparent colors are not drawn, same as ReportLab
+        text_color, border_color, bg_color = (
+            color.rgb() if opaqueColor(color) else None
+            for color in (
+                params.get("textColor", Color(*DEFAULT_WIDGET_TEXT_COLOR)),
+                params.get("borderColor", Color(*DEFAULT_WIDGET_BORDER_COLOR)),
+                params.get("fillColor", Color(*DEFAULT_WIDGET_BG_COLOR)),
+            )
+        )
+
+        appearance_key = (Tx, width, height, bg_color, border_color, border_width)
+        if appearance_key not in resources:
+            resources[appearance_key] = writer._add_object(  # type: ignore # noqa: SLF001 # # pylint: disable=W0212
+                self._build_appearance_stream(
+                    *appearance_key[1:], self.get_form_font(writer, resources)
+                )
+            )
+
+        annotation = DictionaryObject(
+            {
+                NameObject(TypeKey): NameObject(Annot),
+                NameObject(Subtype): NameObject(WidgetSubtype),
+                NameObject(FT): NameObject(Tx),
+                NameObject(T): TextStringObject(self.name),
+                NameObject(Rect): ArrayObject(
+                    [
+                        FloatObject(x),
+                        FloatObject(y),
+                        FloatObject(x + width),
+                        FloatObject(y + height),
+                    ]
+                ),
+                NameObject(F): NumberObject(PRINT),
+                NameObject(Ff): NumberObject(REQUIRED if params.get(required) else 0),
+                NameObject(DA): TextStringObject(
+                    f"{Helv} {int(font_size)} Tf "
+                    + (f"{fp_str(*text_color)} rg" if text_color else "0 g")
+                ),
+                NameObject(V): TextStringObject(""),
+                NameObject(DV): TextStringObject(""),
+                NameObject(AP): DictionaryObject(
+                    {NameObject(N): resources[appearance_key]}
+                ),
+                NameObject(MK): DictionaryObject(
+                    {
+                        NameObject(BC): ArrayObject(
+                            FloatObject(each) for each in border_color or ()
+                        ),
+                        NameObject(BG): ArrayObject(
+                            FloatObject(each) for each in bg_color or ()
+                        ),
+                    }
+                ),
+            }
+        )
+        if page.indirect_reference is not None:
+            annotation[NameObject(P)] = page.indirect_reference
+        if border_width:
+            annotation[NameObject(BS)] = DictionaryObject(
+                {
+                    NameObject(W): FloatObject(border_width),
+                    NameObject(S): NameObject(S),
+                }
+            )
+        if params.get("maxlen"):
+            annotation[NameObject(MaxLen)] = NumberObject(params["maxlen"])
+        if params.get("tooltip"):
+            annotation[NameObject(TU)] = TextStringObject(params["tooltip"])
+
+        return annotation
+
+    @staticmethod
+    def _build_appearance_stream(
+        width: float,
+        height: float,
+        bg_color: Optional[Tuple[float, ...]],
+        border_color: Optional[Tuple[float, ...]],
+        border_width: float,
+        font: IndirectObject,
+    ) -> StreamObject:
+        """
+        Builds the normal appearance stream of an empty text field.
+
+        The stream draws the background and a solid border, then reserves the
+        clipped text area the same way ReportLab does.
+
+        Args:
+            width (float): The width of the field.
+            height (float): The height of the field.
+            bg_color (Optional[Tuple[float, ...]]): The RGB background color,
+                or None for no background.
+            border_color (Optional[Tuple[float, ...]]): The RGB border color,
+                or None for no border.
+            border_width (float): The width of the border.
+            font (IndirectObject): A reference to the form font.
+
+        Returns:
+            StreamObject: The compressed appearance stream.
+        """
+        content = []
+        if bg_color is not None:
+            content.append(f"{fp_str(*bg_color)} rg\n0 0 {fp_str(width, height)} re\nf")
+        if border_color is not None and border_width and border_width > 0:
+            content.append(
+                f"{fp_str(*border_color)} RG\n{fp_str(border_width)} w\n"
+                f"{fp_str(border_width * 0.5, border_width * 0.5)} "
+                f"{fp_str(width - border_width, height - border_width)} re\ns"
+            )
+        else:
+            border_width = 0
+        content.append(
+            f"/Tx BMC \nq\n{fp_str(2 * border_width, 2 * border_width)} "
+            f"{fp_str(width - 4 * border_width, height - 4 * border_width)} re\n"
+            "W\nn\n0 g\n0 G\nQ\nEMC"
+        )
+
+        stream = DecodedStreamObject()
+        stream.set_data(("\n".join(content) + "\n").encode("utf-8"))
+        stream.update(
+            {
+                NameObject(TypeKey): NameObject(XObject),
+                NameObject(Subtype): NameObject(Form),
+                NameObject(BBox): ArrayObject(
+                    [
+                        FloatObject(0),
+                        FloatObject(0),
+                        FloatObject(width),
+                        FloatObject(height),
+                    ]
+                ),
+                NameObject(Resources): DictionaryObject(
+                    {
+                        NameObject(Font): DictionaryObject({NameObject(Helv): font}),
+                        NameObject(ProcSet): ArrayObject(
+                            [NameObject("/PDF"), NameObject("/Text")]
+                        ),
+                    }
+                ),
+            }
+        )
+
+        return stream.flate_encode()
 
 
 @dataclass
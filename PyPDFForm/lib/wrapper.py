@@ -13,86 +13,52 @@ This module simplifies common tasks such as:
 The core class, `PdfWrapper`, encapsulates a PDF document and provides
 methods for interacting with its form fields and content. It leverages
 lower-level modules within the `PyPDFForm` library to handle the
-underlying PDF manipulation.
+underlying PDF manipulation, and gets its stream handling, batching, and
+forking from `base`, its field operations from `fields`, and splitting from
+`split`.
 """
 
 from __future__ import annotations
 
-from collections import defaultdict
-from dataclasses import asdict
-from functools import lru_cache
+from functools import partial
+from io import BytesIO
 from os import PathLike
-from typing import (
-    TYPE_CHECKING,
-    BinaryIO,
-    Dict,
-    List,
-    Sequence,
-    TextIO,
-    Tuple,
-)
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Sequence, TextIO, Tuple
 
 from .adapter import (
     fp_or_f_obj_or_f_content_to_content,
+    fp_or_f_obj_or_stream_to_buffer,
     fp_or_f_obj_or_stream_to_stream,
 )
 from .coordinate import generate_coordinate_grid
 from .deprecation import deprecation_notice
-from .egress import (
-    appearance_streams_handler,
-    rebuild_acroform_fields,
-)
+from .egress import appearance_streams_handler, get_acroform_fields_writer, write_pdf
+from .fields import FieldsMixin
 from .filler import fill
-from .font import (
-    get_all_available_fonts,
-    register_font_acroform,
-    temporary_font_registration,
-    validate_font,
-)
-from .hooks import trigger_widget_hooks
-from .middleware.dropdown import Dropdown
+from .font import add_font_acroform, temporary_font_registration, validate_font
 from .middleware.signature import Signature
-from .middleware.text import Text
+from .pages import extract_pages, get_page_count
+from .raw import RawOverlay
+from .split import SplitMixin
 from .template import (
-    build_widgets,
     create_annotations,
     get_on_open_javascript,
-    get_title,
-    remove_widgets_by_keys,
-    set_on_open_javascript,
-    set_title,
-    update_widget_keys,
-)
-from .types import PdfArray
-from .utils import (
-    generate_unique_suffix,
-    get_page_streams,
-    get_version,
-    merge_pdfs,
-    remove_all_widgets,
-    set_version,
-)
-from .watermark import (
-    copy_watermark_widgets,
-    create_watermarks_and_draw,
-    merge_watermarks_with_pdf,
-)
-from .widgets import (
-    CheckBoxField,
-    DropdownField,
-    ImageField,
-    RadioGroup,
-    SignatureField,
+    update_on_open_javascript,
 )
+from .types import PdfPages
+from .utils import generate_unique_suffix, get_version, merge_pdfs, set_version
+from .watermark import create_watermarks_and_draw, merge_watermarks_with_pdf
 
 if TYPE_CHECKING:
+    from pypdf import PdfWriter
+
     from .annotations import AnnotationTypes
     from .assets.blank import BlankPage
+    from .incremental import UpdateReader
     from .raw import RawTypes
-    from .widgets import FieldTypes
 
 
-class PdfWrapper:
+class PdfWrapper(FieldsMixin, SplitMixin):
     """
     A class to wrap PDF form operations, providing a simplified interface
     for common tasks such as filling, creating, and manipulating PDF forms.
@@ -114,6 +80,12 @@ class PdfWrapper:
                 - `title` (str | None): The title stored in the PDF's document
                   metadata. A non-None value replaces the existing title; None
                   preserves it.
+                - `spill_dir` (str | PathLike | None): A directory where PDF
+                  streams larger than `max_memory` are kept as temporary files
+                  instead of in memory. None keeps every stream in memory.
+                - `max_memory` (int | None): The size in bytes up to which a PDF
+                  stream stays in memory when `spill_dir` is set. None spills
+                  every stream.
 
     """
 
@@ -123,18 +95,22 @@ class PdfWrapper:
         ("generate_appearance_streams", False),
         ("preserve_metadata", False),
         ("title", None),
+        ("spill_dir", None),
+        ("max_memory", None),
     ]
 
     def __init__(
         self,
-        template: bytes | str | BinaryIO | BlankPage = b"",
+        template: bytes | memoryview | str | PathLike | BinaryIO | BlankPage = b"",
         **kwargs,
     ) -> None:
         """
         Constructor method for the `PdfWrapper` class.
 
         Initializes a new `PdfWrapper` object with the given template PDF and optional keyword arguments.
-        The template is normalized to bytes and existing widgets are loaded immediately.
+        The template is normalized to bytes, or spilled to `spill_dir` straight from
+        a path or buffer without being read into memory first, and existing widgets
+        are loaded immediately.
         The title and document-open JavaScript remain in the PDF stream and are read
         lazily when their properties are accessed. A non-None `title` keyword updates
         the title in the PDF stream; None leaves the template's title unchanged. The
@@ -143,9 +119,11 @@ class PdfWrapper:
         `generate_appearance_streams` also enables `need_appearances`.
 
         Args:
-            template (bytes | str | BinaryIO | BlankPage): The template PDF, provided as either:
+            template (bytes | memoryview | str | PathLike | BinaryIO | BlankPage): The template PDF, provided as either:
                 - bytes: The raw PDF data as a byte string.
-                - str: The file path to the PDF.
+                - memoryview: A bytes-like buffer of the PDF data, such as a
+                  `bytearray`, a `memoryview`, or an `mmap` of the file.
+                - str | PathLike: The file path to the PDF.
                 - BinaryIO: An open file-like object containing the PDF data.
                 - BlankPage: A blank page object.
                 Defaults to an empty byte string (b"").
@@ -155,15 +133,11 @@ class PdfWrapper:
         """
 
         super().__init__()
-        self._stream = fp_or_f_obj_or_stream_to_stream(template)
-        self.widgets = {}
-
-        self._version = None
-        self._available_fonts = {}  # for setting /F1
-        self._available_fonts_loaded = None  # for lazy loading fonts
-        self._font_register_events = []  # for reregister
-        self._key_update_tracker = {}  # for update key preserve old key attrs
-        self._keys_to_update = []  # for bulk update keys
+        # decide how the template is stored before it is read
+        for attr, default in self.USER_PARAMS:
+            if attr in ("spill_dir", "max_memory"):
+                setattr(self, attr, kwargs.get(attr, default))
+        self._stream = fp_or_f_obj_or_stream_to_buffer(template)
 
         # sets attrs from kwargs
         for attr, default in self.USER_PARAMS:
@@ -227,134 +201,31 @@ class PdfWrapper:
 
         return result
 
-    def _init_helper(self) -> None:
-        """
-        Helper method to initialize widgets.
-
-        This method is called during initialization and after certain operations
-        that modify the PDF content (e.g., filling, creating widgets, updating keys).
-        It rebuilds the widget dictionary and invalidates the lazily loaded font cache.
-        """
-
-        self._available_fonts_loaded = False
-        stream = self._read()
-        new_widgets = (
-            build_widgets(
-                stream,
-                getattr(self, "use_full_widget_name"),
-            )
-            if stream
-            else {}
-        )
-        # ensure old widgets don't get overwritten
-        for k, v in self.widgets.items():
-            if k in new_widgets:
-                new_widgets[k] = v
-
-        # update key preserve old key attrs
-        for k, v in new_widgets.items():
-            if k in self._key_update_tracker:
-                old_widget = self.widgets[self._key_update_tracker[k]]
-                for name in old_widget.attr_set_tracker:
-                    setattr(v, name, getattr(old_widget, name, None))
-        self._key_update_tracker = {}
-
-        self.widgets = new_widgets
-
-    def _ensure_available_fonts_loaded(self) -> dict:
-        """
-        Loads AcroForm fonts from the PDF stream the first time they are needed.
-
-        Custom fonts registered through `register_font` are stored in the same
-        mapping, so loading updates the existing dictionary instead of replacing it.
-
-        Returns:
-            dict: A mapping from font names to internal PDF font identifiers.
-        """
-
-        if not self._available_fonts_loaded:
-            if self._stream:
-                self._available_fonts.update(**get_all_available_fonts(self._stream))
-            self._available_fonts_loaded = True
-
-        return self._available_fonts
-
-    @staticmethod
-    @lru_cache(maxsize=128)
-    def _get_page_streams_with_widgets(stream: bytes) -> tuple[bytes, ...]:
+    def _extract_pages(self, stream: bytes, page_nums: List[int]) -> PdfWrapper:
         """
-        Extracts page streams while preserving the original page widgets.
+        Extracts pages of a PDF stream into a new `PdfWrapper`.
 
-        Widgets are removed before splitting the PDF into pages, then cloned back
-        from the original stream onto the matching single-page PDF. This avoids
-        page extraction losing form field annotations.
+        The new wrapper inherits the current wrapper's user parameters, and the
+        custom font registration events are replayed onto it.
 
         Args:
-            stream (bytes): The PDF stream to split into pages.
+            stream (bytes): The PDF stream to extract pages from.
+            page_nums (List[int]): The zero-based indices of the pages.
 
         Returns:
-            tuple[bytes, ...]: Single-page PDF streams with widgets preserved.
+            PdfWrapper: A new `PdfWrapper` containing only the selected pages.
         """
 
-        return tuple(
-            # Case: Single watermark PDF, extracting a specific page to the first output page.
-            copy_watermark_widgets(page_stream, stream, None, i)
-            for i, page_stream in enumerate(
-                get_page_streams(remove_all_widgets(stream))
-            )
+        result = self.__class__(
+            extract_pages(stream, tuple(page_nums)),
+            **{param: getattr(self, param) for param, _ in self.USER_PARAMS},
         )
 
-    def _reregister_font(self) -> PdfWrapper:
-        """
-        Reregisters fonts after PDF content modifications.
-
-        This method is called after operations that modify the PDF content
-        (e.g., drawing text, drawing images) to ensure that custom fonts
-        are correctly registered and available for use. It replays the font
-        registration events that existed at method entry, then trims those
-        replayed events so only newly added events remain queued.
-        """
-
-        font_register_events_len = len(self._font_register_events)
-        for i in range(font_register_events_len):
-            event = self._font_register_events[i]
-            self.register_font(event[0], event[1])
-        self._font_register_events = self._font_register_events[
-            font_register_events_len:
-        ]
-
-        return self
-
-    @property
-    def title(self) -> str | None:
-        """
-        Gets the title stored in the PDF's document metadata.
-
-        The title is read lazily from the current PDF stream. Metadata extraction
-        is cached for each distinct stream.
-
-        Returns:
-            str | None: The current document title, or None when no title exists.
-        """
-
-        result = get_title(self._read())
-        return str(result) if result is not None else None
-
-    @title.setter
-    def title(self, value: str | None) -> None:
-        """
-        Updates the title stored in the PDF's document metadata.
-
-        A non-None value is written to the underlying PDF stream immediately.
-        None is ignored so the current title is preserved.
-
-        Args:
-            value (str | None): The new document title, or None to preserve the
-                current title.
-        """
+        # maps the registered font names of the new wrapper
+        for event in self._font_register_events:
+            result.register_font(event[0], event[1])
 
-        if value is not None:
-            self._stream = set_title(self._read(), value)
+        return result
 
     @property
     def schema(self) -> dict:
@@ -370,7 +241,8 @@ class PdfWrapper:
         return {
             "type": "object",
             "properties": {
-                key: value.schema_definition for key, value in self.widgets.items()
+                key: value.schema_definition
+                for key, value in self._widget_view().items()
             },
             "additionalProperties": False,
         }
@@ -389,7 +261,7 @@ class PdfWrapper:
                   their corresponding data (str | bool | int | None).
         """
 
-        return {key: value.value for key, value in self.widgets.items()}
+        return {key: value.value for key, value in self._widget_view().items()}
 
     @property
     def sample_data(self) -> dict:
@@ -402,7 +274,7 @@ class PdfWrapper:
             dict: A dictionary containing sample data for the PDF form.
         """
 
-        return {key: value.sample_value for key, value in self.widgets.items()}
+        return {key: value.sample_value for key, value in self._widget_view().items()}
 
     @property
     def version(self) -> str | None:
@@ -439,32 +311,20 @@ class PdfWrapper:
     @property
     def pages(self) -> Sequence[PdfWrapper]:
         """
-        Returns a list of `PdfWrapper` objects, each representing a single page in the PDF document.
+        Returns a lazy list of `PdfWrapper` objects, each representing a single page in the PDF document.
 
-        This allows you to work with individual pages of the PDF. Each page wrapper
-        preserves the page's original widgets and inherits the current wrapper's user
-        parameters. Custom font registration events are replayed onto the page wrappers
-        when needed.
+        This allows you to work with individual pages of the PDF. A page wrapper is
+        only created when its page is indexed, and slicing extracts the selected pages
+        directly into a single `PdfWrapper`. Each extracted wrapper preserves the pages'
+        original widgets and inherits the current wrapper's user parameters. Custom font
+        registration events are replayed onto the extracted wrappers when needed.
 
         Returns:
-            Sequence[PdfWrapper]: A list of `PdfWrapper` objects, one for each page in the PDF.
+            Sequence[PdfWrapper]: A `PdfPages` array, a lazy `PdfArray` with one entry for each page in the PDF.
         """
 
-        result = [
-            self.__class__(
-                each,
-                **{param: getattr(self, param) for param, _ in self.USER_PARAMS},
-            )
-            for each in self._get_page_streams_with_widgets(self._read())
-        ]
-
-        # because copy_watermark_widgets and remove_all_widgets
-        if self._font_register_events:
-            for event in self._font_register_events:
-                for page in result:
-                    page.register_font(event[0], event[1])
-
-        return PdfArray(result)
+        stream = self._read()
+        return PdfPages(get_page_count(stream), partial(self._extract_pages, stream))
 
     @property
     def on_open_javascript(self) -> str | None:
@@ -488,7 +348,8 @@ class PdfWrapper:
         Sets the JavaScript script that executes when the PDF is opened.
 
         Assignment immediately writes a JavaScript `/OpenAction` to the stored
-        PDF stream, replacing any existing document-open action.
+        PDF stream, replacing any existing document-open action. Within `batch`,
+        the write is queued until the edits are applied.
 
         Args:
             value (str | TextIO): The JavaScript script, provided as either:
@@ -497,7 +358,7 @@ class PdfWrapper:
         """
 
         script = fp_or_f_obj_or_f_content_to_content(value)
-        self._stream = set_on_open_javascript(self._read(), script)
+        self._queue_document_edit(partial(update_on_open_javascript, script=script))
 
     def read(self) -> bytes:
         """
@@ -509,8 +370,9 @@ class PdfWrapper:
            `/NeedAppearances` flag, which may include removing XFA and explicitly
            generating appearance streams.
         3. Rebuilds the AcroForm `/Fields` array from page annotations for
-           widgets known to this wrapper, leaving the stream unchanged when no
-           matching widget annotations are found.
+           widgets known to this wrapper. When there are no such widgets, the
+           stream is returned unchanged, including any incremental updates
+           appended to it by fills, hooks, or setters such as `title`.
         4. Restores the wrapper's cached PDF header version after egress
            processing, since PDF writers may emit their own default version.
         The wrapper's stored stream is not replaced by these final egress-only changes.
@@ -519,75 +381,69 @@ class PdfWrapper:
             bytes: The processed PDF document content as a byte string.
         """
 
+        result, writer = self._egress()
+        if writer is not None:
+            with BytesIO() as f:
+                writer.write(f)
+                f.seek(0)
+                result = f.read()
+
+        return bytes(result)
+
+    def _egress(self) -> Tuple[bytes | memoryview, PdfWriter | None]:
+        """
+        Prepares the final output of the PDF document without serializing it.
+
+        This performs the processing steps described in `read`. The final
+        AcroForm rebuild is returned as an unserialized writer, with the
+        wrapper's cached version already set as its header, so `write` can
+        stream it into its destination.
+
+        Returns:
+            Tuple[bytes | memoryview, PdfWriter | None]: The processed PDF
+                stream, which is a view of the file of a spilled stream, and the
+                writer of the final output, or None when the stream itself is
+                the final output.
+        """
+
         result = self._read()
         if getattr(self, "need_appearances") and result:
             result = appearance_streams_handler(
                 result, getattr(self, "generate_appearance_streams")
             )  # cached
 
+        writer = None
         if result:
-            result = rebuild_acroform_fields(
+            writer = get_acroform_fields_writer(
                 result,
                 {
                     key
-                    for key, widget in self.widgets.items()
+                    for key, widget in self._widget_view().items()
                     if not isinstance(widget, Signature)
                 },  # TODO: figure out why can't image/sig be rendered by Acrobat
                 getattr(self, "use_full_widget_name"),
             )
-            if self.version:
+            if writer is not None and self.version:
+                header = writer.pdf_header.encode()
+                writer.pdf_header = set_version(
+                    header, get_version(header), self.version
+                )
+            elif self.version:
                 result = set_version(result, get_version(result), self.version)
-        return result
-
-    def _read(self) -> bytes:
-        """
-        Reads the PDF stream, triggering widget hooks and updating fonts if necessary.
-
-        This internal method executes queued widget hooks. When a pending font hook
-        exists, user-facing registered font names are mapped to their internal PDF
-        resource names before hooks are applied. Applying hooks updates the wrapper's
-        stored stream and clears each widget's hook queue.
-
-        Returns:
-            bytes: The raw PDF stream.
-        """
-
-        widgets_with_hooks = [
-            widget for widget in self.widgets.values() if widget.hooks_to_trigger
-        ]
-
-        if widgets_with_hooks:
-            has_font_hook = any(
-                hook[0] == "update_text_field_font"
-                for widget in widgets_with_hooks
-                for hook in widget.hooks_to_trigger
-            )
-
-            if has_font_hook:
-                available_fonts = self._ensure_available_fonts_loaded()
-                for widget in self.widgets.values():
-                    if (
-                        isinstance(widget, (Text, Dropdown))
-                        and widget.font not in available_fonts.values()
-                        and widget.font in available_fonts
-                    ):
-                        # from `new_font` to `/F1`
-                        widget.font = available_fonts.get(widget.font)
-
-            self._stream = trigger_widget_hooks(
-                self._stream,
-                self.widgets,
-                getattr(self, "use_full_widget_name"),
-            )
 
-        return self._stream
+        return result, writer
 
     def write(self, dest: str | BinaryIO) -> PdfWrapper:
         """
         Writes the PDF to a file.
 
         String, bytes, and PathLike destinations are opened in binary write mode.
-        Other objects are treated as already-open writable binary streams.
+        Other objects are treated as already-open writable binary streams, which
+        only need a `write` method, so socket files work as well.
+
+        The output is the same as `read` returns, but the final serialization is
+        streamed straight into the destination instead of being collected into
+        a bytes object first, which keeps peak memory low for large documents.
 
         Args:
             dest (str | BinaryIO): The destination to write the PDF to.
@@ -597,36 +453,48 @@ class PdfWrapper:
             PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
         """
 
+        result, writer = self._egress()
         if isinstance(dest, (str, bytes, PathLike)):
             with open(dest, "wb+") as f:
-                f.write(self.read())
+                if writer is not None:
+                    write_pdf(writer, f)
+                else:
+                    f.write(result)
+        elif writer is not None:
+            write_pdf(writer, dest)
         else:
-            dest.write(self.read())
+            dest.write(result)
 
         return self
 
-    def change_version(self, version: str) -> PdfWrapper:
+    def extract(self, pages: Sequence[int]) -> PdfWrapper:
         """
-        Changes the PDF version of the underlying document.
+        Extracts pages of the PDF into a new `PdfWrapper`.
 
-        The method replaces the first PDF header version marker in the current stream
-        and updates the cached version used by later egress processing. It does not
-        otherwise validate or rewrite the document for version-specific compatibility.
+        Only the requested pages are copied, together with their widgets and the
+        form's default appearance and resources, into one new document in a single
+        pass, so the cost does not depend on the total number of pages. The new
+        wrapper inherits the current wrapper's user parameters and registered fonts.
 
         Args:
-            version (str): The new PDF version string (e.g., "1.7").
+            pages (Sequence[int]): The 1-based page numbers to extract, in the order
+                they appear in the new document, e.g. `range(10, 21)` for pages 10
+                through 20.
 
         Returns:
-            PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
+            PdfWrapper: A new `PdfWrapper` containing only the extracted pages.
+
+        Raises:
+            IndexError: If a page number is out of range.
         """
 
-        current_stream = self._read()
-        updated_stream = set_version(current_stream, self.version, version)
-        if updated_stream != current_stream:
-            self._stream = updated_stream
-            self._version = version
+        stream = self._read()
+        page_count = get_page_count(stream)
+        if not all(1 <= each <= page_count for each in pages):
+            msg = "page number out of range"
+            raise IndexError(msg)
 
-        return self
+        return self._extract_pages(stream, [each - 1 for each in pages])
 
     def generate_coordinate_grid(
         self, color: Tuple[float, float, float] = (1, 0, 0), margin: float = 100
@@ -634,9 +502,9 @@ class PdfWrapper:
         """
         Generates a coordinate grid on the PDF, useful for debugging layout issues.
 
-        Existing widgets are temporarily removed while the grid is drawn as page
-        watermarks, then copied back onto the resulting stream. Registered fonts are
-        restored afterward because the remove/copy cycle rewrites the PDF.
+        The grid of each page size is rendered once and added as a Form XObject
+        overlay shared by all pages of that size, leaving the existing page
+        content and widgets in place.
 
         Args:
             color (Tuple[float, float, float]): The color of the grid lines, specified as an RGB tuple (default: red).
@@ -646,20 +514,7 @@ class PdfWrapper:
             PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
         """
 
-        stream_with_widgets = self._read()
-        # Case: Single watermark PDF, mapping pages 1:1 to output pages.
-        self._stream = copy_watermark_widgets(
-            generate_coordinate_grid(
-                remove_all_widgets(self._read()),
-                color,
-                margin,
-            ),
-            stream_with_widgets,
-            None,
-            None,
-        )
-        # because copy_watermark_widgets and remove_all_widgets
-        self._reregister_font()
+        self._stream = generate_coordinate_grid(self._read(), color, margin)
 
         return self
 
@@ -672,9 +527,9 @@ class PdfWrapper:
         Fills the PDF form with data from a dictionary.
 
         Only keys that already exist in `self.widgets` are applied. Filling delegates
-        to the lower-level filler, then handles the special image/signature path by
-        drawing those values as watermarks and copying the remaining widgets back onto
-        the output. The wrapper's widget cache is intentionally left in place so
+        to the lower-level filler, which also handles the special image/signature path
+        by drawing those values onto the pages and removing the image and signature
+        widgets in the same pass. The wrapper's widget cache is intentionally left in place so
         subsequent style updates can still refer to the same middleware objects.
 
         Args:
@@ -692,31 +547,15 @@ class PdfWrapper:
             if key in self.widgets:
                 self.widgets[key].value = value
 
-        filled_stream, image_drawn_stream = fill(
-            self._read(),
-            self.widgets,
+        stream = self._read()
+        self._stream = fill(
+            stream,
+            self._widget_view(),
             need_appearances=getattr(self, "need_appearances"),
             use_full_widget_name=getattr(self, "use_full_widget_name"),
             flatten=kwargs.get("flatten", False),
         )
 
-        if image_drawn_stream is not None:
-            keys_to_copy = [
-                k for k, v in self.widgets.items() if not isinstance(v, Signature)
-            ]  # only copy non-image fields
-            # Case: Single watermark PDF, mapping pages 1:1 to output pages.
-            filled_stream = copy_watermark_widgets(
-                remove_all_widgets(image_drawn_stream),
-                filled_stream,
-                keys_to_copy,
-                None,
-            )
-
-        self._stream = filled_stream
-        if image_drawn_stream is not None:
-            # because copy_watermark_widgets and remove_all_widgets
-            self._reregister_font()
-
         return self
 
     def annotate(self, annotations: Sequence[AnnotationTypes]) -> PdfWrapper:
@@ -739,220 +578,62 @@ class PdfWrapper:
 
         return self
 
-    def bulk_create_fields(self, fields: Sequence[FieldTypes]) -> PdfWrapper:
-        """
-        Creates multiple new form fields (widgets) on the PDF in a single operation.
-
-        This method takes a list of field definition objects (`FieldTypes`),
-        groups them by creation strategy, and then delegates each group to the
-        internal `_bulk_create_fields` method. Signatures and images are grouped
-        together because both copy bedrock annotations; checkboxes and radio groups
-        are grouped together because they share ReportLab button handling; multiple
-        dropdown fields are routed through the general creation path.
-
-        Args:
-            fields (Sequence[FieldTypes]): A list of field definition objects
-                (e.g., `TextField`, `CheckBoxField`, etc.) to be created.
-
-        Returns:
-            PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
-        """
-
-        needs_separate_creation = [
-            CheckBoxField,
-            RadioGroup,
-            DropdownField,
-            SignatureField,
-            ImageField,
-        ]
-        needs_separate_creation_dict = defaultdict(list)
-        general_creation = []
-
-        for each in fields:
-            if type(each) in needs_separate_creation:
-                needs_separate_creation_dict[type(each)].append(each)
-            else:
-                general_creation.append(each)
-
-        needs_separate_creation_dict[SignatureField] = needs_separate_creation_dict.pop(
-            SignatureField, []
-        ) + needs_separate_creation_dict.pop(ImageField, [])
-        needs_separate_creation_dict[CheckBoxField] = needs_separate_creation_dict.pop(
-            CheckBoxField, []
-        ) + needs_separate_creation_dict.pop(RadioGroup, [])
-
-        if (
-            DropdownField in needs_separate_creation_dict
-            and len(needs_separate_creation_dict[DropdownField]) > 1
-        ):
-            general_creation += needs_separate_creation_dict.pop(DropdownField, [])
-
-        for each in list(needs_separate_creation_dict.values()) + [general_creation]:
-            if each:
-                self._bulk_create_fields(each)
-
-        return self
-
-    def _bulk_create_fields(self, fields: Sequence[FieldTypes]) -> PdfWrapper:
-        """
-        Internal method to create multiple new form fields (widgets) on the PDF in a single operation.
-
-        This method takes a list of field definition objects (`FieldTypes`),
-        converts them into widget objects, creates page-aligned watermark PDFs for
-        those widgets, copies the generated widget annotations into the current PDF,
-        refreshes the widget cache, and applies any hook parameters captured during
-        field construction.
-
-        Args:
-            fields (Sequence[FieldTypes]): A list of field definition objects
-                (e.g., `TextField`, `CheckBoxField`, etc.) to be created.
-
-        Returns:
-            PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
-        """
-
-        widgets = []
-        widget_class = None
-        for field in fields:
-            field_dict = asdict(field)
-            widget_class = getattr(field, "_widget_class")
-            name = field_dict.pop("name")
-            page_number = field_dict.pop("page_number")
-            x = field_dict.pop("x")
-            y = field_dict.pop("y")
-            widgets.append(
-                widget_class(
-                    name=name,
-                    page_number=page_number,
-                    x=x,
-                    y=y,
-                    **{k: v for k, v in field_dict.items() if v is not None},
-                )
-            )
-
-        watermarks = getattr(widget_class, "bulk_watermarks")(widgets, self._read())
-        # Case: List of watermark PDFs, each corresponding to an output page.
-        self._stream = copy_watermark_widgets(
-            self._read(),
-            watermarks,
-            [widget.name for widget in widgets],
-            None,
-        )
-
-        self._init_helper()
-
-        for widget in widgets:
-            for k, v in widget.hook_params:
-                self.widgets[widget.name].__setattr__(k, v)
-
-        return self
-
-    def remove_fields(self, keys: List[str]) -> PdfWrapper:
-        """
-        Removes form fields from the PDF by their keys.
-
-        This method removes any fields whose keys are included in `keys` and
-        refreshes the wrapper's widget metadata after the PDF stream is updated.
-
-        Args:
-            keys (List[str]): A list of form field keys to remove.
-
-        Returns:
-            PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
-        """
-
-        self._stream = remove_widgets_by_keys(
-            self._read(), keys, getattr(self, "use_full_widget_name")
-        )
-        self._init_helper()
-
-        return self
-
-    def update_widget_key(
-        self, old_key: str, new_key: str, index: int = 0
+    def draw(
+        self,
+        elements: Sequence[RawTypes] | RawOverlay,
+        as_xobject: bool = False,
+        workers: int | None = None,
     ) -> PdfWrapper:
-        """
-        Updates the key (name) of a widget, allowing you to rename form fields.
-
-        This method queues a change to the name of a form field in the PDF. This can be useful for
-        standardizing field names or resolving naming conflicts. The queued update is applied when
-        `commit_widget_key_updates` is called. Renaming is not supported while full widget names are
-        being used for lookup.
-
-        Args:
-            old_key (str): The old key of the widget that you want to rename.
-            new_key (str): The new key to assign to the widget.
-            index (int): The index of the widget if there are multiple widgets with the same name (default: 0).
-
-        Returns:
-            PdfWrapper: The PdfWrapper object.
-        """
-
-        if getattr(self, "use_full_widget_name"):
-            raise NotImplementedError
-
-        self._keys_to_update.append((old_key, new_key, index))
-        return self
-
-    def commit_widget_key_updates(self) -> PdfWrapper:
-        """
-        Commits deferred widget key updates, applying all queued key renames to the PDF.
-
-        This method applies all widget key updates queued by the `update_widget_key` method. It updates
-        the underlying PDF stream with the new key names, rebuilds the widget cache, preserves attributes
-        that were set on the old widget objects, and clears the queue.
-
-        Returns:
-            PdfWrapper: The PdfWrapper object.
-        """
-
-        if getattr(self, "use_full_widget_name"):
-            raise NotImplementedError
-
-        old_keys = [each[0] for each in self._keys_to_update]
-        new_keys = [each[1] for each in self._keys_to_update]
-        indices = [each[2] for each in self._keys_to_update]
-
-        self._stream = update_widget_keys(
-            self._read(), self.widgets, old_keys, new_keys, indices
-        )
-
-        for each in self._keys_to_update:
-            self._key_update_tracker[each[1]] = each[0]
-        self._init_helper()
-        self._keys_to_update = []
-
-        return self
-
-    def draw(self, elements: Sequence[RawTypes]) -> PdfWrapper:
         """
         Draws raw elements (text, images, etc.) directly onto the PDF pages.
 
         This method is the primary mechanism for drawing non-form field content.
         It takes a list of raw element objects, temporarily registers custom fonts
-        for ReportLab drawing, renders the elements onto page watermarks, merges those
-        watermarks into the PDF, and copies the original widgets back onto the output.
+        for ReportLab drawing, renders the elements onto page watermarks, and merges those
+        watermarks into the page content, leaving existing widgets in place.
+
+        With `as_xobject` enabled, each page's drawing is added as a Form XObject
+        overlay instead of being merged into the page's content stream, which
+        avoids rewriting existing page content and resources.
+
+        A `RawOverlay` can be passed instead of a list of elements to draw the same
+        static content onto many PDFs; it only renders pages whose size it has
+        not rendered before.
+
+        With `workers` greater than one, pages are rendered in a pool of up to
+        that many processes and merged in page order, which speeds up drawing
+        onto many pages. On platforms that spawn worker processes, call it from
+        under an `if __name__ == "__main__":` guard.
 
         Args:
-            elements (Sequence[RawTypes]): A list of raw elements to draw (e.g., [RawText(...), RawImage(...)]).
+            elements (Sequence[RawTypes] | RawOverlay): A list of raw elements to draw
+                (e.g., [RawText(...), RawImage(...)]) or a reusable overlay of them.
+            as_xobject (bool): Whether to add the drawings as Form XObject
+                overlays instead of merging them into page content. Defaults to False.
+            workers (int | None): The maximum number of worker processes used
+                to render pages. Defaults to None, rendering in the current process.
 
         Returns:
             PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
         """
 
-        with temporary_font_registration(self._font_register_events) as font_mapping:
-            watermarks = create_watermarks_and_draw(
-                self._read(), [each.to_draw for each in elements], font_mapping
+        if isinstance(elements, RawOverlay):
+            watermarks = elements.watermarks(
+                self._read(), self._font_register_events, workers
             )
+        else:
+            with temporary_font_registration(
+                self._font_register_events
+            ) as font_mapping:
+                watermarks = create_watermarks_and_draw(
+                    self._read(),
+                    [each.to_draw for each in elements],
+                    font_mapping,
+                    workers,
+                    self._font_register_events,
+                )
 
-        stream_with_widgets = self._read()
-        self._stream = merge_watermarks_with_pdf(self._read(), watermarks)
-        # Case: Single watermark PDF, mapping pages 1:1 to output pages.
-        self._stream = copy_watermark_widgets(
-            remove_all_widgets(self._read()), stream_with_widgets, None, None
-        )
-        # because copy_watermark_widgets and remove_all_widgets
-        self._reregister_font()
+        self._stream = merge_watermarks_with_pdf(self._read(), watermarks, as_xobject)
 
         return self
 
@@ -967,7 +648,8 @@ class PdfWrapper:
         Valid TrueType font data is embedded into the PDF's AcroForm resources and
         recorded under the user-provided `font_name`. The original registration input
         is kept so font resources can be replayed after operations that rewrite the
-        PDF stream. Invalid font streams are ignored.
+        PDF stream. Invalid font streams are ignored. Within `batch`, the font is
+        embedded when the edits are applied.
 
         Args:
             font_name (str): The name of the font. This name will be used to reference the font when drawing text.
@@ -984,10 +666,23 @@ class PdfWrapper:
 
         if validate_font(font_name, ttf_file) if ttf_file is not None else False:
             self._ensure_available_fonts_loaded()
-            self._stream, new_font_name = register_font_acroform(
-                self._read(), ttf_file, getattr(self, "need_appearances")
-            )
-            self._available_fonts[font_name] = new_font_name
             self._font_register_events.append((font_name, ttf_file))
+            self._queue_document_edit(partial(self._add_font, font_name, ttf_file))
 
         return self
+
+    def _add_font(
+        self, font_name: str, ttf_file: bytes, out: UpdateReader | PdfWriter
+    ) -> None:
+        """
+        Embeds a registered font into the PDF's AcroForm resources.
+
+        Args:
+            font_name (str): The user-provided name of the font.
+            ttf_file (bytes): The TTF file data.
+            out (UpdateReader | PdfWriter): The PDF opened by `open_for_update`.
+        """
+
+        self._available_fonts[font_name] = add_font_acroform(
+            out, ttf_file, getattr(self, "need_appearances")
+        )
@@ -155,6 +155,65 @@ def test_create_extract_start_after_end(pdf_samples, tmp_path):
     )
 
 
+@pytest.mark.cli_test
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        ([], "Supply exactly one of --pages or --range."),
+        (
+            ["-n", "1", "-r", "1"],
+            "Supply exactly one of --pages or --range.",
+        ),
+        (["-r", "a-b"], "Invalid page range: a-b."),
+        (["-r", "3-1"], "End page must be greater than or equal to start"),
+        (["-r", "4"], "Page range out of bounds."),
+    ],
+)
+def test_create_split_invalid_options(pdf_samples, tmp_path, options, message):
+    output_path = os.path.join(tmp_path, "output_{index}.pdf")
+
+    result = runner.invoke(
+        cli_app,
+        [
+            "create",
+            "split",
+            os.path.join(pdf_samples, "sample_template.pdf"),
+            "-o",
+            output_path,
+            *options,
+        ],
+    )
+
+    assert_cli_error(result, message)
+    assert not os.listdir(tmp_path)
+
+
+@pytest.mark.cli_test
+def test_create_split_shared_output_path(pdf_samples, tmp_path):
+    output_path = os.path.join(tmp_path, "output.pdf")
+
+    result = runner.invoke(
+        cli_app,
+        [
+            "create",
+            "split",
+            os.path.join(pdf_samples, "sample_template.pdf"),
+            "-o",
+            output_path,
+            "-n",
+            "1",
+        ],
+    )
+
+    assert_cli_error(
+        result,
+        "Output path pattern must give each part its own",
+        "path.",
+        output_path=output_path,
+    )
+    assert not os.listdir(tmp_path)
+
+
 @pytest.mark.cli_test
 def test_create_field_malformed_json(pdf_samples, tmp_path):
     data_path = write_invalid_json(tmp_path, '{"text": [')
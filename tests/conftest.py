@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
 import os
+from io import BytesIO
 
 import pytest
+from pypdf import PdfReader
 
 
 def pytest_configure(config):
@@ -26,6 +28,24 @@ def _generate_new_pdf_samples(request):
             f.write(request.config.results["stream"])
 
 
+@pytest.fixture
+def page_annotations():
+    def _page_annotations(stream, keys=None, exclude=()):
+        return [
+            [
+                {
+                    k: v
+                    for k, v in annot.get_object().items()
+                    if (keys is None or k in keys) and k not in exclude
+                }
+                for annot in page.get("/Annots", [])
+            ]
+            for page in PdfReader(BytesIO(stream)).pages
+        ]
+
+    return _page_annotations
+
+
 @pytest.fixture
 def pdf_samples():
     return os.path.join(os.path.dirname(__file__), "..", "pdf_samples")
@@ -126,6 +126,30 @@ def test_extract_pages(static_pdfs, pdf_samples, yaml_samples, tmp_path):
         assert expected == actual
 
 
+@pytest.mark.cli_test
+def test_split_pages(static_pdfs, tmp_path):
+    pdf_path = os.path.join(static_pdfs, "sample_template.pdf")
+    output_path = os.path.join(tmp_path, "part_{index}.pdf")
+
+    result = runner.invoke(
+        cli_app,
+        ["create", "split", pdf_path, "--pages", "2", "-o", output_path],
+    )
+    assert result.exit_code == 0
+
+    result = runner.invoke(
+        cli_app,
+        ["create", "split", pdf_path, "-r", "3", "-r", "1-2", "-o", output_path],
+    )
+    assert result.exit_code == 0
+
+    obj = PdfWrapper(pdf_path)
+    for i, pages in enumerate([[3], [1, 2]]):
+        part = PdfWrapper(output_path.format(index=i + 1))
+        assert len(part.pages) == len(pages)
+        assert part.schema == obj.extract(pages).schema
+
+
 @pytest.mark.cli_test
 def test_merge(static_pdfs, pdf_samples, tmp_path):
     expected_path = os.path.join(pdf_samples, "docs", "test_merge.pdf")
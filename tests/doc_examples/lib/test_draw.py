@@ -5,7 +5,7 @@ import os
 
 import pytest
 
-from PyPDFForm import PdfWrapper, RawElements
+from PyPDFForm import BlankPage, PdfWrapper, RawElements
 
 
 @pytest.mark.requires_zlib_over_zlib_ng
@@ -274,3 +274,104 @@ def test_draw_ellipse(static_pdfs, pdf_samples, request):
 
         assert len(pdf.read()) == len(expected)
         assert pdf.read() == expected
+
+
+@pytest.mark.requires_zlib_over_zlib_ng
+def test_draw_table(pdf_samples, sample_font_stream, request):
+    expected_path = os.path.join(pdf_samples, "docs", "test_draw_table.pdf")
+
+    columns = [
+        RawElements.RawTableColumn(width=300, header="Item"),
+        RawElements.RawTableColumn(width=80, header="Quantity", alignment=2),
+        RawElements.RawTableColumn(width=100, header="Price", alignment=2),
+    ]
+    rows = ((f"Item {i}", i, f"{i * 1.5:.2f}") for i in range(1, 61))
+
+    tables = [
+        RawElements.RawTable(
+            columns=columns,
+            rows=rows,
+            page_number=1,
+            x=50,
+            y=750,
+            row_height=20,  # optional
+            bottom=36,  # optional
+            top=None,  # optional, defaults to y
+            font="your_registered_font",  # optional
+            font_size=12,  # optional
+            font_color=(0, 0, 0),  # optional
+            line_color=(0, 0, 0),  # optional, None for no grid lines
+            padding=2,  # optional
+        ),
+    ]
+
+    pdf = (
+        PdfWrapper(BlankPage() * 2)
+        .register_font("your_registered_font", sample_font_stream)
+        .draw(tables)
+    )
+
+    request.config.results["expected_path"] = expected_path
+    request.config.results["stream"] = pdf.read()
+
+    with open(expected_path, "rb+") as f:
+        expected = f.read()
+
+        assert len(pdf.read()) == len(expected)
+        assert pdf.read() == expected
+
+
+@pytest.mark.requires_zlib_over_zlib_ng
+def test_draw_as_xobject(static_pdfs, pdf_samples, request):
+    expected_path = os.path.join(pdf_samples, "docs", "test_draw_as_xobject.pdf")
+
+    texts = [
+        RawElements.RawText(
+            text="random text",
+            page_number=1,
+            x=300,
+            y=225,
+        ),
+    ]
+
+    pdf = PdfWrapper(os.path.join(static_pdfs, "sample_template.pdf")).draw(
+        texts, as_xobject=True
+    )
+
+    request.config.results["expected_path"] = expected_path
+    request.config.results["stream"] = pdf.read()
+
+    with open(expected_path, "rb+") as f:
+        expected = f.read()
+
+        assert len(pdf.read()) == len(expected)
+        assert pdf.read() == expected
+
+
+@pytest.mark.requires_zlib_over_zlib_ng
+def test_draw_overlay(static_pdfs, pdf_samples, request):
+    expected_path = os.path.join(pdf_samples, "docs", "test_draw_overlay.pdf")
+
+    overlay = RawElements.RawOverlay(
+        [
+            RawElements.RawText(
+                text="COPY",
+                page_number=1,
+                x=300,
+                y=225,
+                font_size=40,
+                font_color=(1, 0, 0),
+            ),
+        ]
+    )
+
+    pdf = PdfWrapper(os.path.join(static_pdfs, "sample_template.pdf")).draw(overlay)
+
+    request.config.results["expected_path"] = expected_path
+    request.config.results["stream"] = pdf.read()
+
+    with open(expected_path, "rb+") as f:
+        expected = f.read()
+
+        assert len(pdf.read()) == len(expected)
+        assert pdf.read() == expected
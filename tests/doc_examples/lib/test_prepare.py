@@ -295,3 +295,68 @@ def test_create_image(pdf_samples, request):
 
         assert len(new_form.read()) == len(expected)
         assert new_form.read() == expected
+
+
+@pytest.mark.requires_zlib_over_zlib_ng
+def test_create_fields_direct(pdf_samples, request):
+    expected_path = os.path.join(pdf_samples, "docs", "test_create_fields_direct.pdf")
+
+    fields = [
+        Fields.TextField(
+            name=f"new_text_field_{row}_{column}",
+            page_number=1,
+            x=50 + column * 130,
+            y=50 + row * 40,
+            width=120,
+            height=30,
+        )
+        for row in range(15)
+        for column in range(4)
+    ]
+
+    new_form = PdfWrapper(os.path.join(pdf_samples, "dummy.pdf")).bulk_create_fields(
+        fields, direct=True
+    )
+
+    request.config.results["expected_path"] = expected_path
+    request.config.results["stream"] = new_form.read()
+
+    with open(expected_path, "rb+") as f:
+        expected = f.read()
+
+        assert len(new_form.read()) == len(expected)
+        assert new_form.read() == expected
+
+
+@pytest.mark.requires_zlib_over_zlib_ng
+def test_create_field_grid(pdf_samples, request):
+    expected_path = os.path.join(pdf_samples, "docs", "test_create_field_grid.pdf")
+
+    fields = [
+        Fields.FieldGrid(
+            field_type=Fields.CheckBoxField,
+            name="answer_{row}_{column}",
+            page_number=1,
+            x=100,
+            y=700,
+            rows=10,
+            columns=5,
+            column_pitch=40,
+            row_pitch=-30,
+            start=1,
+            attributes={"size": 20},
+        ),
+    ]
+
+    new_form = PdfWrapper(os.path.join(pdf_samples, "dummy.pdf")).bulk_create_fields(
+        fields
+    )
+
+    request.config.results["expected_path"] = expected_path
+    request.config.results["stream"] = new_form.read()
+
+    with open(expected_path, "rb+") as f:
+        expected = f.read()
+
+        assert len(new_form.read()) == len(expected)
+        assert new_form.read() == expected
@@ -472,6 +472,31 @@ def test_change_field_visibility(static_pdfs, pdf_samples, request):
         assert form.read() == expected
 
 
+def test_update_fields(static_pdfs, pdf_samples):
+    expected_path = os.path.join(pdf_samples, "docs", "test_change_text_font_size.pdf")
+
+    form = PdfWrapper(os.path.join(static_pdfs, "sample_template.pdf"))
+    form.update_fields(Widgets.Text, font_size=20)
+    form.widgets["test"].font_size = 30.5
+
+    form.fill(
+        {
+            "test": "test_1",
+            "check": True,
+            "test_2": "test_2",
+            "check_2": False,
+            "test_3": "test_3",
+            "check_3": True,
+        },
+    )
+
+    with open(expected_path, "rb+") as f:
+        expected = f.read()
+
+        assert len(form.read()) == len(expected)
+        assert form.read() == expected
+
+
 def test_remove_fields(static_pdfs, pdf_samples, request):
     expected_path = os.path.join(pdf_samples, "docs", "test_remove_fields.pdf")
 
@@ -210,3 +210,251 @@ def test_bulk_create_fields_does_not_duplicate_widgets():
                 widget_count += 1
 
     assert widget_count == len(fields)
+
+
+def test_bulk_create_fields_mixed_matches_per_type(template_stream, page_annotations):
+    fields = [
+        Fields.TextField("new_text", 1, 100, 600, font_size=8),
+        Fields.CheckBoxField("new_check", 1, 100, 550, size=20, required=True),
+        Fields.RadioGroup("new_radio", 2, [100, 150], [500, 500]),
+        Fields.DropdownField("new_dropdown", 2, 100, 450, options=["foo", "bar"]),
+        Fields.SignatureField("new_signature", 3, 100, 400, width=100, height=30),
+        Fields.ImageField("new_image", 3, 100, 300, width=100, height=50),
+    ]
+
+    obj = PdfWrapper(template_stream).bulk_create_fields(fields)
+
+    expected = PdfWrapper(template_stream)
+    for each in [fields[3:4], fields[4:], fields[1:3], fields[:1]]:
+        expected.bulk_create_fields(each)
+
+    exclude = ("/P", "/AP", "/MK", "/Parent")
+    assert len(obj.read()) == len(expected.read())
+    assert page_annotations(obj.read(), exclude=exclude) == page_annotations(
+        expected.read(), exclude=exclude
+    )
+    assert list(obj.widgets) == list(expected.widgets)
+    assert obj.widgets["new_check"].required
+
+
+def test_bulk_create_fields_direct_matches_reportlab(template_stream, page_annotations):
+    fields = [
+        Fields.TextField("new_text", 1, 100, 600, font_size=8, required=True),
+        Fields.TextField(
+            "new_text_2",
+            2,
+            100,
+            500,
+            width=200,
+            height=40,
+            max_length=10,
+            tooltip="foo",
+            bg_color=(0, 0, 1),
+            border_width=2,
+        ),
+        Fields.TextField("new_text_3", 2, 100, 400, alignment=1, multiline=True),
+    ]
+
+    obj = PdfWrapper(template_stream).bulk_create_fields(fields, direct=True)
+    expected = PdfWrapper(template_stream).bulk_create_fields(fields)
+
+    exclude = ("/P", "/AP", "/MK")
+    assert page_annotations(obj.read(), exclude=exclude) == page_annotations(
+        expected.read(), exclude=exclude
+    )
+    assert obj.schema == expected.schema
+    assert list(obj.widgets) == list(expected.widgets)
+    assert obj.widgets["new_text"].required
+    assert obj.widgets["new_text_3"].alignment == 1
+
+
+def test_bulk_create_fields_direct_mixed_fallback(template_stream):
+    fields = [
+        Fields.TextField(f"new_text_{i}", 1, 100, 100 + i * 30) for i in range(10)
+    ]
+    fields.append(Fields.CheckBoxField("new_check", 1, 300, 100))
+
+    obj = PdfWrapper(template_stream).bulk_create_fields(fields, direct=True)
+
+    for each in fields:
+        assert each.name in obj.widgets
+
+    appearances = set()
+    for annot in PdfReader(BytesIO(obj.read())).pages[0][Annots]:
+        annot = annot.get_object()
+        if annot.get("/FT") == "/Tx" and annot.get("/T", "").startswith("new_text_"):
+            appearances.add(annot["/AP"].raw_get("/N").idnum)
+
+    assert len(appearances) == 1
+
+
+def test_bulk_create_fields_direct_signature_and_image(
+    template_stream, page_annotations
+):
+    fields = [
+        Fields.SignatureField("new_signature", 1, 100, 400, required=True),
+        Fields.ImageField("new_image", 1, 100, 200, tooltip="foo"),
+        Fields.ImageField("new_image_2", 2, 300, 200, width=100, height=50),
+    ]
+
+    obj = PdfWrapper(template_stream).bulk_create_fields(fields, direct=True)
+    expected = PdfWrapper(template_stream).bulk_create_fields(fields)
+
+    exclude = ("/P", "/AP", "/MK")
+    assert page_annotations(obj.read(), exclude=exclude) == page_annotations(
+        expected.read(), exclude=exclude
+    )
+    assert obj.schema == expected.schema
+    assert list(obj.widgets) == list(expected.widgets)
+    assert len(obj.read()) < len(expected.read())
+
+    reader = PdfReader(BytesIO(obj.read()))
+    for page in reader.pages:
+        assert page.indirect_reference is not None
+        for annot in page.get(Annots, []):
+            annot = annot.get_object()
+            if annot["/T"].startswith("new_"):
+                assert annot.raw_get("/P").idnum == page.indirect_reference.idnum
+
+
+def test_bulk_create_fields_direct_with_signature_fields(
+    template_stream, page_annotations
+):
+    fields = [
+        Fields.TextField("new_text", 1, 100, 100),
+        Fields.CheckBoxField("new_check", 1, 300, 100),
+        Fields.SignatureField("new_signature", 1, 100, 400),
+        Fields.ImageField("new_image", 2, 300, 200),
+    ]
+
+    obj = PdfWrapper(template_stream).bulk_create_fields(fields, direct=True)
+    expected = PdfWrapper(template_stream).bulk_create_fields(fields)
+
+    def new_widgets(stream):
+        return [
+            sorted(
+                (each for each in page if each["/T"].startswith("new_")),
+                key=lambda each: each["/T"],
+            )
+            for page in page_annotations(stream, keys=("/T", "/FT", "/Rect"))
+        ]
+
+    assert new_widgets(obj.read()) == new_widgets(expected.read())
+    assert obj.schema == expected.schema
+    assert set(obj.widgets) == set(expected.widgets)
+
+
+def test_bulk_create_fields_grid_matches_fields(template_stream):
+    grid = Fields.FieldGrid(
+        Fields.CheckBoxField,
+        "answer_{row}_{column}",
+        2,
+        100,
+        700,
+        rows=5,
+        columns=4,
+        column_pitch=30,
+        row_pitch=-25,
+        start=1,
+        attributes={"size": 15, "required": True},
+    )
+    fields = [
+        Fields.CheckBoxField(
+            f"answer_{row + 1}_{column + 1}",
+            2,
+            100 + column * 30,
+            700 - row * 25,
+            size=15,
+            required=True,
+        )
+        for row in range(5)
+        for column in range(4)
+    ]
+
+    assert len(grid) == 20
+
+    obj = PdfWrapper(template_stream).bulk_create_fields([grid])
+    expected = PdfWrapper(template_stream).bulk_create_fields(fields)
+
+    assert obj.read() == expected.read()
+    assert obj.widgets["answer_5_4"].required
+
+
+def test_bulk_create_fields_grid_mixed(template_stream):
+    grids = [
+        Fields.FieldGrid(
+            Fields.TextField,
+            "cell_{index}",
+            1,
+            100,
+            600,
+            rows=2,
+            columns=3,
+            column_pitch=130,
+            row_pitch=-40,
+            attributes={"font_size": 8},
+        ),
+        Fields.FieldGrid(
+            Fields.RadioGroup,
+            "question_{row}",
+            1,
+            100,
+            400,
+            rows=3,
+            columns=4,
+            column_pitch=30,
+            row_pitch=-30,
+        ),
+    ]
+    fields = [
+        Fields.TextField(
+            f"cell_{i}", 1, 100 + (i % 3) * 130, 600 - (i // 3) * 40, font_size=8
+        )
+        for i in range(6)
+    ]
+    fields += [
+        Fields.RadioGroup(
+            f"question_{row}", 1, [100, 130, 160, 190], [400 - row * 30] * 4
+        )
+        for row in range(3)
+    ]
+
+    obj = PdfWrapper(template_stream).bulk_create_fields(grids)
+    expected = PdfWrapper(template_stream).bulk_create_fields(fields)
+
+    assert obj.read() == expected.read()
+    assert obj.widgets["question_2"].number_of_options == 4
+    assert list(obj.widgets) == list(expected.widgets)
+
+
+def test_field_grid_unsupported_attribute():
+    with pytest.raises(TypeError):
+        Fields.FieldGrid(
+            Fields.CheckBoxField, "foo_{index}", 1, 0, 0, attributes={"foo": 1}
+        ).build_widgets()
+
+
+def test_bulk_create_fields_with_workers(template_with_radiobutton_stream):
+    fields = (
+        [
+            Fields.TextField(f"text_{page_number}", page_number, 100, 100)
+            for page_number in (1, 2, 3)
+        ]
+        + [
+            Fields.CheckBoxField(f"check_{page_number}", page_number, 200, 100)
+            for page_number in (1, 2)
+        ]
+        + [
+            Fields.SignatureField(f"signature_{page_number}", page_number, 300, 100)
+            for page_number in (1, 3)
+        ]
+    )
+
+    assert (
+        PdfWrapper(template_with_radiobutton_stream)
+        .bulk_create_fields(fields, workers=2)
+        .read()
+        == PdfWrapper(template_with_radiobutton_stream)
+        .bulk_create_fields(fields)
+        .read()
+    )
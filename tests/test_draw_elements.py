@@ -1,10 +1,21 @@
 # -*- coding: utf-8 -*-
 
 import os
+from io import BytesIO
 
 import pytest
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+    NumberObject,
+)
 
-from PyPDFForm import PdfWrapper, RawElements
+from PyPDFForm import BlankPage, PdfWrapper, RawElements
+from PyPDFForm.lib.raw import overlay as overlay_module
+from PyPDFForm.lib.watermark import create_watermarks_and_draw
 
 
 def test_draw_multiline_text_on_one_page(template_stream, pdf_samples, request):
@@ -217,3 +228,274 @@ def test_draw_text_and_image(template_stream, image_samples, pdf_samples, reques
         request.config.results["stream"] = obj.read()
         assert len(obj.read()) == len(expected)
         assert obj.read() == expected
+
+
+def test_draw_text_and_image_as_xobject(
+    template_stream, image_samples, pdf_samples, request
+):
+    expected_path = os.path.join(pdf_samples, "test_draw_text_and_image_as_xobject.pdf")
+    with open(expected_path, "rb+") as f:
+        with open(os.path.join(image_samples, "sample_image.jpg"), "rb+") as _f:
+            obj = PdfWrapper(template_stream).draw(
+                [
+                    RawElements.RawText(
+                        "drawn_text", 1, 300, 225, font_size=20, font_color=(1, 0, 0)
+                    ),
+                    RawElements.RawImage(_f, 2, 100, 100, 400, 225, rotation=180),
+                ],
+                as_xobject=True,
+            )
+
+        expected = f.read()
+
+        request.config.results["expected_path"] = expected_path
+        request.config.results["stream"] = obj.read()
+        assert len(obj.read()) == len(expected)
+        assert obj.read() == expected
+
+
+def test_draw_as_xobject_keeps_page_content(template_stream):
+    obj = PdfWrapper(template_stream).draw(
+        [RawElements.RawText("drawn_text", 1, 300, 225)], as_xobject=True
+    )
+
+    original = PdfReader(BytesIO(template_stream)).pages
+    pages = PdfReader(BytesIO(obj.read())).pages
+
+    original_contents = [each.get_contents() for each in original]
+    assert original_contents[0] is not None
+    assert original_contents[1] is not None
+
+    contents = [each.get_object().get_data() for each in pages[0]["/Contents"]]
+    assert contents[0] == b"q\n"
+    assert b"".join(contents[1:-1]) == original_contents[0].get_data()
+    assert contents[-1] == b"\nQ\nq\n/Fx Do\nQ\n"
+    assert pages[0]["/Resources"]["/XObject"]["/Fx"]["/Subtype"] == "/Form"
+    assert "drawn_text" in pages[0].extract_text()
+
+    second_contents = pages[1].get_contents()
+    assert second_contents is not None
+    assert second_contents.get_data() == original_contents[1].get_data()
+    assert obj.schema == PdfWrapper(template_stream).schema
+
+
+def test_draw_as_xobject_avoids_existing_names():
+    writer = PdfWriter()
+    page = writer.add_blank_page(612, 792)
+    existing = DecodedStreamObject()
+    existing.update(
+        {
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Form"),
+            NameObject("/BBox"): ArrayObject(
+                [NumberObject(0), NumberObject(0), NumberObject(1), NumberObject(1)]
+            ),
+        }
+    )
+    existing_ref = writer._add_object(existing)  # type: ignore # noqa: SLF001
+    page[NameObject("/Resources")] = DictionaryObject(
+        {
+            NameObject("/XObject"): DictionaryObject(
+                {NameObject("/Fx"): existing_ref, NameObject("/Fx2"): existing_ref}
+            )
+        }
+    )
+    with BytesIO() as f:
+        writer.write(f)
+        stream = f.getvalue()
+
+    obj = PdfWrapper(stream).draw(
+        [RawElements.RawText("drawn_text", 1, 300, 225)], as_xobject=True
+    )
+
+    page = PdfReader(BytesIO(obj.read())).pages[0]
+    xobjects = page["/Resources"]["/XObject"]
+    assert set(xobjects) == {"/Fx", "/Fx1", "/Fx2"}
+    assert page["/Contents"][-1].get_object().get_data() == b"\nQ\nq\n/Fx1 Do\nQ\n"
+    assert "drawn_text" in page.extract_text()
+
+
+def test_draw_overlay(template_stream, image_samples, font_samples, monkeypatch):
+    elements = [
+        RawElements.RawText("COPY", 1, 300, 225, font_size=40, font_color=(1, 0, 0)),
+        RawElements.RawText("COPY", 3, 300, 225, font="new_font"),
+        RawElements.RawImage(
+            os.path.join(image_samples, "sample_image.jpg"), 2, 100, 100, 200, 100
+        ),
+    ]
+    overlay = RawElements.RawOverlay(elements)
+
+    def wrapper(font_file):
+        return PdfWrapper(template_stream).register_font(
+            "new_font", os.path.join(font_samples, font_file)
+        )
+
+    assert (
+        wrapper("LiberationSerif-Bold.ttf").draw(overlay).read()
+        == wrapper("LiberationSerif-Bold.ttf").draw(elements).read()
+    )
+
+    calls = []
+    original = overlay_module.create_watermarks_and_draw
+    monkeypatch.setattr(
+        overlay_module,
+        "create_watermarks_and_draw",
+        lambda *args: calls.append(args[1]) or original(*args),
+    )
+
+    for _ in range(3):
+        wrapper("LiberationSerif-Bold.ttf").draw(overlay)
+    assert not calls
+
+    wrapper("LiberationSerif-Italic.ttf").draw(overlay)
+    assert len(calls) == 1
+    assert len(calls[0]) == 3
+
+
+def test_draw_overlay_as_xobject(template_stream):
+    overlay = RawElements.RawOverlay([RawElements.RawText("COPY", 2, 300, 225)])
+
+    assert (
+        PdfWrapper(template_stream).draw(overlay, as_xobject=True).read()
+        == PdfWrapper(template_stream)
+        .draw([RawElements.RawText("COPY", 2, 300, 225)], as_xobject=True)
+        .read()
+    )
+
+
+def test_draw_keeps_annotations(
+    template_with_radiobutton_stream, sample_font_stream, page_annotations
+):
+    obj = PdfWrapper(template_with_radiobutton_stream).register_font(
+        "new_font", sample_font_stream
+    )
+    before = obj.read()
+    obj.draw([RawElements.RawText("foo", 1, 100, 100, font="new_font")])
+    obj.generate_coordinate_grid()
+
+    keys = ("/Subtype", "/T", "/Rect", "/DA")
+
+    def fonts(stream):
+        return list(
+            PdfReader(BytesIO(stream)).trailer["/Root"]["/AcroForm"]["/DR"]["/Font"]
+        )
+
+    assert page_annotations(obj.read(), keys=keys) == page_annotations(
+        before, keys=keys
+    )
+    assert fonts(obj.read()) == fonts(before)
+
+
+def test_draw_with_workers(
+    template_with_radiobutton_stream, image_samples, font_samples
+):
+    with open(os.path.join(font_samples, "LiberationSerif-Bold.ttf"), "rb+") as f:
+        font = f.read()
+    with open(os.path.join(image_samples, "sample_image.jpg"), "rb+") as f:
+        image = f.read()
+
+    elements = [
+        RawElements.RawText("foo", page_number, 100, 100, font="new_font")
+        for page_number in (1, 2, 3)
+    ] + [
+        RawElements.RawImage(image, page_number, 200, 200, 100, 100)
+        for page_number in (1, 3)
+    ]
+
+    def wrapper():
+        return PdfWrapper(template_with_radiobutton_stream).register_font(
+            "new_font", font
+        )
+
+    assert wrapper().draw(elements, workers=2).read() == wrapper().draw(elements).read()
+    assert (
+        wrapper().draw(RawElements.RawOverlay(elements), workers=2).read()
+        == wrapper().draw(elements).read()
+    )
+
+
+def test_draw_texts_batched(template_stream):
+    elements = [
+        RawElements.RawText(f"row {i}", 1, 100, 700 - i * 10) for i in range(50)
+    ] + [RawElements.RawText("red", 1, 300, 300, font_color=(1, 0, 0))]
+
+    watermark = create_watermarks_and_draw(
+        template_stream, [each.to_draw for each in elements]
+    )[0]
+    contents = PdfReader(BytesIO(watermark)).pages[0].get_contents()
+    assert contents is not None
+    content = contents.get_data()
+
+    assert content.count(b" rg ") == 2
+    assert content.count(b" Tj ") == 51
+
+
+def test_draw_texts_keeps_paint_order(template_stream):
+    elements = [
+        RawElements.RawText("black_1", 1, 100, 700),
+        RawElements.RawText("red_1", 1, 100, 700, font_color=(1, 0, 0)),
+        RawElements.RawText("black_2", 1, 100, 700),
+        RawElements.RawText("black_3", 1, 100, 690),
+    ]
+
+    watermark = create_watermarks_and_draw(
+        template_stream, [each.to_draw for each in elements]
+    )[0]
+    contents = PdfReader(BytesIO(watermark)).pages[0].get_contents()
+    assert contents is not None
+    content = contents.get_data()
+
+    order = [content.index(f"({each.text})".encode()) for each in elements]
+    assert order == sorted(order)
+    assert content.count(b" rg ") == 3
+
+
+def test_draw_table_paginates():
+    columns = [
+        RawElements.RawTableColumn(100, "Name"),
+        RawElements.RawTableColumn(50, "Count", alignment=2),
+        RawElements.RawTableColumn(50, alignment=1),
+    ]
+    table = RawElements.RawTable(
+        columns,
+        ([f"name {i}", i, None] for i in range(10)),
+        page_number=2,
+        x=50,
+        y=200,
+        bottom=100,
+        top=180,
+    )
+
+    to_draw = table.to_draw
+    assert [each["page_number"] for each in to_draw] == [2, 3, 4]
+    assert [each["y"] for each in to_draw] == [200, 180, 180]
+    assert [len(each["rows"]) for each in to_draw] == [5, 4, 4]
+    assert to_draw[1]["rows"][0] == ("Name", "Count", "")
+    assert to_draw[1]["rows"][1] == ("name 4", "4", "")
+
+    obj = PdfWrapper(BlankPage() * 3).draw([table])
+    texts = [page.extract_text() for page in PdfReader(BytesIO(obj.read())).pages]
+    assert texts[0] == ""
+    assert "name 0" in texts[1]
+    assert "name 6" in texts[2]
+    assert "name 8" not in texts[2]
+
+
+def test_draw_table_truncates_text():
+    table = RawElements.RawTable(
+        [RawElements.RawTableColumn(40)],
+        [["a very long value"]],
+        page_number=1,
+        x=50,
+        y=200,
+        line_color=None,
+    )
+
+    watermark = create_watermarks_and_draw(BlankPage().read(), [table.to_draw])[0]
+    contents = PdfReader(BytesIO(watermark)).pages[0].get_contents()
+    assert contents is not None
+    content = contents.get_data()
+
+    assert b"(a very) Tj" in content
+    assert b" re" not in content
+    assert b" l " not in content
@@ -1,23 +1,44 @@
 # -*- coding: utf-8 -*-
 
+import mmap
 import os
 from io import BytesIO
+from pathlib import Path
 
 import pytest
 from jsonschema import ValidationError, validate
-from pypdf import PdfReader
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DictionaryObject,
+    NameObject,
+    NumberObject,
+    TextStringObject,
+)
 
 from PyPDFForm import Annotations, BlankPage, Fields, PdfArray, PdfWrapper
+from PyPDFForm.lib import base as base_module
+from PyPDFForm.lib import incremental as incremental_module
+from PyPDFForm.lib import index as index_module
+from PyPDFForm.lib import pages as pages_module
+from PyPDFForm.lib import spill as spill_module
+from PyPDFForm.lib import split as split_module
+from PyPDFForm.lib import types as types_module
+from PyPDFForm.lib import wrapper as wrapper_module
+from PyPDFForm.lib.adapter import fp_or_f_obj_or_stream_to_stream
 from PyPDFForm.lib.constants import (
     DA,
+    DR,
     UNIQUE_SUFFIX_LENGTH,
     AcroForm,
+    Font,
     T,
     V,
 )
 from PyPDFForm.lib.constants import (
     Fields as FieldsConst,
 )
+from PyPDFForm.lib.coordinate import get_coordinate_grid_watermark
 from PyPDFForm.lib.deprecation import deprecation_notice
 from PyPDFForm.lib.middleware.base import Widget
 from PyPDFForm.lib.template import get_widget_key, get_widgets_by_page
@@ -121,6 +142,345 @@ def test_write_io(template_stream):
     assert PdfWrapper(buff.read()).widgets.keys() == obj.widgets.keys()
 
 
+def test_write_streams_same_output(template_stream, tmp_path):
+    class SocketFile:
+        def __init__(self):
+            super().__init__()
+            self.chunks = []
+
+        def write(self, data):
+            self.chunks.append(bytes(data))
+
+    for obj in [
+        PdfWrapper(template_stream).fill({"test": "foo"}),
+        PdfWrapper(template_stream, need_appearances=True).change_version("2.0"),
+        PdfWrapper(BlankPage()),
+    ]:
+        expected = obj.read()
+
+        dest = SocketFile()
+        obj.write(dest)
+        assert b"".join(dest.chunks) == expected
+
+        buff = BytesIO(b"prefix")
+        buff.seek(0, 2)
+        obj.write(buff)
+        assert buff.getvalue() == b"prefix" + expected
+
+        path = tmp_path / "output.pdf"
+        obj.write(path)
+        assert path.read_bytes() == expected
+
+
+def test_spill_dir(template_stream, tmp_path):
+    obj = PdfWrapper(template_stream, spill_dir=tmp_path).fill(
+        {"test": "foo"}, flatten=False
+    )
+    assert len(list(tmp_path.iterdir())) == 1
+    assert (
+        obj.read()
+        == PdfWrapper(template_stream).fill({"test": "foo"}, flatten=False).read()
+    )
+
+    merged = PdfArray([obj, obj, obj]).merge()
+    assert merged.spill_dir == tmp_path
+    assert len(PdfReader(BytesIO(merged.read())).pages) == 9
+
+    del obj, merged
+    assert not list(tmp_path.iterdir())
+
+    obj = PdfWrapper(
+        template_stream, spill_dir=tmp_path, max_memory=len(template_stream)
+    )
+    assert not list(tmp_path.iterdir())
+    assert obj.read() == PdfWrapper(template_stream).read()
+
+
+def test_spill_dir_reads_in_place(template_stream, tmp_path, monkeypatch):
+    cache = index_module.get_widget_annotation_index
+    cache(template_stream, False)
+    cached = cache.cache_info()
+
+    views = []
+    original = spill_module.SpilledStream.read
+    monkeypatch.setattr(
+        spill_module.SpilledStream,
+        "read",
+        lambda self: views.append(original(self)) or views[-1],
+    )
+
+    obj = PdfWrapper(template_stream, spill_dir=tmp_path).fill(
+        {"test": "foo"}, flatten=False
+    )
+    assert obj.schema
+    assert obj.read()
+    assert cache.cache_info().currsize == cached.currsize
+
+    (path,) = tmp_path.iterdir()
+    assert views
+    assert all(isinstance(each.obj, mmap.mmap) for each in views)
+    assert views[-1] == path.read_bytes()
+
+    cache(template_stream, False)
+    assert cache.cache_info().hits == cached.hits + 1
+
+    views.clear()
+    del obj
+    assert not list(tmp_path.iterdir())
+
+
+def test_fill_loads_only_filled_pages(template_stream, monkeypatch):
+    obj = PdfWrapper(template_stream)
+
+    calls = []
+    original = index_module.get_page
+    monkeypatch.setattr(
+        index_module,
+        "get_page",
+        lambda *args: calls.append(args[1]) or original(*args),
+    )
+
+    obj.fill({"test": "foo", "check": True}, flatten=False)
+    assert calls == [0]
+
+    obj.widgets["test_3"].font_size = 20
+    obj.fill({})
+    assert calls == [0, 2, 0]
+
+    monkeypatch.undo()
+    result = obj.read()
+    assert result.count(b"%%EOF") == 1
+
+    fields = PdfReader(BytesIO(result)).get_fields() or {}
+    assert fields["test"].get(V) == "foo"
+    assert fields["check"].get(V) != "/Off"
+
+    expected = PdfWrapper(template_stream).fill(
+        {"test": "foo", "check": True}, flatten=False
+    )
+    expected.widgets["test_3"].font_size = 20
+    assert result == expected.read()
+
+
+def test_metadata_loads_only_info_and_catalog(template_stream, monkeypatch):
+    obj = PdfWrapper(template_stream)
+
+    loaded = []
+    original = incremental_module.UpdateReader.cache_indirect_object
+    monkeypatch.setattr(
+        incremental_module.UpdateReader,
+        "cache_indirect_object",
+        lambda self, *args: loaded.append(args[1]) or original(self, *args),
+    )
+
+    obj.title = "foo"
+    obj.on_open_javascript = 'app.alert("foo");'
+    assert obj.title == "foo"
+    assert obj.on_open_javascript == 'app.alert("foo");'
+
+    root = PdfReader(BytesIO(template_stream)).root_object
+    assert root.raw_get("/Pages").idnum not in loaded
+    assert root.raw_get(AcroForm).idnum not in loaded
+    assert len(set(loaded)) <= 5
+
+    monkeypatch.undo()
+    result = PdfReader(BytesIO(obj.read()))
+    assert result.metadata
+    assert result.metadata.title == "foo"
+    assert result.root_object["/OpenAction"]["/JS"] == 'app.alert("foo");'
+
+
+def test_incremental_update_kept_without_widgets(tmp_path):
+    blank = PdfWrapper(BlankPage()).read()
+    obj = PdfWrapper(blank)
+    obj.title = "foo"
+    fork = obj.fork()
+
+    for each in (obj, fork):
+        result = each.read()
+        assert result.startswith(blank)
+        assert result.count(b"%%EOF") == blank.count(b"%%EOF") + 1
+        metadata = PdfReader(BytesIO(result)).metadata
+        assert metadata is not None
+        assert metadata.title == "foo"
+
+    obj.write(tmp_path / "output.pdf")
+    assert (tmp_path / "output.pdf").read_bytes() == obj.read()
+
+    result = obj.change_version("2.0").read()
+    assert result.startswith(b"%PDF-2.0")
+    assert result.count(b"%%EOF") == blank.count(b"%%EOF") + 1
+
+
+def test_batch_saves_document_edits_once(
+    template_stream, sample_font_stream, monkeypatch
+):
+    obj = PdfWrapper(template_stream)
+
+    saves = []
+    original = base_module.save_update
+    monkeypatch.setattr(
+        base_module,
+        "save_update",
+        lambda *args: saves.append(args) or original(*args),
+    )
+
+    with obj.batch():
+        obj.title = "foo"
+        obj.on_open_javascript = 'app.alert("foo");'
+        obj.change_version("2.0")
+        obj.register_font("foo", sample_font_stream)
+        obj.register_font("bar", sample_font_stream)
+        with obj.batch():
+            obj.title = "bar"
+        assert not saves
+    assert len(saves) == 1
+
+    assert obj.title == "bar"
+    assert obj.on_open_javascript == 'app.alert("foo");'
+    assert obj.version == "2.0"
+    assert obj.fonts[-2:] == ["foo", "bar"]
+    assert obj.read().startswith(b"%PDF-2.0")
+
+    expected = PdfWrapper(template_stream, title="bar")
+    expected.on_open_javascript = 'app.alert("foo");'
+    expected.change_version("2.0")
+    expected.register_font("foo", sample_font_stream)
+    expected.register_font("bar", sample_font_stream)
+    assert len(saves) == 5
+    assert obj.read() == expected.read()
+
+
+def test_fork(template_stream):
+    obj = PdfWrapper(template_stream).fill({"test": "foo"})
+    obj.widgets["test_2"].font_size = 20
+
+    forks = [obj.fork().fill({"test_2": each}) for each in ("bar", "baz")]
+    obj.widgets["test_3"].font_size = 30
+
+    assert obj.data["test_2"] is None
+    assert forks[0].data["test_2"] == "bar"
+    assert forks[1].data["test_2"] == "baz"
+
+    for fork, each in zip(forks, ("bar", "baz"), strict=True):
+        assert not fork.widgets["test_3"].hooks_to_trigger
+
+        expected = PdfWrapper(template_stream).fill({"test": "foo"})
+        expected.widgets["test_2"].font_size = 20
+        assert fork.read() == expected.fill({"test_2": each}).read()
+
+
+def test_fork_document_edits_do_not_change_original(
+    template_stream, sample_font_stream
+):
+    obj = PdfWrapper(template_stream)
+    fonts = obj.fonts
+    title = obj.title
+    stream = obj.read()
+
+    fork = obj.fork()
+    fork.title = "fork title"
+    fork.on_open_javascript = 'app.alert("fork");'
+    fork.register_font("new_font", sample_font_stream)
+    with fork.batch():
+        fork.change_version("2.0")
+
+    assert fork.title == "fork title"
+    assert fork.on_open_javascript == 'app.alert("fork");'
+    assert "new_font" in fork.fonts
+    assert fork.version == "2.0"
+
+    assert obj.title == title
+    assert obj.on_open_javascript is None
+    assert obj.fonts == fonts
+    assert obj.version != "2.0"
+    assert obj.read() == stream
+
+
+def test_fork_copies_only_accessed_widgets(template_stream, monkeypatch):
+    obj = PdfWrapper(template_stream)
+    obj.fork()
+
+    copied = []
+    original = types_module.deepcopy
+    monkeypatch.setattr(
+        types_module,
+        "deepcopy",
+        lambda x: copied.append(x) or original(x),
+    )
+
+    fork = obj.fork()
+    assert not copied
+
+    fork.fill({"test": "foo"})
+    assert len(copied) == 1
+    assert dict(fork.widgets)["test"] is fork.widgets["test"]
+    assert len(copied) == len(fork.widgets)
+
+    assert fork.widgets["test"] is not obj.widgets["test"]
+    assert obj.widgets["test"].value is None
+
+
+def test_batch_applies_edits_on_read(template_stream):
+    obj = PdfWrapper(template_stream)
+
+    with obj.batch():
+        obj.title = "foo"
+        assert obj.title == "foo"
+        obj.title = "bar"
+
+    assert obj.title == "bar"
+
+
+def test_bytes_like_and_path_templates(template_stream, pdf_samples):
+    expected = PdfWrapper(template_stream).read()
+    path = os.path.join(pdf_samples, "sample_template.pdf")
+
+    assert PdfWrapper(Path(path)).read() == expected
+    assert PdfWrapper(bytearray(template_stream)).read() == expected
+    assert PdfWrapper(memoryview(template_stream)).read() == expected
+    assert (
+        fp_or_f_obj_or_stream_to_stream(memoryview(template_stream)) is template_stream
+    )
+
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+    ):
+        buffer.seek(100)
+        assert PdfWrapper(buffer).read() == expected
+
+
+def test_path_and_mmap_templates_spilled_in_place(
+    template_stream, pdf_samples, tmp_path, monkeypatch
+):
+    expected = PdfWrapper(template_stream).read()
+    path = os.path.join(pdf_samples, "sample_template.pdf")
+
+    stored = []
+    original = base_module.spill_stream
+    monkeypatch.setattr(
+        base_module,
+        "spill_stream",
+        lambda *args: stored.append(args[0]) or original(*args),
+    )
+
+    assert PdfWrapper(Path(path), spill_dir=tmp_path).read() == expected
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+    ):
+        assert PdfWrapper(buffer, spill_dir=tmp_path).read() == expected
+        assert all(isinstance(each, memoryview) for each in stored)
+        assert all(isinstance(each.obj, mmap.mmap) for each in stored)
+        assert stored[-1].obj is buffer
+        stored.clear()
+
+    assert PdfWrapper(Path(path)).read() == expected
+    assert isinstance(stored[0], memoryview)
+    stored.clear()
+
+
 def test_fill_flatten_then_unflatten(template_stream, pdf_samples, data_dict, request):
     expected_path = os.path.join(pdf_samples, "test_fill_flatten_then_unflatten.pdf")
     with open(expected_path, "rb+") as f:
@@ -367,6 +727,237 @@ def test_addition_operator_3_times(template_stream, data_dict):
     assert len(result_2.pages) == len(result.pages)
 
 
+def test_pages_lazy(template_stream, monkeypatch):
+    calls = []
+    original = wrapper_module.extract_pages
+    monkeypatch.setattr(
+        wrapper_module,
+        "extract_pages",
+        lambda *args: calls.append(args[1]) or original(*args),
+    )
+
+    pages = PdfWrapper(template_stream).fill({"test": "lazy"}, flatten=False).pages
+    assert len(pages) == 3
+    assert not calls
+
+    assert pages[-1].read() == pages[2].read()
+    assert calls == [(2,), (2,)]
+
+    result = pages[1:]
+    assert calls[-1] == (1, 2)
+    assert len(result.pages) == 2
+    assert list(result.widgets) == ["test_2", "check_2", "test_3", "check_3"]
+
+    assert pages[3:] is None
+    with pytest.raises(IndexError):
+        pages[3]  # noqa: B018
+
+
+def test_pages_list_compatible(template_stream):
+    pages = PdfWrapper(template_stream).pages
+    assert isinstance(pages, list)
+    assert isinstance(pages, PdfArray)
+
+    copied = pages.copy()
+    assert len(copied) == 3
+    assert [list(each.widgets) for each in copied] == [
+        list(each.widgets) for each in pages
+    ]
+    assert len(pages + [PdfWrapper()]) == 4
+    assert len([PdfWrapper()] + pages) == 4
+
+    pages.append(pages[0])
+    assert len(pages) == 4
+    assert pages[-1] is pages[0]
+    assert len(pages[2:].pages) == 2
+
+
+def test_extract_cost_does_not_depend_on_page_count(template_stream, monkeypatch):
+    def with_blank_pages(count):
+        writer = PdfWriter(clone_from=BytesIO(template_stream))
+        for _ in range(count):
+            writer.add_blank_page(612, 792)
+        with BytesIO() as f:
+            writer.write(f)
+            return f.getvalue()
+
+    streams = [with_blank_pages(count) for count in (10, 100)]
+
+    loaded = []
+    original = incremental_module.UpdateReader.cache_indirect_object
+    monkeypatch.setattr(
+        incremental_module.UpdateReader,
+        "cache_indirect_object",
+        lambda self, *args: loaded.append(args[1]) or original(self, *args),
+    )
+    monkeypatch.setattr(
+        PdfReader, "_flatten", lambda *_: pytest.fail("page tree flattened")
+    )
+
+    count = 0
+    result = b""
+    results = []
+    for stream in streams:
+        loaded.clear()
+        count = pages_module.get_page_count(stream)
+        result = pages_module.extract_pages(stream, (1,))
+        results.append((len(loaded), result))
+
+    assert count == 103
+    assert results[0] == results[1]
+
+    monkeypatch.undo()
+    assert list(PdfWrapper(result).widgets) == ["test_2", "check_2"]
+
+
+def test_extract_keeps_only_extracted_kids(sejda_template):
+    writer = PdfWriter()
+    field = DictionaryObject(
+        {
+            NameObject("/FT"): NameObject("/Tx"),
+            NameObject(T): TextStringObject("foo"),
+            NameObject("/Kids"): ArrayObject(),
+        }
+    )
+    field_ref = writer._add_object(field)  # type: ignore # noqa: SLF001
+    for _ in range(3):
+        page = writer.add_blank_page(612, 792)
+        widget = writer._add_object(  # type: ignore # noqa: SLF001
+            DictionaryObject(
+                {
+                    NameObject("/Type"): NameObject("/Annot"),
+                    NameObject("/Subtype"): NameObject("/Widget"),
+                    NameObject("/Rect"): ArrayObject(
+                        [NumberObject(each) for each in (100, 100, 200, 120)]
+                    ),
+                    NameObject("/P"): page.indirect_reference,
+                    NameObject("/Parent"): field_ref,
+                }
+            )
+        )
+        page[NameObject("/Annots")] = ArrayObject([widget])
+        field["/Kids"].append(widget)
+    writer.root_object[NameObject(AcroForm)] = DictionaryObject(
+        {NameObject(FieldsConst): ArrayObject([field_ref])}
+    )
+    with BytesIO() as f:
+        writer.write(f)
+        shared_field = f.getvalue()
+
+    for stream, name in ((sejda_template, "seller_name"), (shared_field, "foo")):
+        result = pages_module.extract_pages(stream, (0,))
+        reader = PdfReader(BytesIO(result))
+
+        objects = [reader.get_object(i) for i in range(1, reader.trailer["/Size"])]
+        assert [
+            each
+            for each in objects
+            if isinstance(each, dict) and each.get("/Type") == "/Page"
+        ] == [reader.pages[0]]
+
+        fields = reader.root_object[AcroForm][FieldsConst]
+        (field,) = [each for each in fields if each[T] == name]
+        assert len(field["/Kids"]) == 1
+        assert field["/Kids"][0] in reader.pages[0]["/Annots"]
+
+    reader = incremental_module.open_reader(shared_field)
+    for each in range(3):
+        writer = pages_module.write_pages(reader, [each])
+        assert len(writer.root_object[AcroForm][FieldsConst][0]["/Kids"]) == 1
+
+
+def test_extract(template_stream):
+    obj = PdfWrapper(template_stream)
+    result = obj.extract(range(2, 4))
+
+    assert result.read() == obj.pages[1:].read()
+    assert list(obj.extract([3, 1]).widgets) == ["test_3", "check_3", "test", "check"]
+
+    acro_form = PdfReader(BytesIO(result.read())).root_object[AcroForm]
+    assert len(acro_form["/Fields"]) == 4
+    assert (
+        acro_form[DA] == PdfReader(BytesIO(template_stream)).root_object[AcroForm][DA]
+    )
+
+    with pytest.raises(IndexError):
+        obj.extract([4])
+
+
+def test_split(template_stream, tmp_path):
+    obj = PdfWrapper(template_stream)
+
+    paths = obj.split(2, tmp_path / "part_{index}_{start}-{end}.pdf")
+    assert paths == [
+        str(tmp_path / "part_1_1-2.pdf"),
+        str(tmp_path / "part_2_3-3.pdf"),
+    ]
+    for path, pages in zip(paths, ([1, 2], [3]), strict=True):
+        expected = obj.extract(pages)
+        assert len(PdfWrapper(path).pages) == len(expected.pages)
+        assert PdfWrapper(path).schema == expected.schema
+        assert list(PdfReader(path).get_fields() or {}) == list(
+            PdfReader(BytesIO(expected.read())).get_fields() or {}
+        )
+
+    paths = obj.split(lambda page: page != 2, tmp_path / "predicate_{index}.pdf")
+    assert [len(PdfWrapper(path).pages) for path in paths] == [2, 1]
+
+    paths = obj.split([range(3, 4), [1, 2]], tmp_path / "ranges_{index}.pdf")
+    assert [list(PdfWrapper(path).widgets) for path in paths] == [
+        ["test_3", "check_3"],
+        ["test", "check", "test_2", "check_2"],
+    ]
+
+    with pytest.raises(ValueError, match="pages per part"):
+        obj.split(0, tmp_path / "invalid_{index}.pdf")
+    with pytest.raises(ValueError, match="at least one page"):
+        obj.split([[]], tmp_path / "invalid_{index}.pdf")
+    with pytest.raises(IndexError):
+        obj.split([[4]], tmp_path / "invalid_{index}.pdf")
+    with pytest.raises(IndexError):
+        obj.split([[1], [4]], tmp_path / "invalid_{index}.pdf")
+    with pytest.raises(ValueError, match="own path"):
+        obj.split(1, tmp_path / "invalid.pdf")
+    with pytest.raises(ValueError, match="own path"):
+        obj.split([[1, 2], [1, 3]], tmp_path / "invalid_{start}.pdf")
+    assert not list(tmp_path.glob("invalid*"))
+
+
+def test_split_opens_source_once(
+    template_stream, sample_font_stream, tmp_path, monkeypatch
+):
+    obj = PdfWrapper(template_stream, need_appearances=True, title="foo")
+    obj.register_font("new_font", sample_font_stream)
+    cached = pages_module.extract_pages.cache_info().currsize
+
+    opened = []
+
+    def counted(original):
+        return lambda *args: opened.append(args) or original(*args)
+
+    for module in (split_module, pages_module):
+        monkeypatch.setattr(module, "open_reader", counted(module.open_reader))
+    monkeypatch.setattr(
+        PdfWrapper, "__init__", lambda *_, **__: pytest.fail("part wrapped")
+    )
+
+    paths = obj.split(1, tmp_path / "part_{index}.pdf")
+    assert len(opened) == 1
+    assert pages_module.extract_pages.cache_info().currsize == cached
+
+    monkeypatch.undo()
+    for index, path in enumerate(paths, start=1):
+        reader = PdfReader(path)
+        expected = PdfReader(BytesIO(obj.extract([index]).read()))
+        assert reader.metadata
+        assert reader.metadata.title == "foo"
+        assert reader.root_object[AcroForm]["/NeedAppearances"]
+        assert list(reader.root_object[AcroForm][DR][Font]) == list(
+            expected.root_object[AcroForm][DR][Font]
+        )
+        assert list(reader.get_fields() or {}) == list(expected.get_fields() or {})
+
+
 def test_merging_unique_suffix(template_stream):
     result = PdfWrapper()
 
@@ -660,6 +1251,27 @@ def test_generate_coordinate_grid_margin_50(template_stream, pdf_samples, reques
         assert obj.read() == expected
 
 
+def test_generate_coordinate_grid_shared(template_stream, sejda_template):
+    get_coordinate_grid_watermark.cache_clear()
+
+    obj = PdfWrapper(template_stream).generate_coordinate_grid((0, 1, 0), margin=60)
+    PdfWrapper(template_stream).generate_coordinate_grid((0, 1, 0), margin=60)
+
+    assert get_coordinate_grid_watermark.cache_info().misses == 1
+    xobjects = [
+        page["/Resources"]["/XObject"].raw_get("/Fx")
+        for page in PdfReader(BytesIO(obj.read())).pages
+    ]
+    assert len(xobjects) > 1
+    assert len({each.idnum for each in xobjects}) == 1
+
+    PdfWrapper(sejda_template).generate_coordinate_grid((0, 1, 0), margin=60)
+    assert get_coordinate_grid_watermark.cache_info().misses == 1
+
+    PdfWrapper(sejda_template).generate_coordinate_grid((0, 1, 0), margin=70)
+    assert get_coordinate_grid_watermark.cache_info().misses == 2
+
+
 def test_update_radio_key(template_with_radiobutton_stream, pdf_samples, request):
     expected_path = os.path.join(pdf_samples, "test_update_radio_key.pdf")
     with open(expected_path, "rb+") as f:
@@ -134,3 +134,22 @@ def test_fill_vertical_image_not_preserve_aspect_ratio(
 
         assert len(obj.read()) == len(expected)
         assert obj.read() == expected
+
+
+def test_fill_image_keeps_other_annotations(
+    sample_template_with_image_field, image_samples, page_annotations
+):
+    obj = PdfWrapper(sample_template_with_image_field).fill(
+        {
+            "image_1": os.path.join(image_samples, "sample_image.jpg"),
+            "test": "foo",
+        }
+    )
+
+    keys = ("/Subtype", "/T")
+    expected = [
+        [each for each in page if each.get("/T") != "image_1"]
+        for page in page_annotations(sample_template_with_image_field, keys=keys)
+    ]
+    assert page_annotations(obj.read(), keys=keys) == expected
+    assert "/Link" in [each["/Subtype"] for each in expected[0]]
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+from PyPDFForm import PdfWrapper, Widgets
+
+
+def test_update_fields_by_type(sejda_template):
+    obj = PdfWrapper(sejda_template).update_fields(
+        Widgets.Text, font_size=8, font_color=(1, 0, 0), readonly=True, required=True
+    )
+
+    expected = PdfWrapper(sejda_template)
+    for widget in expected.widgets.values():
+        if isinstance(widget, Widgets.Text):
+            widget.font_size = 8
+            widget.font_color = (1, 0, 0)
+            widget.readonly = True
+            widget.required = True
+
+    assert obj.read() == expected.read()
+    for widget in obj.widgets.values():
+        if isinstance(widget, Widgets.Text):
+            assert widget.font_size == 8
+            assert widget.font_color == (1, 0, 0)
+            assert widget.readonly
+            assert widget.required
+            assert not widget.hooks_to_trigger
+
+
+def test_update_fields_by_key(template_stream):
+    obj = PdfWrapper(template_stream).update_fields(
+        lambda key: key.endswith("_2"), hidden=True, size=30
+    )
+
+    expected = PdfWrapper(template_stream)
+    expected.widgets["test_2"].hidden = True
+    expected.widgets["check_2"].hidden = True
+    expected.widgets["check_2"].size = 30
+
+    assert obj.read() == expected.read()
+    assert obj.widgets["check_2"].width == obj.widgets["check_2"].height == 30
+    assert not obj.widgets["test"].hidden
+
+
+def test_update_fields_by_page(template_with_radiobutton_stream):
+    obj = PdfWrapper(template_with_radiobutton_stream).update_fields(
+        3, readonly=True, alignment=1
+    )
+
+    expected = PdfWrapper(template_with_radiobutton_stream)
+    for widget in expected.widgets.values():
+        if widget.page_number == 3:
+            widget.readonly = True
+            if isinstance(widget, Widgets.Text):
+                widget.alignment = 1
+
+    assert obj.read() == expected.read()
+    assert obj.widgets["radio_3"].readonly
+    assert not obj.widgets["radio_1"].readonly
+
+
+def test_update_fields_font(sejda_template, sample_font_stream):
+    obj = PdfWrapper(sejda_template).register_font("new_font", sample_font_stream)
+    obj.widgets["buyer_name"].font_size = 20
+    obj.update_fields(Widgets.Text, font="new_font")
+
+    expected = PdfWrapper(sejda_template).register_font("new_font", sample_font_stream)
+    for widget in expected.widgets.values():
+        if isinstance(widget, Widgets.Text):
+            widget.font = "new_font"
+    expected.widgets["buyer_name"].font_size = 20
+
+    assert obj.read() == expected.read()
+    assert obj.widgets["buyer_name"].font_size == 20
+
+
+def test_update_fields_no_match(template_stream):
+    obj = PdfWrapper(template_stream).update_fields(Widgets.Dropdown, font_size=20)
+
+    assert obj.read() == PdfWrapper(template_stream).read()
+
+
+def test_update_fields_skipped_values(template_stream):
+    obj = PdfWrapper(template_stream)
+    fonts = {
+        key: widget.font
+        for key, widget in obj.widgets.items()
+        if isinstance(widget, Widgets.Text)
+    }
+    obj.widgets["test"].multiline = True
+    obj.update_fields(Widgets.Text, font="not_registered", font_size=9, multiline=False)
+
+    expected = PdfWrapper(template_stream)
+    expected.widgets["test"].multiline = True
+    for widget in expected.widgets.values():
+        if isinstance(widget, Widgets.Text):
+            widget.font_size = 9
+
+    assert obj.read() == expected.read()
+    for key, widget in obj.widgets.items():
+        if isinstance(widget, Widgets.Text):
+            assert widget.font == fonts[key]
+            assert widget.font_size == 9
+    assert obj.widgets["test"].multiline
@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 
+from io import BytesIO
+
 import pytest
+from pypdf import PdfReader
 
 from PyPDFForm import PdfWrapper
+from PyPDFForm.lib.constants import Annots
+from PyPDFForm.lib.patterns import get_widget_key
 
 
 def test_init(sample_template_with_full_key):
@@ -53,3 +58,18 @@ def test_remove_fields(sample_template_with_full_key):
 
     assert "Gain de 2 classes.0" not in obj.widgets
     assert "0" not in obj.widgets
+
+
+def test_get_widget_key_name_cache(sample_template_with_full_key):
+    reader = PdfReader(BytesIO(sample_template_with_full_key))
+    name_cache = {}
+
+    for page in reader.pages:
+        for annot in page.get(Annots, []):
+            annot = annot.get_object()
+            assert get_widget_key(annot, True, name_cache) == get_widget_key(
+                annot, True
+            )
+
+    assert name_cache
+    assert "Gain de 2 classes" in name_cache.values()
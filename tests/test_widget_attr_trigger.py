@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 
 import os
+from io import BytesIO
 
 import pytest
+from pypdf import PdfReader
 
-from PyPDFForm import Fields, PdfWrapper, RawElements
+from PyPDFForm import BlankPage, Fields, PdfWrapper, RawElements
+from PyPDFForm.lib.constants import REQUIRED, Annots, Ff
 
 
 @pytest.mark.requires_zlib_over_zlib_ng
@@ -293,3 +296,63 @@ def test_set_text_field_required_sejda(pdf_samples, sejda_template, request):
 
         assert len(obj.read()) == len(expected)
         assert obj.read() == expected
+
+
+def test_widget_hooks_coalesced(template_stream):
+    obj = PdfWrapper(template_stream)
+    for font_size in range(5, 10):
+        obj.widgets["test"].font_size = font_size
+    obj.widgets["test"].alignment = 1
+    obj.widgets["test"].font_size = 20
+
+    assert obj.widgets["test"].hooks_to_trigger == [
+        ("update_text_field_font_size", 20),
+        ("update_text_field_alignment", 1),
+    ]
+
+    expected = PdfWrapper(template_stream)
+    expected.widgets["test"].font_size = 20
+    expected.widgets["test"].alignment = 1
+
+    assert obj.read() == expected.read()
+
+
+def test_widget_hooks_no_op_skips_rewrite(template_stream):
+    obj = PdfWrapper(template_stream)
+    obj.widgets["test"].readonly = False
+    obj.widgets["test"].x = obj.widgets["test"].x
+    obj.widgets["check"].hidden = True
+    obj.widgets["check"].hidden = False
+
+    assert not obj.widgets["test"].hooks_to_trigger
+    assert not obj.widgets["check"].hooks_to_trigger
+    assert obj.read() == PdfWrapper(template_stream).read()
+
+
+def test_widget_hooks_no_op_after_flatten(template_stream):
+    obj = PdfWrapper(template_stream).fill({}, flatten=True)
+    obj.widgets["test"].readonly = True
+
+    assert not obj.widgets["test"].hooks_to_trigger
+
+    obj.widgets["test"].readonly = False
+    assert obj.widgets["test"].hooks_to_trigger
+
+
+def test_widget_hooks_no_op_needs_every_annotation():
+    obj = PdfWrapper(BlankPage()).bulk_create_fields(
+        [
+            Fields.TextField("foo", 1, 100, 100, required=True),
+            Fields.TextField("foo", 1, 100, 300, required=False),
+        ]
+    )
+    obj.widgets["foo"].required = False
+
+    assert obj.widgets["foo"].hooks_to_trigger == [("update_field_required", False)]
+    assert [
+        annot.get_object()[Ff] & REQUIRED
+        for annot in PdfReader(BytesIO(obj.read())).pages[0][Annots]
+    ] == [0, 0]
+
+    obj.widgets["foo"].required = False
+    assert not obj.widgets["foo"].hooks_to_trigger
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+from io import BytesIO
+
+from pypdf import PdfReader
+
+from PyPDFForm import PdfWrapper
+from PyPDFForm.lib.index import (
+    get_widget_annotation_index,
+    get_widget_locations,
+    iter_widget_annotations,
+)
+from PyPDFForm.lib.patterns import get_widget_key
+from PyPDFForm.lib.watermark import copy_watermark_widgets
+
+
+def test_widget_annotation_index(template_stream):
+    index = get_widget_annotation_index(template_stream, False)
+
+    assert index == {
+        "test": ((0, 0),),
+        "check": ((0, 1),),
+        "test_2": ((1, 0),),
+        "check_2": ((1, 1),),
+        "test_3": ((2, 0),),
+        "check_3": ((2, 1),),
+    }
+    assert get_widget_annotation_index(b"", False) == {}
+
+
+def test_widget_annotation_index_radio(template_with_radiobutton_stream):
+    index = get_widget_annotation_index(template_with_radiobutton_stream, False)
+
+    assert index["radio_1"] == ((0, 2), (0, 3))
+    assert index["radio_3"] == ((2, 2), (2, 3), (2, 4))
+
+
+def test_widget_annotation_index_full_name(sample_template_with_full_key):
+    index = get_widget_annotation_index(sample_template_with_full_key, True)
+
+    for key in PdfWrapper(
+        sample_template_with_full_key, use_full_widget_name=True
+    ).widgets:
+        assert key in index
+
+
+def test_widget_locations(template_with_radiobutton_stream):
+    locations = get_widget_locations(
+        template_with_radiobutton_stream, ["radio_3", "check", "test_3", "foo"], False
+    )
+
+    assert locations == {
+        0: [(1, "check")],
+        2: [(0, "test_3"), (2, "radio_3"), (3, "radio_3"), (4, "radio_3")],
+    }
+
+    reader = PdfReader(BytesIO(template_with_radiobutton_stream))
+    for _, annot, key in iter_widget_annotations(reader, locations):
+        assert get_widget_key(annot.get_object(), False) == key
+
+
+def test_copy_watermark_widgets_without_index(template_stream):
+    watermark = PdfWrapper(template_stream).fill({"test_2": "foo"}).read()
+    cached = get_widget_annotation_index.cache_info()
+
+    result = copy_watermark_widgets(template_stream, watermark, ["test_2"], None)
+
+    assert get_widget_annotation_index.cache_info().misses == cached.misses
+    keys = [
+        get_widget_key(annot.get_object(), False)
+        for annot in PdfReader(BytesIO(result)).pages[1]["/Annots"]
+    ]
+    assert keys == ["test_2", "check_2", "test_2"]